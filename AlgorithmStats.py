@@ -0,0 +1,130 @@
+import time
+from typing import Any, Dict, List
+
+
+class AlgorithmStats:
+    """
+    The AlgorithmStats class records where the time of an algorithm run goes: the wall time and number
+    of runs of each named phase, counters of operations, and series of values such as the time of
+    each augmentation round. Phases may be nested, and the time of a phase includes that of the
+    phases run inside it.
+
+    The algorithms always report to a stats object. By default it is NULL_STATS, which records nothing,
+    so an uninstrumented run only pays for a few calls that return at once. Hot loops report their
+    totals once they are done rather than once per step.
+    """
+
+    active = True
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}  # The [total seconds, runs] of each phase
+        self.counters: Dict[str, int] = {}
+        self.series: Dict[str, List[float]] = {}
+
+    def phase(self, name: str) -> '_Phase':
+        """
+        Returns a context manager that adds the wall time of its block to a phase.
+
+        :param name: The name of the phase.
+        """
+        return _Phase(self, name)
+
+    def count(self, name: str, amount: int = 1):
+        """
+        Adds to a counter.
+
+        :param name: The name of the counter.
+        :param amount: The amount to add.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name: str, value: float):
+        """
+        Appends a value to a series.
+
+        :param name: The name of the series.
+        :param value: The value to append.
+        """
+        self.series.setdefault(name, []).append(value)
+
+    def reset(self):
+        """
+        Forgets everything recorded so far.
+        """
+        self.phases.clear()
+        self.counters.clear()
+        self.series.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns everything recorded, as plain dicts and lists.
+        """
+        return {
+            'phases': {name: {'seconds': seconds, 'runs': runs} for name, (seconds, runs) in self.phases.items()},
+            'counters': dict(self.counters),
+            'series': {name: list(values) for name, values in self.series.items()},
+        }
+
+    def to_json(self, indent: int | None = None) -> str:
+        """
+        Returns everything recorded as a JSON document, see as_dict.
+        """
+        import json  # Only needed when exporting
+
+        return json.dumps(self.as_dict(), indent=indent)
+
+
+class _Phase:
+    """
+    Times one run of a phase of an AlgorithmStats.
+    """
+
+    __slots__ = ('stats', 'name', 'start')
+
+    def __init__(self, stats: AlgorithmStats, name: str):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        total = self.stats.phases.setdefault(self.name, [0.0, 0])
+        total[0] += time.perf_counter() - self.start
+        total[1] += 1
+
+
+class _NullPhase:
+    """
+    A phase that is not timed.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class NullStats(AlgorithmStats):
+    """
+    Stats that record nothing, for runs that are not instrumented.
+    """
+
+    active = False
+
+    def phase(self, name: str) -> _NullPhase:
+        return _NULL_PHASE
+
+    def count(self, name: str, amount: int = 1):
+        pass
+
+    def record(self, name: str, value: float):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+NULL_STATS = NullStats()
@@ -0,0 +1,122 @@
+"""
+Recorded runs of the algorithms, to be replayed later at any speed.
+
+A run is recorded by giving the graph a TraceRecorder as its render sink. The algorithm then runs at full
+speed, and every call to the sink becomes an event, in the tuple form of RecordingRenderSink:
+
+* ('color_edge', edge_id, color), ('color_node', node_id, color), ('color_node_outline', node_id, color);
+* ('direct_edge', edge_id, source_id, dest_id): the edge now goes from source_id to dest_id;
+* ('print_message', message);
+* ('pause', delay): the end of a step, after which the algorithm waited delay seconds.
+
+A Trace splits the events into steps at the pauses. It can hold a description of the graph the run was
+recorded on, so a saved trace can be replayed in another session on a redrawn copy of the graph.
+"""
+import json
+from typing import IO, Any, Dict, List, Sequence, Tuple
+
+from GraphIO import _open
+from RenderSink import RecordingRenderSink
+
+TRACE_VERSION = 1
+
+
+class TraceRecorder(RecordingRenderSink):
+    """
+    A sink that records a run as events, without drawing or waiting.
+    """
+
+    def pause(self, delay: float):
+        self.events.append(('pause', delay))
+
+
+class Trace:
+    """
+    The Trace class holds the events of a recorded run, split into steps.
+    Step k is events[starts[k]:starts[k + 1]] and ends with its pause, if it has one.
+    """
+
+    def __init__(self, events: Sequence[Sequence[Any]], graph: Dict[str, Any] | None = None, title: str = ''):
+        """
+        :param events: The recorded events.
+        :param graph: The graph the run was recorded on, as {'nodes': [[id, x, y], ...],
+                      'edges': [[id, source, dest], ...]}, where each edge is listed from the node
+                      its line is drawn from.
+        :param title: The name of the algorithm.
+        """
+        self.events: List[Tuple[Any, ...]] = [tuple(event) for event in events]
+        self.graph = graph
+        self.title = title
+        self.starts = [0]
+        for i, event in enumerate(self.events):
+            if event[0] == 'pause' and i + 1 < len(self.events):
+                self.starts.append(i + 1)
+        self.starts.append(len(self.events))
+
+    @property
+    def step_count(self) -> int:
+        return len(self.starts) - 1
+
+    def step(self, k: int) -> List[Tuple[Any, ...]]:
+        """
+        Returns the events of step k.
+        """
+        return self.events[self.starts[k]:self.starts[k + 1]]
+
+    def delay(self, k: int) -> float:
+        """
+        Returns the time the algorithm waited after step k, 0 if it did not pause.
+        """
+        last = self.events[self.starts[k + 1] - 1] if self.starts[k + 1] > self.starts[k] else None
+        return last[1] if last is not None and last[0] == 'pause' else 0.0
+
+    def remap(self, node_ids: Dict[int, int], edge_ids: Dict[int, int]) -> 'Trace':
+        """
+        Returns the trace with new node and edge ids, for a copy of its graph drawn with other ids.
+
+        :param node_ids: The new id of each node id.
+        :param edge_ids: The new id of each edge id.
+        """
+        def item(event_id: int) -> int:
+            return node_ids[event_id] if event_id in node_ids else edge_ids.get(event_id, event_id)
+
+        events = []
+        for event in self.events:
+            kind = event[0]
+            if kind == 'direct_edge':
+                event = (kind, edge_ids[event[1]], node_ids[event[2]], node_ids[event[3]])
+            elif kind in ('color_edge', 'color_node', 'color_node_outline', 'delete_item'):
+                event = (kind, item(event[1])) + event[2:]
+            events.append(event)
+        graph = None
+        if self.graph is not None:
+            graph = {
+                'nodes': [[node_ids[i], x, y] for i, x, y in self.graph['nodes']],
+                'edges': [[edge_ids[i], node_ids[source], node_ids[dest]] for i, source, dest in self.graph['edges']],
+            }
+        return Trace(events, graph, self.title)
+
+    def save(self, target: str | IO):
+        """
+        Writes the trace as JSON, one event per line.
+
+        :param target: The path of the file, or an open file.
+        """
+        with _open(target, 'w') as file:
+            file.write('{"version": %d, "title": %s, "graph": %s, "events": [\n'
+                       % (TRACE_VERSION, json.dumps(self.title), json.dumps(self.graph)))
+            file.write(',\n'.join(json.dumps(event) for event in self.events))
+            file.write('\n]}\n')
+
+    @classmethod
+    def load(cls, source: str | IO) -> 'Trace':
+        """
+        Reads a trace written by save.
+
+        :param source: The path of the file, or an open file.
+        """
+        with _open(source, 'r') as file:
+            data = json.load(file)
+        if data.get('version') != TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version: {data.get('version')}")
+        return cls(data['events'], data.get('graph'), data.get('title', ''))
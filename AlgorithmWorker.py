@@ -0,0 +1,225 @@
+"""
+Runs the algorithms of GAlgorithm in a worker process, so a long run neither blocks the window nor
+competes with it for the interpreter.
+
+The worker gets a copy of the graph as plain lists (see graph_data), rebuilds it, and runs the algorithm
+on it at full speed. What the algorithm shows is recorded as in AlgorithmTrace, and sent back through a
+queue in batches, which the window drains with after(). When the run ends, the worker sends the colors,
+groups and edge directions of its copy and the matching it found, and apply_result gives them to the
+window's graph. Edits made to the window's graph during the run do not reach the worker.
+
+Cancelling is cooperative first: it sets an event that the worker checks at the end of each visualization
+step, where the run stops by raising RunCancelled. The engines run their long phases (the bipartition,
+the matching search, the Brooks classification) without steps, so a worker still busy in one of them
+CANCEL_TIMEOUT seconds later is terminated instead.
+"""
+import multiprocessing
+import queue
+import time
+from typing import Any, Dict, List, Tuple
+
+from AlgorithmTrace import TraceRecorder
+from Graph import Graph
+from GraphAlgorithms import GAlgorithm
+
+ALGORITHMS = ('hungarian', 'brooks')
+BATCH_INTERVAL = 0.05  # The longest time (in seconds) recorded events wait in the worker before being sent
+CANCEL_TIMEOUT = 0.5  # The time (in seconds) a cancelled worker has to stop by itself before it is terminated
+
+
+class RunCancelled(Exception):
+    """
+    Raised in the worker at the end of a step once its run has been cancelled.
+    """
+
+
+class QueueRecorder(TraceRecorder):
+    """
+    A recorder that sends its events through a queue at the end of the steps, in batches, and stops the
+    run once it is cancelled.
+    """
+
+    def __init__(self, out, cancel):
+        """
+        :param out: The queue the batches of events are put on, as ('events', [event, ...]).
+        :param cancel: The event that is set to cancel the run.
+        """
+        super().__init__()
+        self.out = out
+        self.cancel = cancel
+        self.sent = time.perf_counter()
+
+    def pause(self, delay: float):
+        super().pause(delay)
+        if self.cancel.is_set():
+            raise RunCancelled()
+        if time.perf_counter() - self.sent >= BATCH_INTERVAL:
+            self.send()
+
+    def send(self):
+        """
+        Sends the events recorded since the last batch.
+        """
+        if self.events:
+            self.out.put(('events', self.events))
+            self.events = []
+        self.sent = time.perf_counter()
+
+
+def graph_data(graph: Graph) -> Dict[str, List[List[Any]]]:
+    """
+    Copies a graph as plain lists, to be sent to a worker:
+    {'nodes': [[id, x, y, radius, color, group], ...], 'edges': [[id, source, dest, weight], ...]}.
+    """
+    return {
+        'nodes': [[node.circle_id, node.x, node.y, node.radius, node.color, node.group] for node in graph.node_list],
+        'edges': [[edge.id, edge.source.circle_id, edge.dest.circle_id, edge.weight] for edge in graph.edge_list],
+    }
+
+
+def graph_from_data(data: Dict[str, List[List[Any]]], sink=None) -> Graph:
+    """
+    Rebuilds a graph copied by graph_data, with the same ids and in the same order.
+
+    :param data: The copy of the graph.
+    :param sink: The render sink of the new graph.
+    """
+    graph = Graph(sink=sink)
+    for circle_id, x, y, radius, color, group in data['nodes']:
+        graph.add_node(circle_id, x, y, radius / 20)
+        node = graph.find_node_by_id(circle_id)
+        node.color, node.group = color, group
+    for edge_id, source, dest, weight in data['edges']:
+        graph.add_edge(source, dest, edge_id, weight)
+    return graph
+
+
+def result_data(graph: Graph, algos: GAlgorithm) -> Dict[str, List[Any]]:
+    """
+    Copies what a run changed in a graph as plain lists, to be sent back from a worker:
+    {'nodes': [[id, color, group], ...], 'edges': [[id, source, dest], ...], 'matching': [edge id, ...]}.
+    """
+    return {
+        'nodes': [[node.circle_id, node.color, node.group] for node in graph.node_list],
+        'edges': [[edge.id, edge.source.circle_id, edge.dest.circle_id] for edge in graph.edge_list],
+        'matching': [edge.id for edge in algos.matching],
+    }
+
+
+def apply_result(graph: Graph, algos: GAlgorithm, result: Dict[str, List[Any]]):
+    """
+    Gives a graph the colors, groups and edge directions a worker found for its copy, and the matching to
+    the algorithms. Nodes and edges deleted since the copy was taken are skipped.
+    """
+    for circle_id, color, group in result['nodes']:
+        node = graph.find_node_by_id(circle_id)
+        if node is not None:
+            node.color, node.group = color, group
+    edges = {}
+    for edge_id, source, dest in result['edges']:
+        edge = graph.find_edge(source, dest)
+        if edge is not None and edge.id == edge_id:
+            if edge.source.circle_id != source:
+                edge.swap()
+            edges[edge_id] = edge
+    algos.matching = {edges[edge_id] for edge_id in result['matching'] if edge_id in edges}
+
+
+def _work(algorithm: str, data: Dict[str, List[List[Any]]], delay: float, out, cancel):
+    """
+    Runs an algorithm in the worker process. The last message put on the queue is ('done', result_data),
+    ('cancelled', None) or ('failed', message).
+    """
+    sink = QueueRecorder(out, cancel)
+    graph = graph_from_data(data, sink)
+    algos = GAlgorithm(graph)
+    try:
+        if algorithm == 'hungarian':
+            if not algos.hungarian_algorithm(delay):
+                # Not bipartite: match it with the blossom algorithm instead
+                algos.blossom_matching(delay)
+        else:
+            algos.brooks_algorithm(graph, delay)
+    except RunCancelled:
+        sink.send()
+        out.put(('cancelled', None))
+    except Exception as error:
+        sink.send()
+        out.put(('failed', f"{type(error).__name__}: {error}"))
+    else:
+        sink.send()
+        out.put(('done', result_data(graph, algos)))
+
+
+class AlgorithmRun:
+    """
+    The AlgorithmRun class starts an algorithm in a worker process and collects what it sends back.
+    It does not block: the caller polls it, typically from an after() callback, until it has ended.
+    """
+
+    def __init__(self, algorithm: str, graph: Graph, delay: float = 0.0):
+        """
+        :param algorithm: One of ALGORITHMS. The hungarian algorithm falls back to the blossom algorithm on
+                          a graph that is not bipartite.
+        :param graph: The graph to run on. It is copied, so it may change during the run.
+        :param delay: The delay (in seconds) recorded after each step.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        context = multiprocessing.get_context()
+        self._queue = context.Queue()
+        self._cancel = context.Event()
+        self.process = context.Process(target=_work, args=(algorithm, graph_data(graph), delay, self._queue,
+                                                           self._cancel), daemon=True)
+        self.process.start()
+        self.outcome: str | None = None  # 'done', 'cancelled' or 'failed' once the run has ended
+        self.result: Any = None  # The result_data of a run that is done, or the message of one that failed
+        self.events: List[Tuple[Any, ...]] = []  # The events received so far, in the tuple form of TraceRecorder
+        self.steps = 0  # The number of steps received so far
+        self._cancelled_at: float | None = None  # When cancel was called
+
+    @property
+    def ended(self) -> bool:
+        return self.outcome is not None
+
+    def cancel(self):
+        """
+        Asks the worker to stop at the end of its current step. The run has ended once poll sees it stop,
+        or terminates it after CANCEL_TIMEOUT.
+        """
+        if self._cancelled_at is None:
+            self._cancel.set()
+            self._cancelled_at = time.perf_counter()
+
+    def poll(self, budget: float = 0.01) -> List[Tuple[Any, ...]]:
+        """
+        Takes what the worker sent since the last poll, without waiting for more.
+
+        :param budget: The time (in seconds) after which the remaining messages are left for the next poll.
+        :return: The events received, which are also added to events.
+        """
+        events = []
+        end = time.perf_counter() + budget
+        while self.outcome is None and time.perf_counter() < end:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                if self.process.is_alive() or not self._queue.empty():
+                    break
+                # The worker stopped without reporting, e.g. killed: anything it sent has been read by now
+                self.outcome, self.result = 'failed', f"The worker stopped with exit code {self.process.exitcode}."
+                break
+            if kind == 'events':
+                events.extend(value)
+                self.steps += sum(1 for event in value if event[0] == 'pause')
+            else:
+                self.outcome, self.result = kind, value
+        if (self.outcome is None and self._cancelled_at is not None
+                and time.perf_counter() - self._cancelled_at >= CANCEL_TIMEOUT):
+            # Busy in a phase without steps: what it would still send is not needed, so the queue may break
+            self.process.terminate()
+            self.outcome = 'cancelled'
+        if self.outcome is not None:
+            self.process.join()
+        self.events.extend(events)
+        return events
@@ -0,0 +1,99 @@
+"""
+Minimum-cost assignment with the Kuhn-Munkres (Hungarian) algorithm.
+
+The solver keeps a potential for every row and column and, for the row being inserted, the slack
+(minimum reduced cost) of every column together with the column it was reached from. Each step
+updates the slack of all columns at once with NumPy, so a dense n x m problem takes O(n^2 * m)
+operations in O(n^2) vectorised steps.
+"""
+import numpy as np
+from typing import List, Sequence, Tuple
+
+
+def kuhn_munkres(cost: Sequence[Sequence[float]] | np.ndarray) -> Tuple[List[int], float]:
+    """
+    Solves the assignment problem for a rectangular cost matrix. Infinite entries are forbidden pairs.
+    Rows are assigned to distinct columns so that the number of assigned rows is as large as possible
+    and, among those assignments, the total cost is minimal.
+
+    :param cost: The cost of assigning each row to each column.
+    :return: The column assigned to each row (-1 if the row is unassigned), and the total cost.
+    """
+    original = np.array(cost, dtype=float, ndmin=2)
+    if original.size == 0:
+        return [-1] * len(cost), 0.0
+    matrix = original
+    transposed = matrix.shape[0] > matrix.shape[1]
+    if transposed:  # The solver inserts one row at a time, so it needs at least as many columns as rows
+        matrix = matrix.T
+
+    # Forbidden pairs get a cost so large that using one less of them is always cheaper
+    allowed = np.isfinite(matrix)
+    finite = matrix[allowed]
+    low, high = (finite.min(), finite.max()) if finite.size else (0.0, 0.0)
+    forbidden = (matrix.shape[0] + 1) * (high - low + abs(high) + abs(low) + 1)
+    matrix = np.where(allowed, matrix, forbidden)
+
+    row_of = _solve(matrix)
+
+    assignment = [-1] * matrix.shape[0]
+    for col, row in enumerate(row_of):
+        if row != -1 and allowed[row, col]:
+            assignment[row] = col
+    if transposed:
+        by_row = [-1] * matrix.shape[1]
+        for col, row in enumerate(assignment):
+            if row != -1:
+                by_row[row] = col
+        assignment = by_row
+    total = float(sum(original[row, col] for row, col in enumerate(assignment) if col != -1))
+    return assignment, total
+
+
+def _solve(matrix: np.ndarray) -> List[int]:
+    """
+    Runs the O(n^2 * m) Kuhn-Munkres algorithm on a finite n x m matrix with n <= m.
+
+    :return: The row assigned to each column, or -1.
+    """
+    n, m = matrix.shape
+    # Column 0 is a virtual column holding the row being inserted; rows are numbered from 1
+    row_potential = np.zeros(n + 1)
+    col_potential = np.zeros(m + 1)
+    row_of = np.zeros(m + 1, dtype=np.int64)  # The row assigned to each column, 0 if none
+    way = np.zeros(m + 1, dtype=np.int64)  # The previous column on the alternating path to each column
+
+    for row in range(1, n + 1):
+        row_of[0] = row
+        col = 0
+        slack = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[col] = True
+            current_row = row_of[col]
+            reduced = matrix[current_row - 1] - row_potential[current_row] - col_potential[1:]
+            free = ~used[1:]
+            improved = free & (reduced < slack[1:])
+            slack[1:][improved] = reduced[improved]
+            way[1:][improved] = col
+
+            candidates = np.where(free, slack[1:], np.inf)
+            next_col = int(np.argmin(candidates)) + 1
+            delta = candidates[next_col - 1]
+
+            # Keep the reduced costs of the tree edges at zero and bring the cheapest free column into the tree
+            row_potential[row_of[used]] += delta
+            col_potential[used] -= delta
+            slack[~used] -= delta
+
+            col = next_col
+            if row_of[col] == 0:
+                break
+
+        # Augment along the alternating path ending in the free column
+        while col:
+            previous = way[col]
+            row_of[col] = row_of[previous]
+            col = previous
+
+    return [int(row) - 1 for row in row_of[1:]]
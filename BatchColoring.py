@@ -0,0 +1,123 @@
+"""
+Greedy coloring of a graph in compressed-sparse-row (CSR) form, computed in batches with NumPy.
+
+When vertices are colored greedily in a given order, the color of a vertex is the smallest color not
+used by its neighbors that come earlier in the order, its predecessors. A vertex whose predecessors are
+all colored can therefore be colored right away, and the vertices that become ready together form an
+independent set, since of two adjacent vertices one is a predecessor of the other. Each batch is colored
+at once: the colors of the predecessors are gathered, sorted per vertex, and the smallest missing color
+is found with array operations. The result is identical to the sequential greedy coloring in the same order.
+
+The number of batches is the length of the longest path that goes forward in the order. It is small for
+random orders, but can be large for orders that follow the graph, like the natural order of a path. When
+the batches get too small to pay for the array operations, the remaining vertices are colored sequentially.
+"""
+import numpy as np
+from typing import Sequence
+
+
+def greedy_color_batched(indptr: Sequence[int] | np.ndarray, indices: Sequence[int] | np.ndarray,
+                         order: Sequence[int] | np.ndarray | None = None, min_batch: int = 256) -> np.ndarray:
+    """
+    Colors all vertices greedily in the given order, with the same result as Coloring.greedy_color.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param order: A permutation of all vertices, the natural order if None.
+    :param min_batch: Once fewer vertices than this are ready at a time, the rest is colored sequentially.
+    :return: The color of each vertex.
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    n = len(indptr) - 1
+    order = np.arange(n, dtype=np.int64) if order is None else np.asarray(order, dtype=np.int64)
+    position = np.empty(n, dtype=np.int64)
+    position[order] = np.arange(n, dtype=np.int64)
+
+    # Split every vertex's neighbors into its predecessors and its successors, keeping the CSR layout
+    degree = np.diff(indptr)
+    earlier = position[indices] < np.repeat(position, degree)
+    pred_degree = np.bincount(np.repeat(np.arange(n, dtype=np.int64), degree)[earlier], minlength=n)
+    pred_indptr = np.concatenate(([0], np.cumsum(pred_degree)))
+    pred_indices = indices[earlier]
+    succ_degree = degree - pred_degree
+    succ_indptr = np.concatenate(([0], np.cumsum(succ_degree)))
+    succ_indices = indices[~earlier]
+
+    colors = np.full(n, -1, dtype=np.int64)
+    pending = pred_degree.copy()  # The number of uncolored predecessors of each vertex
+    ready = np.flatnonzero(pending == 0)
+    while len(ready) >= min_batch:
+        colors[ready] = _smallest_missing(colors[_gather(pred_indptr, pred_indices, ready)], pred_degree[ready])
+        successors = _gather(succ_indptr, succ_indices, ready)
+        reached = np.bincount(successors, minlength=n)
+        pending -= reached
+        ready = np.flatnonzero((reached > 0) & (pending == 0))
+
+    if len(ready):
+        _color_sequentially(indptr, indices, order[colors[order] == -1], colors)
+    return colors
+
+
+def _color_sequentially(indptr: np.ndarray, indices: np.ndarray, vertices: np.ndarray, colors: np.ndarray):
+    """
+    Colors the given vertices greedily in order. Only their own neighbor lists are copied to Python lists.
+    """
+    counts = indptr[vertices + 1] - indptr[vertices]
+    neighbors = _gather(indptr, indices, vertices).tolist()
+    bounds = np.concatenate(([0], np.cumsum(counts))).tolist()
+    colors_list = colors.tolist()
+    # used[c] == i if a neighbor of the i-th vertex has color c. A neighbor colored in a batch may have any
+    # color used so far, and a vertex colored here gets at most its degree
+    used = [-1] * (max(int(colors.max()), int(counts.max())) + 2)
+    for i, v in enumerate(vertices.tolist()):
+        for neighbor in neighbors[bounds[i]:bounds[i + 1]]:
+            color = colors_list[neighbor]
+            if color != -1:
+                used[color] = i
+        color = 0
+        while used[color] == i:
+            color += 1
+        colors_list[v] = color
+    colors[vertices] = np.array(colors_list, dtype=np.int64)[vertices]
+
+
+def _gather(indptr: np.ndarray, indices: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """
+    Returns the neighbors of the given vertices, one run per vertex, in the order of the vertices.
+    """
+    counts = indptr[vertices + 1] - indptr[vertices]
+    offsets = np.repeat(indptr[vertices] - np.cumsum(counts) + counts, counts)
+    return indices[offsets + np.arange(int(counts.sum()), dtype=np.int64)]
+
+
+def _smallest_missing(neighbor_colors: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Returns, for each vertex of a batch, the smallest color missing from its run of neighbor_colors.
+
+    :param neighbor_colors: The colors of the neighbors of all vertices, one run per vertex.
+    :param counts: The length of each vertex's run.
+    """
+    k = len(counts)
+    result = np.zeros(k, dtype=np.int64)
+    if not len(neighbor_colors):
+        return result
+    if neighbor_colors.max() < 62:
+        # Collect each vertex's colors as the bits of one integer; the lowest zero bit is the smallest missing color
+        nonempty = np.flatnonzero(counts)
+        starts = (np.cumsum(counts) - counts)[nonempty]
+        masks = np.bitwise_or.reduceat(np.left_shift(1, neighbor_colors), starts)
+        result[nonempty] = np.log2(~masks & (masks + 1)).astype(np.int64)
+        return result
+
+    # Sort the distinct (vertex, color) pairs; within a vertex the i-th distinct color is i until the first gap
+    runs = np.repeat(np.arange(k, dtype=np.int64), counts)
+    width = int(neighbor_colors.max()) + 2
+    keys = np.unique(runs * width + neighbor_colors)
+    vertex, color = keys // width, keys % width
+    starts = np.flatnonzero(np.concatenate(([True], vertex[1:] != vertex[:-1])))
+    sizes = np.diff(np.append(starts, len(keys)))
+    rank = np.arange(len(keys), dtype=np.int64) - np.repeat(starts, sizes)
+    first_gap = np.minimum.reduceat(np.where(color != rank, rank, width), starts)
+    result[vertex[starts]] = np.minimum(first_gap, sizes)
+    return result
@@ -0,0 +1,123 @@
+"""
+Biconnectivity of a graph in compressed-sparse-row (CSR) form, with an explicit DFS stack so that
+long paths do not hit Python's recursion limit.
+"""
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def biconnected_components(indptr: Sequence[int], indices: Sequence[int], removed: Sequence[int] | None = None,
+                           roots: Sequence[int] | None = None) -> Tuple[bytearray, List[List[int]]]:
+    """
+    Finds the articulation points and biconnected components (blocks) with the Hopcroft-Tarjan algorithm, in O(V + E).
+    A bridge is a block of two vertices and an isolated vertex is a block of one.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param removed: If given, the vertices v with removed[v] true are left out of the graph.
+    :param roots: The vertices to start the DFS from, all vertices if None. Only their connected components are searched.
+    :return: A bytearray marking the articulation points, and the list of blocks as lists of vertices.
+    """
+    n = len(indptr) - 1
+    discovery = [-1] * n
+    low = [0] * n
+    parent = [-1] * n
+    next_slot = list(indptr)  # The next neighbor to visit for each vertex
+    articulation_point = bytearray(n)
+    blocks = []
+
+    time_ = 0
+    for root in (range(n) if roots is None else roots):
+        if discovery[root] != -1 or (removed is not None and removed[root]):
+            continue
+        discovery[root] = low[root] = time_
+        time_ += 1
+        root_children = 0
+        stack = [root]  # The DFS path
+        visited = [root]  # The visited vertices whose block is not complete yet
+        while stack:
+            v = stack[-1]
+            if next_slot[v] < indptr[v + 1]:
+                u = indices[next_slot[v]]
+                next_slot[v] += 1
+                if removed is not None and removed[u]:
+                    continue
+                if discovery[u] == -1:  # Tree edge, descend into u
+                    parent[u] = v
+                    discovery[u] = low[u] = time_
+                    time_ += 1
+                    stack.append(u)
+                    visited.append(u)
+                elif u != parent[v] and discovery[u] < low[v]:  # Back edge to an ancestor
+                    low[v] = discovery[u]
+            else:  # All neighbors of v are done, return to its parent
+                stack.pop()
+                p = parent[v]
+                if p == -1:
+                    continue
+                if low[v] < low[p]:
+                    low[p] = low[v]
+                if low[v] >= discovery[p]:  # p separates the subtree of v, which closes a block
+                    block = []
+                    while True:
+                        w = visited.pop()
+                        block.append(w)
+                        if w == v:
+                            break
+                    block.append(p)
+                    blocks.append(block)
+                    if p == root:
+                        root_children += 1
+                    else:
+                        articulation_point[p] = 1
+        if root_children > 1:
+            articulation_point[root] = 1
+        elif root_children == 0:
+            blocks.append([root])
+    return articulation_point, blocks
+
+
+class BlockCutTree:
+    """
+    The BlockCutTree class holds the biconnected structure of a graph: its articulation points, bridges
+    and blocks, and the block-cut tree that joins every block to the articulation points it contains.
+    Vertices are vertex indices, or nodes after relabel.
+    """
+
+    def __init__(self, blocks: List[List[Any]], articulation_points: List[Any]):
+        """
+        :param blocks: The blocks as lists of vertices.
+        :param articulation_points: The articulation points.
+        """
+        self.blocks = blocks
+        self.articulation_points = articulation_points
+        # In a simple graph a block of two vertices is a single edge whose removal disconnects the graph
+        self.bridges: List[Tuple[Any, Any]] = [(block[1], block[0]) for block in blocks if len(block) == 2]
+        self.blocks_of: Dict[Any, List[int]] = {}  # The indices of the blocks each vertex belongs to
+        for i, block in enumerate(blocks):
+            for v in block:
+                self.blocks_of.setdefault(v, []).append(i)
+        # The edges of the block-cut tree, joining the index of a block to each articulation point in it
+        self.tree_edges: List[Tuple[int, Any]] = [(i, v) for v in articulation_points for i in self.blocks_of[v]]
+
+    def is_articulation_point(self, vertex: Any) -> bool:
+        """
+        Checks if a vertex is an articulation point, that is, belongs to more than one block.
+        """
+        return len(self.blocks_of.get(vertex, ())) > 1
+
+    def relabel(self, label: Callable[[Any], Any]) -> 'BlockCutTree':
+        """
+        Returns the same structure with every vertex v replaced by label(v), such as a node for a vertex index.
+        """
+        return BlockCutTree([[label(v) for v in block] for block in self.blocks],
+                            [label(v) for v in self.articulation_points])
+
+
+def block_cut_tree(indptr: Sequence[int], indices: Sequence[int], removed: Sequence[int] | None = None,
+                   roots: Sequence[int] | None = None) -> BlockCutTree:
+    """
+    Finds all articulation points, bridges and blocks of a graph, and its block-cut tree, in one O(V + E) pass.
+    The parameters are those of biconnected_components.
+    """
+    articulation_point, blocks = biconnected_components(indptr, indices, removed, roots)
+    return BlockCutTree(blocks, [v for v in range(len(articulation_point)) if articulation_point[v]])
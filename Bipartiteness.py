@@ -0,0 +1,122 @@
+"""
+Bipartiteness of a graph in compressed-sparse-row (CSR) form, checked with a BFS that expands
+a whole frontier at a time with NumPy, so the work per level is a few array operations.
+
+BFS levels of adjacent vertices differ by at most one, so coloring each vertex by the parity of its
+level is a proper two-coloring unless an edge joins two vertices of the same level. Such an edge,
+together with the BFS tree paths from its ends to their lowest common ancestor, is an odd cycle,
+which is returned as a certificate that the graph is not bipartite.
+"""
+import numpy as np
+from typing import List, Sequence, Tuple
+
+VECTOR_EDGES = 128  # The number of neighbor entries from which a BFS level is expanded with array operations
+
+
+def bfs_levels(indptr: Sequence[int] | np.ndarray, indices: Sequence[int] | np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs a BFS from the first vertex of every connected component.
+    A level is expanded with array operations once its frontier has VECTOR_EDGES neighbor entries, and with
+    a plain loop over the lists below that, where the fixed cost of the array calls would dominate: on a path
+    or on many small components, every level is a vertex or two.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :return: The level of each vertex in its component's BFS tree, and its parent (-1 for the roots).
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    n = len(indptr) - 1
+    degree = np.diff(indptr)
+    ptr, adj = indptr.tolist(), indices.tolist()
+    seen = bytearray(n)  # Set once a vertex is reached
+    seen_array = np.frombuffer(seen, dtype=np.uint8)  # The same flags, for the array operations
+
+    level = np.empty(n, dtype=np.int64)
+    parent = np.empty(n, dtype=np.int64)
+    # The vertices reached by the loop are recorded with their parent and level, and written at the end
+    order: List[int] = []
+    parents: List[int] = []
+    levels: List[int] = []
+    owner = np.empty(n, dtype=np.int64)  # Scratch space to keep one entry per newly reached vertex
+    for root in range(n):
+        if seen[root]:  # Reached from an earlier root
+            continue
+        seen[root] = 1
+        order.append(root)
+        parents.append(-1)
+        levels.append(0)
+        frontier = [root]
+        depth = 0
+        while len(frontier):
+            depth += 1
+            if isinstance(frontier, np.ndarray):
+                entries = int(degree[frontier].sum())
+            else:
+                entries = sum(ptr[v + 1] - ptr[v] for v in frontier)
+            if entries < VECTOR_EDGES:
+                if isinstance(frontier, np.ndarray):
+                    frontier = frontier.tolist()
+                reached = []
+                for v in frontier:
+                    for u in adj[ptr[v]:ptr[v + 1]]:
+                        if not seen[u]:
+                            seen[u] = 1
+                            reached.append(u)
+                            parents.append(v)
+                order.extend(reached)
+                levels.extend([depth] * len(reached))
+                frontier = reached
+            else:
+                # Gather all neighbor entries of the frontier: the positions indptr[v] .. indptr[v + 1] of each v
+                frontier = np.asarray(frontier, dtype=np.int64)
+                counts = degree[frontier]
+                total = int(counts.sum())
+                offsets = np.repeat(indptr[frontier] - np.cumsum(counts) + counts, counts)
+                neighbors = indices[offsets + np.arange(total)]
+                sources = np.repeat(frontier, counts)
+
+                new = seen_array[neighbors] == 0
+                neighbors, sources = neighbors[new], sources[new]
+                # A vertex reached several times keeps the entry that wrote its owner last, which gives it one parent
+                positions = np.arange(len(neighbors))
+                owner[neighbors] = positions
+                kept = owner[neighbors] == positions
+                frontier = neighbors[kept]
+                seen_array[frontier] = 1
+                level[frontier] = depth
+                parent[frontier] = sources[kept]
+
+    level[order] = levels
+    parent[order] = parents
+    return level, parent
+
+
+def two_coloring(indptr: Sequence[int] | np.ndarray,
+                 indices: Sequence[int] | np.ndarray) -> Tuple[np.ndarray | None, List[int] | None]:
+    """
+    Two-colors a graph, or finds an odd cycle if it is not bipartite.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :return: (sides, None) where sides holds 1 or 2 for each vertex and every edge joins the two sides,
+             or (None, cycle) where cycle lists the vertices of an odd cycle in order.
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    level, parent = bfs_levels(indptr, indices)
+    sides = (level % 2 + 1).astype(np.int8)
+
+    sources = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    bad = np.flatnonzero(sides[sources] == sides[indices])
+    if not len(bad):
+        return sides, None
+
+    # Both ends of the edge are at the same level, so walking up from both at once meets at their common ancestor
+    u, v = int(sources[bad[0]]), int(indices[bad[0]])
+    left, right = [u], [v]
+    while u != v:
+        u, v = int(parent[u]), int(parent[v])
+        left.append(u)
+        right.append(v)
+    return None, left + right[-2::-1]
@@ -0,0 +1,261 @@
+"""
+Brooks coloring of a graph in compressed-sparse-row (CSR) form, in O(V + E).
+
+Brooks' theorem states that a graph with maximum degree d can be colored with d colors, unless one of
+its connected components is a complete graph on d + 1 vertices or, for d = 2, an odd cycle.
+Every connected component is colored on its own with at most as many colors as its own maximum degree d,
+by greedy coloring in an order where each vertex, when colored, has fewer than d colored neighbors:
+
+* not d-regular: the reverse of a BFS order from a vertex of degree less than d, as every vertex
+  but the root still has its BFS parent uncolored;
+* d-regular with a cut vertex v: each component of G - v together with v is not d-regular, so it is
+  colored as above with v last, and the colors of each part are swapped so that v gets one color;
+* d-regular and 2-connected (Lovasz): two non-adjacent neighbors y, z of a vertex x such that G - {y, z}
+  is connected are colored first with the same color, then the reverse of a BFS order from x in G - {y, z},
+  so x has two neighbors of one color when it is colored last.
+
+The vertex x, y, z is found with one biconnectivity pass on G - u for some vertex u: if G - u is
+2-connected, u and a vertex y at distance 2 from it, with a common neighbor x, will do. Otherwise x = u,
+and y, z are neighbors of u inside two different leaf blocks of G - u.
+"""
+from AlgorithmStats import NULL_STATS, AlgorithmStats
+from Biconnectivity import biconnected_components
+from Traversal import bfs_csr
+from typing import List, Sequence, Tuple
+
+# The cases reported for each connected component
+ISOLATED = 'isolated'
+COMPLETE = 'complete'
+ODD_CYCLE = 'odd cycle'
+EVEN_CYCLE = 'even cycle'
+NOT_REGULAR = 'not regular'
+CUT_VERTEX = 'cut vertex'
+TRIAD = 'triad'
+
+
+def brooks_coloring(indptr: Sequence[int], indices: Sequence[int],
+                    stats: AlgorithmStats = NULL_STATS) -> Tuple[List[int], List[Tuple[str, Tuple[int, ...], List[int]]]]:
+    """
+    Colors a graph with at most d colors, where d is the maximum degree, unless a component is a complete
+    graph on d + 1 vertices or an odd cycle with d = 2, which is then colored with d + 1 colors.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param stats: Times the 'components', 'articulation_search', 'triad_search' and 'coloring' phases,
+                  and counts the 'bfs_expansions' of the classification and the 'components'.
+    :return: The color of each vertex, and a report (case, special vertices, coloring order) for each connected
+             component. The special vertices are the root of the BFS for NOT_REGULAR, the cut vertex for
+             CUT_VERTEX and (x, y, z) for TRIAD.
+    """
+    n = len(indptr) - 1
+    colors = [-1] * n
+    used = [0] * (n + 1)  # used[c] == stamp if color c is taken by a neighbor of the vertex being colored
+    mark = [0] * n  # Stamps for the neighborhood searches
+    state = [0, 0]  # The last stamps handed out for used and mark
+    # The BFS parents of Traversal.bfs_csr: one array splits the graph into components, and one more is shared
+    # by the BFS that orders each component, as every vertex is in one component
+    component_parent = [-1] * n
+    tree = [-1] * n
+    reports = []
+
+    # Split the graph into connected components and classify them
+    hard = []  # The d-regular components with d >= 3 that are not complete
+    expansions = 0
+    with stats.phase('components'):
+        for start in range(n):
+            if component_parent[start] != -1:
+                continue
+            component = list(bfs_csr(indptr, indices, [start], component_parent))
+            expansions += len(component)
+            degrees = [indptr[v + 1] - indptr[v] for v in component]
+            max_degree, min_degree = max(degrees), min(degrees)
+
+            if max_degree == 0:
+                colors[start] = 0
+                reports.append((ISOLATED, (), component))
+            elif min_degree < max_degree:
+                root = component[degrees.index(min_degree)]
+                order = list(bfs_csr(indptr, indices, [root], tree))[::-1]
+                expansions += len(order)
+                _greedy(indptr, indices, order, colors, used, state)
+                reports.append((NOT_REGULAR, (root,), order))
+            elif len(component) == max_degree + 1:
+                for color, v in enumerate(component):
+                    colors[v] = color
+                reports.append((COMPLETE, (), component))
+            elif max_degree == 2:
+                reports.append(_color_cycle(indptr, indices, start, colors))
+            else:
+                hard.append(component)
+    stats.count('bfs_expansions', expansions)
+    stats.count('components', len(reports) + len(hard))
+
+    if not hard:
+        return colors, reports
+
+    # One biconnectivity pass finds a cut vertex in every hard component that has one
+    with stats.phase('articulation_search'):
+        articulation_point, _ = biconnected_components(indptr, indices, roots=[component[0] for component in hard])
+    two_connected = []
+    with stats.phase('coloring'):
+        for component in hard:
+            cut_vertex = next((v for v in component if articulation_point[v]), None)
+            if cut_vertex is None:
+                two_connected.append(component)
+            else:
+                reports.append(_color_around_cut_vertex(indptr, indices, cut_vertex, colors, used, tree, state))
+
+    if not two_connected:
+        return colors, reports
+
+    # One more pass over the components without their first vertex u locates the triads
+    with stats.phase('triad_search'):
+        removed = bytearray(n)
+        for component in two_connected:
+            removed[component[0]] = 1
+        articulation_point, blocks = biconnected_components(
+            indptr, indices, removed, roots=[indices[indptr[component[0]]] for component in two_connected])
+        leaf_blocks = {}  # The leaf blocks of G - u, by u
+        owner = {component[0]: component[0] for component in two_connected}
+        for component in two_connected:
+            for v in component:
+                owner[v] = component[0]
+        for block in blocks:
+            cut_vertices = [v for v in block if articulation_point[v]]
+            if len(cut_vertices) == 1:
+                leaf_blocks.setdefault(owner[block[0]], []).append(block)
+
+        triads = []
+        for component in two_connected:
+            u = component[0]
+            if u in leaf_blocks:  # G - u has cut vertices, so u has a neighbor inside each of two leaf blocks
+                triads.append((u,) + tuple(_neighbor_inside(indptr, indices, u, block, articulation_point, mark, state)
+                                           for block in leaf_blocks[u][:2]))
+            else:  # G - u is 2-connected, so removing u and any other vertex leaves it connected
+                triads.append(_distance_two(indptr, indices, u, mark, state))
+
+    with stats.phase('coloring'):
+        for triad in triads:
+            reports.append(_color_from_triad(indptr, indices, triad, colors, used, tree, state))
+
+    return colors, reports
+
+
+def _greedy(indptr: Sequence[int], indices: Sequence[int], order: List[int], colors: List[int], used: List[int],
+            state: List[int]):
+    """
+    Gives each vertex of the order, in turn, the smallest color not used by its neighbors.
+    """
+    for v in order:
+        state[0] += 1
+        stamp = state[0]
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if colors[u] != -1:
+                used[colors[u]] = stamp
+        color = 0
+        while used[color] == stamp:
+            color += 1
+        colors[v] = color
+
+
+def _color_cycle(indptr: Sequence[int], indices: Sequence[int], start: int,
+                 colors: List[int]) -> Tuple[str, Tuple[int, ...], List[int]]:
+    """
+    Colors a cycle by walking around it with alternating colors. An odd cycle needs a third color for its last vertex.
+    """
+    order = [start]
+    previous, v = start, indices[indptr[start]]
+    while v != start:
+        order.append(v)
+        first, second = indices[indptr[v]], indices[indptr[v] + 1]
+        previous, v = v, (second if first == previous else first)
+    for i, v in enumerate(order):
+        colors[v] = i % 2
+    if len(order) % 2:
+        colors[order[-1]] = 2
+        return ODD_CYCLE, (), order
+    return EVEN_CYCLE, (), order
+
+
+def _color_around_cut_vertex(indptr: Sequence[int], indices: Sequence[int], cut_vertex: int, colors: List[int],
+                             used: List[int], tree: List[int], state: List[int]) -> Tuple[str, Tuple[int, ...], List[int]]:
+    """
+    Colors a d-regular component with a cut vertex, one component of G - cut_vertex at a time.
+    tree is the parent array of bfs_csr, still -1 on the component.
+    """
+    tree[cut_vertex] = cut_vertex  # The cut vertex is never entered, so each BFS stays inside one part
+    order = []
+    target = -1  # The color the cut vertex gets in the first part
+    for neighbor in indices[indptr[cut_vertex]:indptr[cut_vertex + 1]]:
+        if tree[neighbor] != -1:
+            continue
+        part = list(bfs_csr(indptr, indices, [neighbor], tree))[::-1]
+        # The cut vertex must get its color from its neighbors in this part alone, as it has fewer than d
+        # of them: its neighbors in the parts already colored are uncolored for the time being
+        others = [(u, colors[u]) for u in indices[indptr[cut_vertex]:indptr[cut_vertex + 1]] if colors[u] != -1]
+        for u, _ in others:
+            colors[u] = -1
+        colors[cut_vertex] = -1
+        _greedy(indptr, indices, part + [cut_vertex], colors, used, state)
+        for u, color in others:
+            colors[u] = color
+        color = colors[cut_vertex]
+        if target == -1:
+            target = color
+        elif color != target:  # Swap two colors in this part so that the cut vertex agrees with the first part
+            for v in part:
+                if colors[v] == color:
+                    colors[v] = target
+                elif colors[v] == target:
+                    colors[v] = color
+            colors[cut_vertex] = target
+        order.extend(part)
+    order.append(cut_vertex)
+    return CUT_VERTEX, (cut_vertex,), order
+
+
+def _neighbor_inside(indptr: Sequence[int], indices: Sequence[int], u: int, block: List[int],
+                     articulation_point: Sequence[int], mark: List[int], state: List[int]) -> int:
+    """
+    Returns a neighbor of u that is in the block but is not a cut vertex of it.
+    """
+    state[1] += 1
+    stamp = state[1]
+    for v in block:
+        if not articulation_point[v]:
+            mark[v] = stamp
+    return next(v for v in indices[indptr[u]:indptr[u + 1]] if mark[v] == stamp)
+
+
+def _distance_two(indptr: Sequence[int], indices: Sequence[int], u: int, mark: List[int],
+                  state: List[int]) -> Tuple[int, int, int]:
+    """
+    Returns (x, u, y) where y is at distance 2 from u and x is a common neighbor. One exists in every
+    connected regular graph that is not complete.
+    """
+    state[1] += 1
+    stamp = state[1]
+    mark[u] = stamp
+    neighbors = indices[indptr[u]:indptr[u + 1]]
+    for x in neighbors:
+        mark[x] = stamp
+    for x in neighbors:
+        for y in indices[indptr[x]:indptr[x + 1]]:
+            if mark[y] != stamp:
+                return x, u, y
+    raise ValueError('The component is complete')
+
+
+def _color_from_triad(indptr: Sequence[int], indices: Sequence[int], triad: Tuple[int, int, int], colors: List[int],
+                      used: List[int], tree: List[int], state: List[int]) -> Tuple[str, Tuple[int, ...], List[int]]:
+    """
+    Colors a 2-connected d-regular component from a triad (x, y, z): y and z first, then the rest of the
+    component in the reverse of a BFS order from x that avoids y and z. tree is the parent array of bfs_csr,
+    still -1 on the component.
+    """
+    x, y, z = triad
+    tree[y], tree[z] = y, z  # Never entered
+    order = [y, z] + list(bfs_csr(indptr, indices, [x], tree))[::-1]
+    colors[y] = colors[z] = 0
+    _greedy(indptr, indices, order[2:], colors, used, state)
+    return TRIAD, triad, order
@@ -0,0 +1,200 @@
+"""
+Greedy vertex coloring of a graph in compressed-sparse-row (CSR) form, with selectable vertex orderings.
+
+Greedy coloring gives each vertex, in turn, the smallest color not used by its neighbors, and the order
+decides how many colors it needs. The orderings are:
+
+* natural: the vertex indices in increasing order;
+* bfs: the reverse of a BFS order from a vertex of minimum degree in each component, as in Brooks' algorithm;
+* welsh-powell: the vertices by decreasing degree;
+* smallest-last: repeatedly remove a vertex of minimum degree, and color in the reverse order of removal.
+  Every vertex then has at most k colored neighbors, where k is the degeneracy of the graph, so at most k + 1
+  colors are used;
+* dsatur: the next vertex is an uncolored one with the most distinct colors among its neighbors (its saturation),
+  kept in a bucket queue by saturation. Among the vertices with no colored neighbor, the one of highest degree
+  is taken; other ties go to the vertex whose saturation rose last.
+
+The colors of the neighbors are marked in one reusable array with the vertex as stamp, so no set is built
+per vertex. All orderings run in O(V + E) time and space.
+"""
+from Traversal import bfs_csr
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def greedy_color(indptr: Sequence[int], indices: Sequence[int], order: Sequence[int],
+                 colors: List[int] | None = None) -> List[int]:
+    """
+    Colors the vertices in the given order, each with the smallest color not used by its neighbors.
+    Vertices that are already colored keep their color.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param order: The vertices to color, in order.
+    :param colors: The color of each vertex, -1 if uncolored. A new list is used if None.
+    :return: The colors list.
+    """
+    n = len(indptr) - 1
+    if colors is None:
+        colors = [-1] * n
+    used = [-1] * (n + 1)  # used[c] == v if a neighbor of v has color c
+    for v in order:
+        if colors[v] != -1:
+            continue
+        for neighbor in indices[indptr[v]:indptr[v + 1]]:  # Mark the colors of the neighbors
+            color = colors[neighbor]
+            if color != -1:
+                used[color] = v
+        color = 0  # Choose the smallest color that is not used
+        while used[color] == v:
+            color += 1
+        colors[v] = color
+    return colors
+
+
+def natural_order(indptr: Sequence[int], indices: Sequence[int]) -> List[int]:
+    """
+    Returns the vertices in increasing order.
+    """
+    return list(range(len(indptr) - 1))
+
+
+def _by_degree(indptr: Sequence[int]) -> List[int]:
+    """
+    Returns the vertices by increasing degree, sorted with a counting sort.
+    """
+    n = len(indptr) - 1
+    buckets = [[] for _ in range(max((indptr[v + 1] - indptr[v] for v in range(n)), default=0) + 1)]
+    for v in range(n):
+        buckets[indptr[v + 1] - indptr[v]].append(v)
+    return [v for bucket in buckets for v in bucket]
+
+
+def bfs_order(indptr: Sequence[int], indices: Sequence[int]) -> List[int]:
+    """
+    Returns, for each connected component, the reverse of a BFS order from a vertex of minimum degree.
+    Every vertex but the last one of its component then has an uncolored neighbor when it is colored.
+    """
+    parent = [-1] * (len(indptr) - 1)
+    order = []
+    for root in _by_degree(indptr):
+        if parent[root] == -1:
+            order.extend(list(bfs_csr(indptr, indices, [root], parent))[::-1])
+    return order
+
+
+def welsh_powell_order(indptr: Sequence[int], indices: Sequence[int]) -> List[int]:
+    """
+    Returns the vertices by decreasing degree.
+    """
+    return _by_degree(indptr)[::-1]
+
+
+def smallest_last_order(indptr: Sequence[int], indices: Sequence[int]) -> List[int]:
+    """
+    Returns the smallest-last (degeneracy) order of Matula and Beck. The vertices are kept in buckets by
+    their degree among the vertices not removed yet; a vertex moved to a lower bucket leaves a stale
+    entry behind, which is skipped when it comes up.
+    """
+    n = len(indptr) - 1
+    degree = [indptr[v + 1] - indptr[v] for v in range(n)]
+    buckets = [[] for _ in range(max(degree, default=0) + 1)]
+    for v in range(n):
+        buckets[degree[v]].append(v)
+    removed = bytearray(n)
+    removal = []
+    lowest = 0  # No bucket below this one holds a vertex that is not removed
+    while len(removal) < n:
+        bucket = buckets[lowest]
+        if not bucket:
+            lowest += 1
+            continue
+        v = bucket.pop()
+        if removed[v] or degree[v] != lowest:  # A stale entry
+            continue
+        removed[v] = 1
+        removal.append(v)
+        for neighbor in indices[indptr[v]:indptr[v + 1]]:
+            if not removed[neighbor]:
+                degree[neighbor] -= 1
+                buckets[degree[neighbor]].append(neighbor)
+        if lowest:  # The neighbors may now be one bucket lower
+            lowest -= 1
+    return removal[::-1]
+
+
+def dsatur(indptr: Sequence[int], indices: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """
+    Colors the graph with the DSatur algorithm of Brelaz.
+    The pairs (v, c) where vertex v has a neighbor of color c are kept in one set, as the integers v * (V + 1) + c.
+    A pair is only added when a neighbor of v takes color c, so the set holds at most one entry per edge end.
+
+    :return: The colors, and the order in which the vertices were colored.
+    """
+    n = len(indptr) - 1
+    colors = [-1] * n
+    saturation = [0] * n
+    width = n + 1  # Greater than every color, which is at most the maximum degree
+    seen = set()  # Holds v * width + c if v has a neighbor of color c
+    used = [-1] * (n + 1)  # used[c] == v if a neighbor of v has color c
+    # Bucket b holds the vertices of saturation b, the last one being the next to take; like in
+    # smallest_last_order, a vertex moved to a higher bucket leaves a stale entry behind
+    max_degree = max((indptr[v + 1] - indptr[v] for v in range(n)), default=0)
+    buckets = [_by_degree(indptr)] + [[] for _ in range(max_degree)]  # A saturation never exceeds the degree
+    highest = 0
+    order = []
+    while len(order) < n:
+        bucket = buckets[highest]
+        if not bucket:
+            highest -= 1
+            continue
+        v = bucket.pop()
+        if colors[v] != -1 or saturation[v] != highest:  # A stale entry
+            continue
+
+        for neighbor in indices[indptr[v]:indptr[v + 1]]:
+            color = colors[neighbor]
+            if color != -1:
+                used[color] = v
+        color = 0
+        while used[color] == v:
+            color += 1
+        colors[v] = color
+        order.append(v)
+
+        for neighbor in indices[indptr[v]:indptr[v + 1]]:
+            key = neighbor * width + color
+            if colors[neighbor] == -1 and key not in seen:
+                seen.add(key)
+                saturation[neighbor] += 1
+                buckets[saturation[neighbor]].append(neighbor)
+                if saturation[neighbor] > highest:
+                    highest = saturation[neighbor]
+    return colors, order
+
+
+# The orderings by name; dsatur builds its order while coloring, so it is handled by color_graph
+ORDERINGS: Dict[str, Callable[[Sequence[int], Sequence[int]], List[int]]] = {
+    'natural': natural_order,
+    'bfs': bfs_order,
+    'welsh-powell': welsh_powell_order,
+    'smallest-last': smallest_last_order,
+}
+
+STRATEGIES = tuple(ORDERINGS) + ('dsatur',)
+
+
+def color_graph(indptr: Sequence[int], indices: Sequence[int], strategy: str = 'natural') -> Tuple[List[int], List[int]]:
+    """
+    Colors a graph greedily with one of the STRATEGIES.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param strategy: The name of the vertex ordering.
+    :return: The color of each vertex, and the order in which the vertices were colored.
+    """
+    if strategy == 'dsatur':
+        return dsatur(indptr, indices)
+    if strategy not in ORDERINGS:
+        raise ValueError(f"Unknown coloring strategy '{strategy}', expected one of {', '.join(STRATEGIES)}")
+    order = ORDERINGS[strategy](indptr, indices)
+    return greedy_color(indptr, indices, order), order
@@ -0,0 +1,122 @@
+from GraphEdge import Edge
+from GraphNode import Node
+from typing import Dict, Iterable, Iterator, List
+
+
+class DenseAdjacency:
+    """
+    The DenseAdjacency class keeps the adjacency of a graph as one bitset row per node, stored in a Python int.
+    Every node that has an edge gets a slot, and bit j of a node's row is set if the node in slot j is its neighbor.
+
+    Adjacency tests are bit tests, and the neighbors a node shares with a set of nodes are found by intersecting
+    two rows, with popcounts for their number. This pays off on dense graphs, where a neighbor list is long.
+    A Graph keeps one up to date, as a listener, while its density is above Graph.DENSE_THRESHOLD.
+    """
+
+    def __init__(self, nodes: Iterable[Node] = ()):
+        """
+        Builds the rows of the given nodes from their neighbor lists.
+
+        :param nodes: All nodes of the graph.
+        """
+        self._slot: Dict[Node, int] = {}  # The slot of each node that has a row
+        self._node_at: List[Node | None] = []  # The node in each slot
+        self._free: List[int] = []  # Slots of deleted nodes, to reuse
+        self._rows: List[int] = []  # The bitset row of each slot
+        nodes = [node for node in nodes if node.neighbors]
+        for node in nodes:
+            self._slot_of(node)
+        for node in nodes:
+            self._rows[self._slot[node]] = self.mask(node.neighbors)
+
+    def _slot_of(self, node: Node) -> int:
+        """
+        Returns the slot of a node, giving it a new one if it has none.
+        """
+        slot = self._slot.get(node)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._node_at[slot] = node
+                self._rows[slot] = 0
+            else:
+                slot = len(self._rows)
+                self._node_at.append(node)
+                self._rows.append(0)
+            self._slot[node] = slot
+        return slot
+
+    def bit(self, node: Node) -> int:
+        """
+        Returns the single-bit mask of a node, 0 if it has no slot (it never had an edge).
+        """
+        slot = self._slot.get(node)
+        return 0 if slot is None else 1 << slot
+
+    def mask(self, nodes: Iterable[Node]) -> int:
+        """
+        Returns the bitset of a set of nodes.
+        """
+        bits = 0
+        for node in nodes:
+            bits |= self.bit(node)
+        return bits
+
+    def row(self, node: Node) -> int:
+        """
+        Returns the bitset of the neighbors of a node.
+        """
+        slot = self._slot.get(node)
+        return 0 if slot is None else self._rows[slot]
+
+    def adjacent(self, u: Node, v: Node) -> bool:
+        """
+        Checks if two nodes are adjacent.
+        """
+        slot = self._slot.get(v)
+        return slot is not None and (self.row(u) >> slot) & 1 == 1
+
+    def degree(self, node: Node) -> int:
+        """
+        Returns the number of neighbors of a node.
+        """
+        return self.row(node).bit_count()
+
+    def nodes(self, bits: int) -> Iterator[Node]:
+        """
+        Yields the nodes of a bitset, in slot order.
+        """
+        while bits:
+            low = bits & -bits
+            yield self._node_at[low.bit_length() - 1]
+            bits ^= low
+
+    def first(self, bits: int) -> Node | None:
+        """
+        Returns the node of the lowest set bit of a bitset, or None if it is empty.
+        """
+        return self._node_at[(bits & -bits).bit_length() - 1] if bits else None
+
+    def edge_added(self, edge: Edge):
+        """
+        Sets the two bits of a new edge. Called by the graph.
+        """
+        source, dest = self._slot_of(edge.source), self._slot_of(edge.dest)
+        self._rows[source] |= 1 << dest
+        self._rows[dest] |= 1 << source
+
+    def node_deleted(self, node: Node):
+        """
+        Clears a deleted node from the rows of its former neighbors and frees its slot. Called by the graph.
+        """
+        slot = self._slot.pop(node, None)
+        if slot is None:
+            return
+        row, keep = self._rows[slot], ~(1 << slot)
+        while row:
+            low = row & -row
+            self._rows[low.bit_length() - 1] &= keep
+            row ^= low
+        self._rows[slot] = 0
+        self._node_at[slot] = None
+        self._free.append(slot)
@@ -1,8 +1,15 @@
 import tkinter as tk
 import Graph
 from GraphEdge import Edge
-from typing import List
+from typing import Any, Dict, List, Tuple
 import GraphAlgorithms
+from AlgorithmTrace import Trace
+from AlgorithmWorker import AlgorithmRun, apply_result
+from RenderQueue import RenderQueue
+from TracePlayer import TracePlayer
+
+SPEEDS = ('0.25', '0.5', '1', '2', '4', '8', '16')  # The replay speeds offered
+POLL_INTERVAL = 20  # Time (in milliseconds) between two polls of a running worker
 
 
 class Window(tk.Tk):
@@ -16,11 +23,15 @@ class Window(tk.Tk):
         self.scale_factor = 1.0
         self.active_action = "Add Node"  # Default action
         self.delay_entry = None  # For user input of delay
+        self.player: TracePlayer | None = None  # Replays the trace of the last run
+        self.run: AlgorithmRun | None = None  # The run of the algorithm in a worker process, while it runs
+        self.run_graph = None  # The description of the graph the run started on
         self.algorithm = title  # Algorithm to use, determined by window title
         self.position_window()  # Set the window position
         self.create_widgets()  # Create the buttons, text box, etc
         self.source_node = None
         self.output_text = self.create_output_text()  # Output text box
+        self.line_start = {}  # The node each edge's line was drawn from
         self.graph = Graph.Graph(self)  # Initialize a Graph object
         self.graph_algos = GraphAlgorithms.GAlgorithm(self.graph)  # Graph algorithms object
         self.highlighted_node = None  # The node that is currently highlighted
@@ -69,6 +80,7 @@ class Window(tk.Tk):
         self.canvas.bind('<Button-1>', self.handle_chosen_action)
         self.canvas.bind('<Motion>', self.handle_motion)
         self.canvas.bind("<MouseWheel>", self.zoom)
+        self.render_queue = RenderQueue(self.canvas)  # Coalesces item changes into frames
 
     def create_buttons(self):
         buttons_frame = tk.Frame(self, padx=5, pady=5, relief='sunken')  # Create a frame to hold the buttons
@@ -93,6 +105,25 @@ class Window(tk.Tk):
         self.delay_entry.bind("<Button-1>", self.handle_entry_click)
         self.delay_entry.grid(column=1, row=0, padx=2, pady=5, sticky='w')
 
+        # Controls of the replay of the last run
+        replay_frame = tk.Frame(algo_button_frame)
+        replay_frame.grid(column=0, row=1, columnspan=2, sticky='w')
+        pause_button = tk.Button(replay_frame, text="⏯", command=self.handle_pause_button)
+        pause_button.grid(column=0, row=0, padx=2)
+        step_button = tk.Button(replay_frame, text="⏭", command=self.handle_step_button)
+        step_button.grid(column=1, row=0, padx=2)
+        self.speed_box = tk.Spinbox(replay_frame, values=SPEEDS, width=4, command=self.handle_speed_change)
+        self.speed_box.delete(0, tk.END)
+        self.speed_box.insert(0, '1')
+        self.speed_box.grid(column=2, row=0, padx=2)
+        self.seek_scale = tk.Scale(replay_frame, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=False, length=120,
+                                   command=self.handle_seek)
+        self.seek_scale.grid(column=3, row=0, padx=2)
+        cancel_button = tk.Button(replay_frame, text="Cancel", command=self.handle_cancel_button)
+        cancel_button.grid(column=4, row=0, padx=2)
+        self.progress_label = tk.Label(replay_frame, width=12, anchor='w')
+        self.progress_label.grid(column=5, row=0, padx=2)
+
         # Create various buttons for different actions
         add_node_button = tk.Button(buttons_frame, text="Add Node", padx=5, pady=5, command=self.handle_inode_button)
         add_node_button.grid(column=0, row=0, padx=5)
@@ -111,33 +142,217 @@ class Window(tk.Tk):
         clear_button = tk.Button(buttons_frame, text="Clear", padx=5, pady=5, command=self.handle_clear_button)
         clear_button.grid(column=4, row=0, padx=5)
 
+        save_trace_button = tk.Button(buttons_frame, text="Save Trace", padx=5, pady=5,
+                                      command=self.handle_save_trace_button)
+        save_trace_button.grid(column=5, row=0, padx=5)
+
+        load_trace_button = tk.Button(buttons_frame, text="Load Trace", padx=5, pady=5,
+                                      command=self.handle_load_trace_button)
+        load_trace_button.grid(column=6, row=0, padx=5)
+
     def zoom(self, event):
         self.scale_factor *= 1.1 if event.delta > 0 else 0.9
         self.zoom_factor = 1.1 if event.delta > 0 else 0.9
         self.zoom_center = event.x, event.y
 
-        for node in self.graph.node_list:
-            node.x = (node.x - self.zoom_center[0]) * self.zoom_factor + self.zoom_center[0]
-            node.y = (node.y - self.zoom_center[1]) * self.zoom_factor + self.zoom_center[1]
-            node._radius *= self.zoom_factor
-
+        self.graph.zoom(self.zoom_center[0], self.zoom_center[1], self.zoom_factor)
         self.canvas.scale("all", event.x, event.y, self.zoom_factor, self.zoom_factor)
 
+    def get_delay(self) -> float:
+        """
+        Returns the delay in seconds typed by the user, which may be fractional, or 0 if none was typed.
+        """
+        try:
+            return max(0.0, float(self.delay_entry.get()))
+        except ValueError:
+            return 0.0
+
     def run_hungarian_algorithm(self):
-        delay = int(self.delay_entry.get())
-        self.graph_algos.hungarian_algorithm(delay)
+        self.run_in_worker('hungarian')
 
     def run_brooks_algorithm(self):
-        delay = int(self.delay_entry.get())
-        self.graph_algos.brooks_algorithm(self.graph, delay)
+        self.run_in_worker('brooks')
+
+    def run_in_worker(self, algorithm: str):
+        """
+        Starts an algorithm in a worker process, on a copy of the graph. What it shows is recorded and
+        replayed once it is done, see poll_run.
+        """
+        if self.run is not None:
+            self.print_to_gui("The algorithm is already running.")
+            return
+        self.stop_replay()
+        run = self.run = AlgorithmRun(algorithm, self.graph, self.get_delay())
+        self.run_graph = self.describe_graph()
+        self.progress_label.configure(text="Running")
+        self.after(POLL_INTERVAL, self.poll_run, run)
+
+    def poll_run(self, run: AlgorithmRun):
+        """
+        Takes what a worker sent, and shows the trace of its run once it is done.
+        A run whose graph changed in the meantime is only waited for, and its result is dropped.
+        """
+        run.poll()
+        if not run.ended:
+            if run is self.run:
+                self.progress_label.configure(text=f"{run.steps} steps")
+            self.after(POLL_INTERVAL, self.poll_run, run)
+            return
+        if run is not self.run:
+            return
+        self.run = None
+        self.progress_label.configure(text="")
+        if run.outcome == 'done':
+            apply_result(self.graph, self.graph_algos, run.result)
+            self.start_replay(Trace(run.events, self.run_graph, self.algorithm))
+        elif run.outcome == 'cancelled':
+            self.print_to_gui("The algorithm was cancelled.")
+        else:
+            self.print_to_gui(f"The algorithm failed: {run.result}")
+
+    def cancel_run(self):
+        """
+        Cancels the running algorithm, if any. Its worker is left to stop at the end of its current step.
+        """
+        if self.run is not None:
+            self.run.cancel()
+            self.run = None
+            self.progress_label.configure(text="")
+            self.print_to_gui("The algorithm was cancelled.")
+
+    def before_edit(self):
+        """
+        Called before the graph is edited: a run on the old graph is cancelled, and the replay jumps to the
+        end of the run so the edit is made on the final drawing.
+        """
+        self.cancel_run()
+        self.stop_replay()
+
+    def handle_cancel_button(self):
+        self.cancel_run()
+
+    def start_replay(self, trace: Trace):
+        self.player = TracePlayer(self, trace, self.get_speed(), self.handle_replay_position)
+        self.seek_scale.configure(to=trace.step_count)
+        self.player.play()
+
+    def stop_replay(self):
+        """
+        Ends the replay, showing the end of the run, before the graph is changed.
+        """
+        if self.player is not None:
+            self.player.finish()
+            self.player = None
+            self.seek_scale.configure(to=0)
+
+    def get_speed(self) -> float:
+        try:
+            return float(self.speed_box.get())
+        except ValueError:
+            return 1.0
+
+    def handle_pause_button(self):
+        if self.player is not None:
+            if self.player.playing:
+                self.player.pause()
+            else:
+                self.player.play()
+
+    def handle_step_button(self):
+        if self.player is not None:
+            self.player.step()
+
+    def handle_speed_change(self):
+        if self.player is not None:
+            self.player.set_speed(self.get_speed())
+
+    def handle_seek(self, value: str):
+        # The scale also reports the positions set by handle_replay_position
+        if self.player is not None and int(value) != self.player.position:
+            self.player.pause()
+            self.player.seek(int(value))
+
+    def handle_replay_position(self, position: int):
+        self.seek_scale.set(position)
+
+    def handle_save_trace_button(self):
+        if self.player is None:
+            self.print_to_gui("There is no run to save, run an algorithm first.")
+            return
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(parent=self, defaultextension='.json',
+                                            filetypes=[('Algorithm traces', '*.json')])
+        if path:
+            self.player.trace.save(path)
+
+    def handle_load_trace_button(self):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(parent=self, filetypes=[('Algorithm traces', '*.json')])
+        if not path:
+            return
+        try:
+            trace = Trace.load(path)
+        except (OSError, ValueError, KeyError) as error:
+            self.print_to_gui(f"Could not load the trace: {error}")
+            return
+        if trace.graph is None:
+            self.print_to_gui("The trace does not describe its graph, it can not be replayed.")
+            return
+        self.before_edit()
+        self.graph.delete_graph()
+        node_ids, edge_ids = self.draw_graph(trace.graph)
+        self.start_replay(trace.remap(node_ids, edge_ids))
+
+    def describe_graph(self) -> Dict[str, List[List[Any]]]:
+        """
+        Describes the drawn graph for a Trace: its nodes with their positions, and its edges from the node
+        their line was drawn from.
+        """
+        edges = []
+        for edge in self.graph.edge_list:
+            source = self.line_start.get(edge.id, edge.source.circle_id)
+            dest = edge.dest.circle_id if source == edge.source.circle_id else edge.source.circle_id
+            edges.append([edge.id, source, dest])
+        return {'nodes': [[node.circle_id, node.x, node.y] for node in self.graph.node_list], 'edges': edges}
+
+    def draw_graph(self, graph: Dict[str, List[List[Any]]]) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """
+        Draws and adds a graph described by describe_graph.
+
+        :return: The new id of each node id and of each edge id of the description.
+        """
+        node_ids, edge_ids = {}, {}
+        for node_id, x, y in graph['nodes']:
+            node_ids[node_id] = self.draw_node_at(x, y)
+            self.graph.add_node(node_ids[node_id], x, y, self.scale_factor)
+        for edge_id, source, dest in graph['edges']:
+            edge_ids[edge_id] = self.draw_line(node_ids[source], node_ids[dest])
+            self.graph.add_edge(node_ids[source], node_ids[dest], edge_ids[edge_id])
+        return node_ids, edge_ids
+
+    def trace_options(self, event: Tuple[Any, ...]) -> Tuple[int, Dict[str, Any]] | None:
+        """
+        Returns the canvas item changed by an event of a Trace and its new options, or None if the event
+        does not change an item.
+        """
+        kind = event[0]
+        if kind in ('color_edge', 'color_node'):
+            return event[1], {'fill': event[2]}
+        if kind == 'color_node_outline':
+            return event[1], {'outline': event[2], 'width': 2}
+        if kind == 'direct_edge':
+            # The arrow points to the end of the line if the edge starts where its line was drawn from
+            return event[1], {'arrow': tk.LAST if event[2] == self.line_start.get(event[1]) else tk.FIRST}
+        return None
 
     def draw_node(self, event):
-        x = event.x
-        y = event.y
+        return self.draw_node_at(event.x, event.y)
 
+    def draw_node_at(self, x: float, y: float) -> int:
         circle_id = self.canvas.create_oval(x - 20 * self.scale_factor, y - 20 * self.scale_factor,
                                             x + 20 * self.scale_factor, y + 20 * self.scale_factor, outline='black',
                                             width=2, fill='white')
+        self.render_queue.created(circle_id, outline='black', width=2, fill='white')
 
         return circle_id
 
@@ -171,6 +386,7 @@ class Window(tk.Tk):
             self.print_to_gui(edge.__str__())
 
     def handle_clear_button(self):
+        self.before_edit()
         self.graph.delete_graph()
 
     def handle_motion(self, event):
@@ -186,47 +402,58 @@ class Window(tk.Tk):
                     # if there is a node currently highlighted
                     if self.highlighted_node is not None:
                         # change the color of the currently highlighted node back to white
-                        self.canvas.itemconfigure(self.highlighted_node, fill='white')
-                if self.canvas.itemcget(node_circle_id, "fill") != "white":
+                        self.render_queue.configure(self.highlighted_node, fill='white')
+                if self.render_queue.get(node_circle_id, "fill") != "white":
                     return
                 else:
                     # change the color of the new node to red to highlight it
-                    self.canvas.itemconfigure(node_circle_id, fill='red')
+                    self.render_queue.configure(node_circle_id, fill='red')
                     # update the currently highlighted node
                     self.highlighted_node = node_circle_id
             else:
                 # if the mouse cursor is not over a node and there is a currently highlighted node
                 if self.highlighted_node is not None:
                     # change the color of the currently highlighted node back to white
-                    self.canvas.itemconfigure(self.highlighted_node, fill='white')
+                    self.render_queue.configure(self.highlighted_node, fill='white')
                     # remove the reference to the highlighted node since there is none now
                     self.highlighted_node = None
 
     def draw_edge(self, dest_id: int):
-        source_x, source_y = self.graph.find_node_by_id_coords(self.source_node)
+        return self.draw_line(self.source_node, dest_id)
+
+    def draw_line(self, source_id: int, dest_id: int) -> int:
+        source_x, source_y = self.graph.find_node_by_id_coords(source_id)
         dest_x, dest_y = self.graph.find_node_by_id_coords(dest_id)
 
-        return self.canvas.create_line(source_x, source_y, dest_x, dest_y, fill='black', width=2)
+        edge_id = self.canvas.create_line(source_x, source_y, dest_x, dest_y, fill='black', width=2)
+        self.render_queue.created(edge_id, fill='black', width=2, arrow=tk.NONE)
+        self.line_start[edge_id] = source_id
+        return edge_id
+
+    def delete_item(self, item_id: int):
+        self.canvas.delete(item_id)
+        self.render_queue.forget(item_id)
+        self.line_start.pop(item_id, None)
 
     def color_edge(self, edge_id: int, color: str):
-        self.canvas.itemconfigure(edge_id, fill=color)
-        self.canvas.update()
+        self.render_queue.configure(edge_id, fill=color)
+        self.render_queue.tick()
 
     def color_node(self, node_id: int, color: str):
-        self.canvas.itemconfigure(node_id, fill=color)
-        self.canvas.update()
+        self.render_queue.configure(node_id, fill=color)
+        self.render_queue.tick()
 
     def color_node_outline(self, node_id: int, color: str):
-        self.canvas.itemconfigure(node_id, outline=color, width=2)
+        self.render_queue.configure(node_id, outline=color, width=2)
 
     def direct_graph(self, edge_list: List[Edge]):
         for edge in edge_list:
-            coords = self.canvas.coords(edge.id)
-
-            if edge.source.x == coords[0]:
-                self.canvas.itemconfigure(edge.id, arrow=tk.LAST)
+            # The arrow points to the end of the line if the edge still starts where its line was drawn from
+            if edge.source.circle_id == self.line_start.get(edge.id):
+                self.render_queue.configure(edge.id, arrow=tk.LAST)
             else:
-                self.canvas.itemconfigure(edge.id, arrow=tk.FIRST)
+                self.render_queue.configure(edge.id, arrow=tk.FIRST)
+        self.render_queue.tick()
 
     def handle_chosen_action(self, event):
         # If the chosen action is to "Add Node"
@@ -235,6 +462,7 @@ class Window(tk.Tk):
             node_circle_id = self.graph.find_node_in_radius(event.x, event.y)
             # If there isn't already a node where the user clicked (indicated by node_circle_id < 0)
             if node_circle_id < 0:
+                self.before_edit()
                 # Draw the node at the event (click) location
                 circle_id = self.draw_node(event)
                 # Add the newly drawn node to the graph
@@ -246,14 +474,15 @@ class Window(tk.Tk):
             id_to_delete = self.graph.find_node_in_radius(event.x, event.y)
             # If there is a node where the user clicked
             if id_to_delete >= 0:
+                self.before_edit()
                 # Delete the node from the canvas
-                self.canvas.delete(id_to_delete)
+                self.delete_item(id_to_delete)
                 # Delete the node from the graph, and get the list of associated edges
                 edge_list = self.graph.delete_node(id_to_delete)
                 print("Deleted " + str(len(edge_list)) + " edges.")
                 # Delete all associated edges from the canvas
                 for edge in edge_list:
-                    self.canvas.delete(edge)
+                    self.delete_item(edge)
 
         # If the chosen action is to "Add Edge"
         elif self.active_action == "Add Edge":
@@ -267,14 +496,19 @@ class Window(tk.Tk):
                     self.source_node = node_circle_id
                     self.source_node_circle_id = node_circle_id
                     # Highlight the source node in red
-                    self.canvas.itemconfigure(self.source_node_circle_id, fill='red')
+                    self.render_queue.configure(self.source_node_circle_id, fill='red')
                 else:
+                    # Only an edge the graph accepts changes it: not a loop, and not a duplicate
+                    if node_circle_id != self.source_node and self.graph.find_edge(self.source_node,
+                                                                                   node_circle_id) is None:
+                        self.before_edit()
                     # Draw an edge from the source node to the clicked node
                     edge_id = self.draw_edge(node_circle_id)
-                    # Add the new edge to the graph
-                    self.graph.add_edge(self.source_node, node_circle_id, edge_id)
+                    # Add the new edge to the graph, and remove the line if the graph rejected the edge
+                    if self.graph.add_edge(self.source_node, node_circle_id, edge_id) is None:
+                        self.delete_item(edge_id)
                     # Remove the highlight from the source node
-                    self.canvas.itemconfigure(self.source_node_circle_id, fill='white')
+                    self.render_queue.configure(self.source_node_circle_id, fill='white')
                     # Reset the source node as none
                     self.source_node = None
                     self.source_node_circle_id = None
@@ -317,5 +551,10 @@ class LauncherWindow(tk.Tk):
         brooks_window.mainloop()
 
 
-launcher_window = LauncherWindow()
-launcher_window.mainloop()
+def main():
+    launcher_window = LauncherWindow()
+    launcher_window.mainloop()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,11 @@
 
+from AlgorithmStats import NULL_STATS, AlgorithmStats
+from DenseAdjacency import DenseAdjacency
 from GraphEdge import Edge
 from GraphNode import Node
-from typing import List, Set
+from RenderSink import NullRenderSink, RenderSink, TkRenderSink
+from SpatialGrid import SpatialGrid
+from typing import Dict, Iterable, List, Set, Tuple
 
 
 class Graph:
@@ -9,31 +13,76 @@ class Graph:
     The Graph class represents a mathematical graph structure.
     It contains a list of nodes (node_list) and a list of edges (edge_list)
     that connect the nodes in the graph.
+
+    Nodes are indexed by their id and edges by their unordered pair of endpoint ids,
+    so lookups and duplicate checks do not scan the whole graph. Node centres are also kept
+    in a spatial grid for hit-testing.
+
+    Once the graph has at least DENSE_MIN_NODES nodes and its density (the fraction of all node pairs
+    that are edges) reaches DENSE_THRESHOLD, it also keeps a DenseAdjacency in the dense attribute,
+    which the algorithms use for bitset adjacency tests. It is dropped again below half that density.
     """
 
-    def __init__(self, gui):
+    DENSE_THRESHOLD = 0.25
+    DENSE_MIN_NODES = 32
+
+    def __init__(self, gui=None, sink: RenderSink | None = None):
         """
         Initializes a graph object with an empty list of nodes and edges, and a reference to a graphical user interface (GUI).
 
-        :param gui: A graphical user interface for visualizing the graph.
+        :param gui: A graphical user interface for visualizing the graph, or None for a graph without a GUI.
+        :param sink: The render sink that shows coloring, directing and messages. By default it draws on the GUI,
+                     or nothing if there is no GUI.
         """
-        self.node_list: List[Node] = []  # List of all nodes in the graph
-        self.edge_list: List[Edge] = []  # List of all edges in the graph
+        self._nodes: Dict[int, Node] = {}  # Maps a node id to its node, in insertion order
+        self._edges: Dict[Tuple[int, int], Edge] = {}  # Maps an unordered pair of node ids to its edge
+        self._grid = SpatialGrid()  # Spatial index of the node centres
+        self._listeners = []  # Objects told about added edges and deleted nodes, such as an IncrementalMatching
+        self.dense: DenseAdjacency | None = None  # Bitset adjacency, kept while the graph is dense
         self.gui = gui  # Graphical user interface for visualizing the graph
+        if sink is None:
+            sink = TkRenderSink(gui) if gui is not None else NullRenderSink()
+        self.sink = sink  # Where coloring, directing and messages are sent
+        self.stats: AlgorithmStats = NULL_STATS  # Counts edge lookups and render calls, set by GAlgorithm.stats
+
+    @staticmethod
+    def _edge_key(source_id: int, dest_id: int) -> Tuple[int, int]:
+        """
+        Returns the key of the edge between two nodes, independent of the edge's direction.
+        """
+        return (source_id, dest_id) if source_id <= dest_id else (dest_id, source_id)
+
+    @property
+    def node_list(self) -> List[Node]:
+        """
+        All nodes in the graph, in the order they were added.
+        The list is copied from the node index on every access, in O(V), so it may be kept while the graph
+        changes but should not be read again inside a loop.
+
+        :return: A new list of the nodes.
+        """
+        return list(self._nodes.values())
+
+    @property
+    def edge_list(self) -> List[Edge]:
+        """
+        All edges in the graph, in the order they were added.
+        The list is copied from the edge index on every access, in O(E), like node_list.
+
+        :return: A new list of the edges.
+        """
+        return list(self._edges.values())
 
     def find_node_by_id_coords(self, target_id: int) -> tuple[float, float] | None:
-        for node in self.node_list:
-            if node.circle_id == target_id:
-                return node.x, node.y
-        return None
+        node = self._nodes.get(target_id)
+        if node is None:
+            return None
+        return node.x, node.y
 
     def find_node_by_id(self, target_id: int) -> Node | None:
-        for node in self.node_list:
-            if node.circle_id == target_id:
-                return node
-        return None
+        return self._nodes.get(target_id)
 
-    def add_node(self, circle_id: int, x: float, y: float, scale=1.0):
+    def add_node(self, circle_id: int, x: float, y: float, scale=1.0) -> Node | None:
         """
         Adds a new node to the graph.
 
@@ -41,97 +90,141 @@ class Graph:
         :param x: x-coordinate of the node.
         :param y: y-coordinate of the node.
         :param scale: Size scale factor of the node.
+        :return: The new node, or None if a node with the same identifier already exists.
         """
-        node = Node(x, y, circle_id)  # Create new node
-        node._radius = 20 * scale  # Set radius of the node according to scale
-        self.node_list.append(node)  # Add node to the list of nodes
+        # Replacing the node would leave the old one in the spatial index and its edges pointing at it
+        if circle_id in self._nodes:
+            return None
 
-    def add_edge(self, source_id: int, dest_id: int, edge_id: int):
+        node = Node(x, y, circle_id, 20 * scale)  # Create new node, with a radius according to scale
+        self._nodes[circle_id] = node  # Add node to the node index
+        self._grid.insert(node)  # Add node to the spatial index
+        return node
+
+    def add_edge(self, source_id: int, dest_id: int, edge_id: int, weight: float = 1.0) -> Edge | None:
         """
         Adds an edge between two nodes in the graph.
 
         :param source_id: The identifier of the source node.
         :param dest_id: The identifier of the destination node.
         :param edge_id: The unique identifier of the edge.
+        :param weight: The weight of the edge.
+        :return: The new edge, or None if the edge is a loop, a duplicate, or an endpoint does not exist.
         """
+        # Loops are not allowed.
+        if source_id == dest_id:
+            return None
+
         # Check if an edge already exists between the two nodes.
         # If it does, then do not add the edge and return.
-        for edge in self.edge_list:
-            if (edge.source == source_id and edge.dest == dest_id) or (
-                    edge.dest == source_id and edge.source == dest_id):
-                return
-
-        # Find the source and destination nodes in the node list.
-        source_node = None
-        dest_node = None
-        for node in self.node_list:
-            if node.circle_id == source_id:
-                source_node = node
-            elif node.circle_id == dest_id:
-                dest_node = node
+        key = self._edge_key(source_id, dest_id)
+        if key in self._edges:
+            return None
+
+        # Find the source and destination nodes in the node index.
+        source_node = self._nodes.get(source_id)
+        dest_node = self._nodes.get(dest_id)
 
         # If either node was not found, then return without adding the edge.
         if source_node is None or dest_node is None:
-            return
+            return None
 
         # Add each node as a neighbor to the other.
         source_node.add_neighbor(dest_node)
         dest_node.add_neighbor(source_node)
 
         # Create a new edge and add it to the edge list.
-        edge = Edge(source_node, dest_node, edge_id)
-        self.edge_list.append(edge)
-
-    def delete_node(self, node_id: Node) -> List[int] | None:
+        edge = Edge(source_node, dest_node, edge_id, weight)
+        self._edges[key] = edge
+        for listener in self._listeners:
+            listener.edge_added(edge)
+        self._update_dense()
+        return edge
+
+    def delete_node(self, node_id: int) -> List[int] | None:
         """
         Deletes a node from the graph, along with any edges connected to it.
 
         :param node_id: The identifier of the node to delete.
         :return: A list of the identifiers of the edges that were deleted, or None if the node was not found.
         """
-        # Find the node in the node list.
-        for node in self.node_list:
-            if node.circle_id == node_id:
-                # Inform the node's neighbors that it is being deleted.
-                node.inform_neighbors()
+        # Find the node in the node index.
+        node = self._nodes.get(node_id)
+        if node is None:
+            return None
 
-                # Find all edges connected to the node.
-                edges_to_remove = []
-                for edge in self.edge_list:
-                    if edge.source.circle_id == node_id or edge.dest.circle_id == node_id:
-                        edges_to_remove.append(edge)
+        # Remove the edges connected to the node from the edge index.
+        edges_to_remove = [self._edges.pop(self._edge_key(node_id, neighbor.circle_id))
+                           for neighbor in node.neighbors]
 
-                # Remove the edges from the edge list.
-                for edge in edges_to_remove:
-                    self.edge_list.remove(edge)
+        # Inform the node's neighbors that it is being deleted.
+        node.inform_neighbors()
 
-                # Get a list of the identifiers of the removed edges.
-                edge_ids = [edge.id for edge in edges_to_remove]
+        # Remove the node from the node index and the spatial index.
+        del self._nodes[node_id]
+        self._grid.remove(node)
 
-                # Remove the node from the node list.
-                self.node_list.remove(node)
+        for listener in self._listeners:
+            listener.node_deleted(node)
+        self._update_dense()
 
-                # Return the identifiers of the removed edges.
-                return edge_ids
-        return None
+        # Return the identifiers of the removed edges.
+        return [edge.id for edge in edges_to_remove]
+
+    @property
+    def density(self) -> float:
+        """
+        The fraction of all pairs of nodes that are joined by an edge.
+        """
+        n = len(self._nodes)
+        return 2 * len(self._edges) / (n * (n - 1)) if n > 1 else 0.0
+
+    def _update_dense(self):
+        """
+        Starts keeping the bitset adjacency when the graph becomes dense, and stops when it becomes sparse.
+        """
+        if self.dense is None:
+            if len(self._nodes) >= self.DENSE_MIN_NODES and self.density >= self.DENSE_THRESHOLD:
+                self.dense = DenseAdjacency(self._nodes.values())
+                self.add_listener(self.dense)
+        elif len(self._nodes) < self.DENSE_MIN_NODES or self.density < self.DENSE_THRESHOLD / 2:
+            self.remove_listener(self.dense)
+            self.dense = None
+
+    def add_listener(self, listener):
+        """
+        Registers an object to be told about changes to the graph. Its edge_added(edge) method is called
+        after an edge is added, and its node_deleted(node) method after a node and its edges are deleted.
+
+        :param listener: The object to register.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Unregisters an object registered with add_listener.
+
+        :param listener: The object to unregister.
+        """
+        self._listeners.remove(listener)
 
     def delete_graph(self):
-        if len(self.node_list) == 0:
-            return
         """
         Deletes the entire graph, including all nodes and edges.
         """
-        while self.node_list:
-            for node in self.node_list:
-                # Find the id of the node to delete
-                id_to_delete = node.circle_id
-                # Delete the node from the canvas
-                self.gui.canvas.delete(id_to_delete)
-                # Delete the node from the graph and get the list of edges to delete
-                edge_list = self.gui.graph.delete_node(id_to_delete)
-                # Delete each edge from the canvas
-                for edge in edge_list:
-                    self.gui.canvas.delete(edge)
+        if not self._nodes:
+            return
+        # node_list is a copy, so the nodes can be deleted while going through it
+        for node in self.node_list:
+            # Find the id of the node to delete
+            id_to_delete = node.circle_id
+            # Delete the node from the canvas
+            self.sink.delete_item(id_to_delete)
+            # Delete the node from the graph and get the list of edges to delete
+            edge_list = self.delete_node(id_to_delete)
+            # Delete each edge from the canvas
+            for edge in edge_list:
+                self.sink.delete_item(edge)
         self.print_in_gui("Delete graph")
 
     def find_node_in_radius(self, x: float, y: float) -> int:
@@ -142,16 +235,27 @@ class Graph:
         :param y: The y-coordinate to check.
         :return: The id of the node found within the radius, or -1 if no node is found.
         """
-        for node in self.node_list:
-            # Calculate the distance between the point and the node
-            distance = (x - node.x) ** 2 + (y - node.y) ** 2
-            # If the distance is within the node's radius, return the node's id
-            if distance <= node.radius ** 2:
-                return node.circle_id
+        node = self._grid.find(x, y)
         # No node was found within the radius
-        return -1
+        if node is None:
+            return -1
+        return node.circle_id
+
+    def zoom(self, center_x: float, center_y: float, factor: float):
+        """
+        Scales the positions and radii of all nodes around a center point, and updates the spatial index.
 
-    def find_edge(self, source_id: int, dest_id: int) -> Edge:
+        :param center_x: The x-coordinate of the center of the zoom.
+        :param center_y: The y-coordinate of the center of the zoom.
+        :param factor: The zoom factor.
+        """
+        for node in self._nodes.values():
+            node.x = (node.x - center_x) * factor + center_x
+            node.y = (node.y - center_y) * factor + center_y
+            node.radius *= factor
+        self._grid.rebuild(self._nodes.values())
+
+    def find_edge(self, source_id: int, dest_id: int) -> Edge | None:
         """
         Finds an edge between two nodes.
 
@@ -159,10 +263,18 @@ class Graph:
         :param dest_id: The id of the destination node.
         :return: The edge between the two nodes, or None if no edge exists.
         """
-        for edge in self.edge_list:
-            if (edge.source.circle_id == source_id and edge.dest.circle_id == dest_id) or (
-                    edge.dest.circle_id == source_id and edge.source.circle_id == dest_id):
-                return edge
+        self.stats.count('find_edge')
+        return self._edges.get(self._edge_key(source_id, dest_id))
+
+    def freeze(self):
+        """
+        Takes an immutable compressed-sparse-row snapshot of the graph for the array-based algorithms.
+        Later changes to the graph do not affect the snapshot.
+
+        :return: A GraphSnapshot of the graph.
+        """
+        from GraphSnapshot import GraphSnapshot  # NumPy is only needed once a snapshot is taken
+        return GraphSnapshot.from_graph(self)
 
     def color_edge(self, edge: Edge, color: str):
         """
@@ -171,7 +283,8 @@ class Graph:
         :param edge: The edge to color.
         :param color: The color to use.
         """
-        self.gui.color_edge(edge.id, color)
+        self.stats.count('render_calls')
+        self.sink.color_edge(edge.id, color)
 
     def color_node(self, node: Node, color: str):
         """
@@ -180,7 +293,8 @@ class Graph:
         :param node: The node to color.
         :param color: The color to use.
         """
-        self.gui.color_node(node.circle_id, color)
+        self.stats.count('render_calls')
+        self.sink.color_node(node.circle_id, color)
 
     def color_node_outline(self, node: Node, color: str):
         """
@@ -189,15 +303,34 @@ class Graph:
         :param node: The node whose outline to color.
         :param color: The color to use.
         """
-        self.gui.color_node_outline(node.circle_id, color)
+        self.stats.count('render_calls')
+        self.sink.color_node_outline(node.circle_id, color)
 
     def direct_graph(self, matching: Set[Edge]):
         """
-        Directs the graph according to a given matching.
+        Shows the direction of every edge, after the edges have been oriented according to a given matching.
 
-        :param matching: The matching to use to direct the graph.
+        :param matching: The matching the graph was directed by.
         """
-        self.gui.direct_graph(matching, self.edge_list)
+        self.stats.count('render_calls')
+        self.sink.direct_edges(self._edges.values())
+
+    def direct_edges(self, edges: Iterable[Edge]):
+        """
+        Shows the direction of some of the edges, after they have been re-oriented.
+
+        :param edges: The edges to show.
+        """
+        self.stats.count('render_calls')
+        self.sink.direct_edges(edges)
 
     def print_in_gui(self, string: str):
-        self.gui.print_to_gui(string)
+        self.stats.count('render_calls')
+        self.sink.print_message(string)
+
+    @property
+    def rendering(self) -> bool:
+        """
+        Whether the render sink draws anything. Visualization work can be skipped when it does not.
+        """
+        return self.sink.active
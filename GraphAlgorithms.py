@@ -1,61 +1,132 @@
 from GraphNode import Node
 import Graph
 from GraphEdge import Edge
-from typing import Dict, Set, List, Any
-import time
+from Matching import edmonds_matching, hopcroft_karp
+import BrooksColoring
+import Coloring
+from Biconnectivity import BlockCutTree, biconnected_components, block_cut_tree
+from Traversal import bfs, bfs_csr
+from AlgorithmStats import NULL_STATS, AlgorithmStats
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Dict, Iterator, Set, List, Any, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from GraphSnapshot import GraphSnapshot
+    from IncrementalMatching import IncrementalMatching
+
+_neighbors = attrgetter('neighbors')  # The neighbor function of the object graph, for the traversals in Traversal
 
 
 class GAlgorithm:
     # Initialize the graph algorithm with a graph
     def __init__(self, graph):
         self.graph = graph
+        self.matching: Set[Edge] = set()  # The matching found by the last matching algorithm run
+        self.stats = NULL_STATS
+
+    @property
+    def stats(self) -> AlgorithmStats:
+        """
+        Where the runs report the time of their phases and their operation counts, NULL_STATS when
+        they are not instrumented. The graph reports its edge lookups and render calls to the same object.
+        """
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: AlgorithmStats | None):
+        self._stats = self.graph.stats = stats if stats is not None else NULL_STATS
+
+    @contextmanager
+    def instrumented(self, stats: AlgorithmStats | None = None) -> Iterator[AlgorithmStats]:
+        """
+        Instruments the runs inside a with block:
+
+            with algos.instrumented() as stats:
+                algos.brooks_algorithm(graph, 0)
+            print(stats.to_json())
+
+        :param stats: The stats to record to, new ones if None.
+        """
+        previous = self.stats
+        self.stats = stats if stats is not None else AlgorithmStats()
+        try:
+            yield self.stats
+        finally:
+            self.stats = previous
+
+    def _pause(self, delay: float):
+        """
+        Ends a visualization step, see RenderSink.pause. Nothing is shown when the graph is not rendering,
+        so there is no wait.
+        """
+        if self.graph.rendering:
+            self.graph.sink.pause(delay)
 
-    def is_bipartite(self) -> bool:
+    def is_bipartite(self, snapshot: 'GraphSnapshot | None' = None) -> bool:
         """
         Checks whether a graph is bipartite. A graph is bipartite if its nodes can be divided
         into two groups such that all edges go from a node in one group to a node in the other group.
+        The check runs at array speed on a snapshot, see Bipartiteness.
 
+        :param snapshot: If given, the check runs on this snapshot and does not tag the nodes.
+                         Otherwise the nodes are tagged with their group when the graph is bipartite.
         :return: True if the graph is bipartite, False otherwise.
         """
-        node_list = self.graph.node_list
-        uncolored, red, blue = 0, 1, 2
-
-        # Initialize all nodes to uncolored
-        node_colors = {node: uncolored for node in node_list}
-
-        # For each uncolored node, try to color it and its neighbors in alternating colors.
-        for node in node_list:
-            if node_colors[node] == uncolored:
-                if not self._bfs_coloring(node, node_colors):
-                    return False
+        if snapshot is not None:
+            return self.bipartition(snapshot) is not None
 
+        sides, _ = self._two_coloring(self.graph.freeze())
+        if sides is None:
+            return False
         # If successfully colored, tag the nodes as per their color
-        self._tag(node_colors)
+        self._tag(dict(zip(self.graph.node_list, sides.tolist())))
         return True
 
-    def _bfs_coloring(self, node: Node, node_colors: Dict[Node, int]) -> bool:
+    def bipartition(self, snapshot: 'GraphSnapshot') -> bytearray | None:
         """
-        Colors nodes in BFS fashion, alternating between two colors. If a neighbor has the same color,
-        it indicates the graph is not bipartite.
+        Colors the vertices of a snapshot with two colors so that every edge joins two colors.
 
-        :param node: Node from which BFS starts.
-        :param node_colors: Dictionary to store color assignments for each node.
-        :return: True if the nodes can be colored such that no two adjacent nodes have the same color,
-                 False otherwise.
+        :param snapshot: The snapshot to color.
+        :return: The color (1 or 2) of each vertex, or None if the graph is not bipartite.
         """
-        node_colors[node] = 1
-        queue = [node]
+        sides, _ = self._two_coloring(snapshot)
+        return None if sides is None else bytearray(sides.tobytes())
 
-        while queue:
-            current = queue.pop(0)
+    def odd_cycle(self, snapshot: 'GraphSnapshot | None' = None) -> List[Node] | List[int] | None:
+        """
+        Finds an odd cycle, which proves that the graph is not bipartite.
 
-            for neighbor in current.neighbors:
-                if node_colors[neighbor] == 0:
-                    node_colors[neighbor] = 3 - node_colors[current]
-                    queue.append(neighbor)
-                elif node_colors[neighbor] == node_colors[current]:
-                    return False
-        return True
+        :param snapshot: If given, the cycle is searched in this snapshot and given as vertex indices.
+        :return: The nodes of the cycle in order, or None if the graph is bipartite.
+        """
+        frozen = snapshot if snapshot is not None else self.graph.freeze()
+        _, cycle = self._two_coloring(frozen)
+        if cycle is None or snapshot is not None:
+            return cycle
+        node_list = self.graph.node_list
+        return [node_list[v] for v in cycle]
+
+    def _two_coloring(self, snapshot: 'GraphSnapshot') -> tuple[Any, List[int] | None]:
+        """
+        Runs Bipartiteness.two_coloring on the arrays of a snapshot.
+        """
+        from Bipartiteness import two_coloring  # NumPy is only needed once a snapshot is taken
+
+        with self.stats.phase('bipartite_check'):
+            return two_coloring(snapshot.indptr, snapshot.indices)
+
+    def _show_odd_cycle(self, snapshot: 'GraphSnapshot', cycle: List[int]):
+        """
+        Tells the user which odd cycle keeps the graph from being bipartite, and marks it on the graph.
+        """
+        nodes = [self.graph.find_node_by_id(snapshot.circle_id(v)) for v in cycle]
+        self.graph.print_in_gui(f"The graph is not bipartite, it has an odd cycle of length {len(cycle)} "
+                                f"marked in orange: {' - '.join(str(node.circle_id) for node in nodes)}.")
+        if self.graph.rendering:
+            for node, following in zip(nodes, nodes[1:] + nodes[:1]):
+                self.graph.color_node_outline(node, 'orange')
+                self.graph.color_edge(self.graph.find_edge(node.circle_id, following.circle_id), 'orange')
 
     def _tag(self, node_colors: Dict[Node, int]):
         """
@@ -69,69 +140,189 @@ class GAlgorithm:
             else:
                 node.group = 'B'
 
-    def hungarian_algorithm(self, delay: int) -> bool:
+    def hungarian_algorithm(self, delay: int, snapshot: 'GraphSnapshot | None' = None) -> bool:
         """
         Executes the Hungarian Algorithm which is also known as Kuhn-Munkres Algorithm.
         It is used to find the maximum matching in a bipartite graph which in turn helps
         to solve the assignment problem. The algorithm guarantees to find the optimum solution
         for the assignment problem.
 
+        The matching is computed by the Hopcroft-Karp engine in Matching. When the graph is rendering,
+        each augmenting path is shown as it is applied.
+
         :param delay: Time delay (in seconds) between operations for better visualization.
+        :param snapshot: If given, the matching is computed on this snapshot. Augmenting paths and the
+                         matching are still colored on the graph, but edge directions are not drawn.
         :return: True if the graph is bipartite and the algorithm succeeds, False otherwise.
+                 The matching that was found is kept in self.matching.
         """
         # Ensure the graph is bipartite before processing
-        if not self.is_bipartite():
+        frozen = snapshot if snapshot is not None else self.graph.freeze()
+        node_colors, cycle = self._two_coloring(frozen)
+        if node_colors is None:
             self.graph.print_in_gui("The graph is not bipartite, the algorithm can not run.")
+            self._show_odd_cycle(frozen, cycle)
             return False
+        if snapshot is None:
+            self._tag(dict(zip(self.graph.node_list, node_colors.tolist())))
 
         self.graph.print_in_gui("The graph is bipartite, the algorithm can run.")
-        # Initialize data structures
-        node_list: List[Node] = self.graph.node_list
-        group_b = {node for node in node_list if node.group == 'B'}
+        # Initialize data structures; a fresh snapshot numbers the nodes and edges like the graph's lists
+        indptr, indices, adj_edges = frozen.as_lists()
+        left = [color == 1 for color in node_colors.tolist()]
+        if snapshot is None:
+            edges: List[Edge] = self.graph.edge_list
+        else:
+            edges = [self.graph.find_edge(snapshot.circle_id(source), snapshot.circle_id(dest))
+                     for source, dest in zip(snapshot.edge_source.tolist(), snapshot.edge_dest.tolist())]
         matching = set()  # Tracks the current matching
-        nodes_in_matching = set()  # Tracks the nodes involved in the matching
-
-        # Orient the graph properly for the matching algorithm
-        self._direct_graph(matching)
-
-        # Main loop of the algorithm
-        while True:
-            flag = False
-            for node in node_list:
-                if node not in nodes_in_matching and node.group == 'A':
-                    candidate_matching = self.find_augmenting_path_bfs(node, group_b.difference(nodes_in_matching))
-                    if candidate_matching is None:
-                        continue
-
-                    # Filter out edges from the current matching that are in the augmenting path
-                    filtered = set()
-                    for edge in matching:
-                        if edge not in candidate_matching:
-                            filtered.add(edge)
-                        else:
-                            nodes_in_matching.remove(edge.source)
-                            nodes_in_matching.remove(edge.dest)
-
-                    # Update the matching with the augmenting path
-                    self.color_path(set(candidate_matching), matching)
-                    time.sleep(delay)
-                    candidate_matching = set(candidate_matching[::2])
-                    matching = filtered.union(candidate_matching)
-                    self._direct_graph(matching)
-                    self.color_matching(matching)
-                    for edge in matching:
-                        nodes_in_matching.add(edge.source)
-                        nodes_in_matching.add(edge.dest)
-                    time.sleep(delay)
-                    flag = True
-            if flag is False:
-                break
 
+        on_augment = None
+        if self.graph.rendering:
+            if snapshot is None:
+                # Orient the graph properly for the matching algorithm
+                self._direct_graph(matching)
+
+            def on_augment(path: List[int]):
+                self._show_augmentation([edges[k] for k in path], matching, delay, snapshot is None)
+
+        with self.stats.phase('matching'):
+            mate, mate_edge = hopcroft_karp(indptr, indices, adj_edges, left, on_augment, self.stats)
+
+        matching = {edges[mate_edge[v]] for v in range(len(left)) if left[v] and mate_edge[v] != -1}
         self.color_matching(matching)
+        self.matching = matching
         return True
 
+    def blossom_matching(self, delay: int, snapshot: 'GraphSnapshot | None' = None) -> Set[Edge]:
+        """
+        Finds a maximum matching in any graph, bipartite or not, with Edmonds' blossom algorithm
+        from Matching. When the graph is rendering, each augmenting path is shown as it is applied,
+        like in hungarian_algorithm; edges are not directed, as there are no groups to direct them between.
+
+        :param delay: Time delay (in seconds) between operations for better visualization.
+        :param snapshot: If given, the matching is computed on this snapshot and colored on the graph.
+        :return: The edges of the matching, which is also kept in self.matching.
+        """
+        frozen = snapshot if snapshot is not None else self.graph.freeze()
+        indptr, indices, adj_edges = frozen.as_lists()
+        if snapshot is None:
+            edges: List[Edge] = self.graph.edge_list
+        else:
+            edges = [self.graph.find_edge(snapshot.circle_id(source), snapshot.circle_id(dest))
+                     for source, dest in zip(snapshot.edge_source.tolist(), snapshot.edge_dest.tolist())]
+        matching = set()
+
+        on_augment = None
+        if self.graph.rendering:
+            def on_augment(path: List[int]):
+                self._show_augmentation([edges[k] for k in path], matching, delay, False)
+
+        with self.stats.phase('matching'):
+            mate, mate_edge = edmonds_matching(indptr, indices, adj_edges, on_augment, self.stats)
+
+        matching = {edges[mate_edge[v]] for v in range(len(mate)) if mate[v] > v}
+        self.color_matching(matching)
+        self.graph.print_in_gui(f"Found a maximum matching of {len(matching)} edges.")
+        self.matching = matching
+        return matching
+
+    def maintain_matching(self) -> 'IncrementalMatching':
+        """
+        Attaches a matching to the graph that is repaired locally after every added edge and deleted node,
+        instead of being recomputed by hungarian_algorithm. It starts from self.matching if it is set.
+
+        :return: The attached matching. Its matching attribute holds the current matching edges.
+        """
+        from IncrementalMatching import IncrementalMatching
+        return IncrementalMatching(self.graph, self.matching)
+
+    def weighted_assignment(self, delay: int = 0) -> tuple[Set[Edge], float] | None:
+        """
+        Solves the assignment problem on a weighted bipartite graph with the Kuhn-Munkres algorithm:
+        finds a maximum matching whose total edge weight is minimal among all maximum matchings.
+        The nodes of group A are the rows of a dense cost matrix and those of group B its columns,
+        with an infinite cost where there is no edge.
+
+        :param delay: Time delay (in seconds) before the result is shown.
+        :return: The matching and its total weight, or None if the graph is not bipartite.
+                 The matching is also kept in self.matching.
+        """
+        from Assignment import kuhn_munkres  # NumPy is only needed for weighted problems
+
+        if not self.is_bipartite():
+            self.graph.print_in_gui("The graph is not bipartite, the algorithm can not run.")
+            return None
+
+        node_list = self.graph.node_list
+        rows = {node: i for i, node in enumerate(node for node in node_list if node.group == 'A')}
+        columns = {node: j for j, node in enumerate(node for node in node_list if node.group == 'B')}
+        cost = [[float('inf')] * len(columns) for _ in rows]
+        edge_at = {}
+        for edge in self.graph.edge_list:
+            a, b = (edge.source, edge.dest) if edge.source.group == 'A' else (edge.dest, edge.source)
+            cost[rows[a]][columns[b]] = edge.weight
+            edge_at[rows[a], columns[b]] = edge
+
+        assignment, total = kuhn_munkres(cost)
+        matching = {edge_at[row, column] for row, column in enumerate(assignment) if column != -1}
+
+        self._pause(delay)
+        self.color_matching(matching)
+        self.graph.print_in_gui(f"Found an assignment of {len(matching)} pairs with a total cost of {total:g}.")
+        self.matching = matching
+        return matching, total
+
+    def _adjacency_lists(self, node_list: List[Node], edge_list: List[Edge]) -> tuple[List[int], List[int], List[int]]:
+        """
+        Builds the CSR lists used by the engines in Matching, numbering the nodes and edges by their list positions.
+        """
+        node_index = {node: i for i, node in enumerate(node_list)}
+        neighbors = [[] for _ in node_list]
+        incident = [[] for _ in node_list]
+        for k, edge in enumerate(edge_list):
+            source, dest = node_index[edge.source], node_index[edge.dest]
+            neighbors[source].append(dest)
+            incident[source].append(k)
+            neighbors[dest].append(source)
+            incident[dest].append(k)
+
+        indptr, indices, adj_edges = [0], [], []
+        for i in range(len(node_list)):
+            indices.extend(neighbors[i])
+            adj_edges.extend(incident[i])
+            indptr.append(len(indices))
+        return indptr, indices, adj_edges
+
+    def _show_augmentation(self, path: List[Edge], matching: Set[Edge], delay: int, direct: bool):
+        """
+        Shows an augmenting path and then applies it to the matching. Only the edges of the path change,
+        so only they are recolored and, if direct is True, re-oriented.
+        Blue: Edges in the augmenting path but not in the matching.
+        Yellow: Edges in both the augmenting path and the matching.
+        """
+        for edge in path:
+            self.graph.color_edge(edge, 'yellow' if edge in matching else 'blue')
+        self._pause(delay)
+
+        for edge in path:
+            if edge in matching:
+                matching.remove(edge)
+                self.graph.color_edge(edge, 'black')
+            else:
+                matching.add(edge)
+                self.graph.color_edge(edge, 'red')
+            if direct:
+                # Matched edges go from group B to group A and the others the other way, so every edge of the path flips
+                edge.swap()
+        if direct:
+            self.graph.direct_edges(path)
+        self._pause(delay)
+
     def color_matching(self, matching: set[Node]):
         """Colors the edges in the matching set to red and the others to black."""
+        if not self.graph.rendering:
+            return
         for edge in self.graph.edge_list:
             # If edge is part of the matching, color it red
             if edge in matching:
@@ -148,6 +339,8 @@ class GAlgorithm:
         Red: Edges in the matching but not in the augmenting path.
         Black: Edges not in the augmenting path or the matching.
         """
+        if not self.graph.rendering:
+            return
         for edge in self.graph.edge_list:
             if edge in path and edge not in matching:
                 self.graph.color_edge(edge, 'blue')
@@ -161,45 +354,30 @@ class GAlgorithm:
     def find_augmenting_path_bfs(self, node: Node, end_group: Set[Node]) -> list[Any] | None:
         """
         Breadth-first search (BFS) to find an augmenting path from a node in group A to a node in group B
-        which is not currently part of the matching.
+        which is not currently part of the matching. Edges are only followed from their source to their destination.
+        Among the nodes of end_group that are reached, the path to the first one at the largest distance is returned.
         """
-        visited = set()
-
-        # Start BFS with the starting node and an empty path
-        queue = [(node, list())]
-        visited.add(node)
-
-        max_path = []
-        max_length = 0
-
-        # BFS main loop
-        while queue:
-            # Get current node and the path to reach it
-            current_node, path = queue.pop(0)
+        def forward(current: Node) -> List[Node]:
+            return [neighbor for neighbor in current.neighbors
+                    if self.graph.find_edge(current.circle_id, neighbor.circle_id).dest is neighbor]
 
+        parent = {}
+        level = {}
+        end, max_length = None, 0
+        for current in bfs([node], forward, parent, level):
             # If the current node is in the end group, check if it forms a longer augmenting path
-            if current_node in end_group:
-                if len(path) > max_length:
-                    max_path = path
-                    max_length = len(path)
-
-            # Visit the neighbors of the current node
-            for neighbor in current_node.neighbors:
-                if neighbor not in visited:
-                    edge = self.graph.find_edge(current_node.circle_id, neighbor.circle_id)
-                    if edge.dest is not neighbor:
-                        continue
-                    # Mark the neighbor as visited
-                    visited.add(neighbor)
-                    # Create a new path by appending the neighbor to the current path
-                    new_path = path.copy()
-                    new_path.append(edge)
-                    queue.append((neighbor, new_path))
+            if current in end_group and level[current] > max_length:
+                end, max_length = current, level[current]
 
         # If no augmenting path is found, return None
-        if not max_path:
+        if end is None:
             return None
-        return max_path
+        # Follow the parents back to the start, so only the returned path is built
+        path = []
+        while parent[end] is not None:
+            path.append(self.graph.find_edge(parent[end].circle_id, end.circle_id))
+            end = parent[end]
+        return path[::-1]
 
     def _direct_graph(self, matching: Set[Edge]):
         """
@@ -222,30 +400,21 @@ class GAlgorithm:
         # Direct the graph using the matching
         self.graph.direct_graph(matching)
 
-    def bfs_spanning_tree(self, node: Node) -> List[Node]:
+    def bfs_spanning_tree(self, node: Node | int, snapshot: 'GraphSnapshot | None' = None) -> List[Node] | List[int]:
         """
         Creates a spanning tree using a breadth-first search (BFS) starting from a given node.
+        If a snapshot is given, node is a vertex index and the vertex indices are returned.
+
+        :return: The vertices of the tree in BFS order.
         """
-        visited = set()
-        # Begin with a queue that only contains the starting node
-        queue = [node]
-        vertices_list = []
-
-        while queue:
-            vertex = queue.pop(0)
-            # If the vertex has not been visited before
-            if vertex not in visited:
-                # Mark the vertex as visited
-                visited.add(vertex)
-                # Add the vertex to the vertices list
-                vertices_list.append(vertex)
-                # Add all neighbors of the vertex to the queue
-                for node in vertex.neighbors:
-                    if node not in visited:
-                        queue.append(node)
-
-        # Return list of visited vertices, forming a spanning tree
-        return vertices_list
+        with self.stats.phase('spanning_tree'):
+            if snapshot is not None:
+                indptr, indices, _ = snapshot.as_lists()
+                tree = list(bfs_csr(indptr, indices, [node], [-1] * snapshot.vertex_count))
+            else:
+                tree = list(bfs([node], _neighbors))
+        self.stats.count('bfs_expansions', len(tree))
+        return tree
 
     def max_min_degree(self, node_list: List[Node]) -> tuple[Node, Node]:
         """
@@ -284,131 +453,200 @@ class GAlgorithm:
         """
         Checks if the graph is an odd cycle.
         """
+        node_list = graph.node_list
+        if not node_list or any(len(node.neighbors) != 2 for node in node_list):
+            return False
 
-        if all(len(node.neighbors) == 2 for node in graph.node_list):
-            start_node = graph.node_list[0]
-            visited = set()
-            cycle_length = 1
-
-            while start_node not in visited:
-                visited.add(start_node)
-                next_nodes = list(set(start_node.neighbors) - visited)
-
-                if not next_nodes:  # If all neighbors have been visited, break the loop
-                    break
-
-                start_node = next_nodes[0]  # Otherwise, visit the next unvisited node
-                cycle_length += 1
-
-            return cycle_length % 2 == 1
+        # Walk around the cycle through the start node, never stepping back to the previous node
+        start_node = node_list[0]
+        previous, node = start_node, start_node.neighbors[0]
+        cycle_length = 1
+        while node is not start_node:
+            first, second = node.neighbors
+            previous, node = node, (second if first is previous else first)
+            cycle_length += 1
 
-        return False
+        # The graph is a single cycle only if the walk went through all the nodes
+        return cycle_length == len(node_list) and cycle_length % 2 == 1
 
     def is_complete_graph(self, graph: Graph) -> bool:
-        total_nodes = len(graph.node_list)
+        """
+        Checks if every two nodes of the graph are adjacent. With the bitset adjacency the degrees are
+        popcounts of the rows, so repeated edges are not counted twice.
+        """
+        node_list = graph.node_list
+        total_nodes = len(node_list)
+        dense = graph.dense
+        if dense is not None:
+            return all(dense.degree(node) == total_nodes - 1 for node in node_list)
 
-        return all(len(node.neighbors) == total_nodes - 1 for node in graph.node_list)
+        return all(len(node.neighbors) == total_nodes - 1 for node in node_list)
 
-    def greedy_coloring(self, vertices_list: List[Node], delay: int):
+    def greedy_coloring(self, vertices_list: List[Node] | List[int], delay: int,
+                        snapshot: 'GraphSnapshot | None' = None, colors: List[int] | None = None,
+                        hidden: Node | int | None = None) -> List[int] | None:
         """
         Applies the greedy coloring algorithm to the graph.
-        It colors the vertices in the order they appear in the vertices list.
-        """
-        max_color_index = 0
-        for v in vertices_list:
-            if v.color == -1:  # If the vertex is not colored yet
-                available_colors = set(range(max_color_index + 1))  # Define the available colors
-
-                for neighbor in v.neighbors:  # Check the neighbors of the vertex
-                    if neighbor.color in available_colors:  # If a color is used by a neighbor, remove it from the available colors
-                        available_colors.remove(neighbor.color)
-
-                if not available_colors:  # If no colors are available
-                    max_color_index = max_color_index + 1  # Add a new color
-                    v.color = max_color_index  # Assign the new color to the vertex
-                    tkinter_color = self.index_to_rgb(max_color_index)  # Convert the color to tkinter color
-                    self.graph.color_node(v, tkinter_color)  # Apply the color
-                else:  # If there are available colors
-                    min_available_color_index = min(available_colors)  # Choose the smallest color
-                    v.color = min_available_color_index  # Assign the color to the vertex
-                    tkinter_color = self.index_to_rgb(min_available_color_index)  # Convert the color to tkinter color
-                    self.graph.color_node(v, tkinter_color)  # Apply the color
-            time.sleep(delay)  # Sleep for the defined delay
-
-    def greedy_coloring2(self, vertices_list: List[Node],vertex_cut: Node, delay: int):
-        """
-        Applies the greedy coloring algorithm to the graph.
-        It colors the vertices in the order they appear in the vertices list.
-        """
-        max_color_index = 0
-        for v in vertices_list:
-            if v.color == -1:  # If the vertex is not colored yet
-                available_colors = set(range(max_color_index + 1))  # Define the available colors
-
-                for neighbor in v.neighbors:  # Check the neighbors of the vertex
-                    if neighbor.color in available_colors:  # If a color is used by a neighbor, remove it from the available colors
-                        available_colors.remove(neighbor.color)
-
-                if not available_colors:  # If no colors are available
-                    max_color_index = max_color_index + 1  # Add a new color
-                    v.color = max_color_index  # Assign the new color to the vertex
-                    if v != vertex_cut:
-                        tkinter_color = self.index_to_rgb(max_color_index)  # Convert the color to tkinter color
-                        self.graph.color_node(v, tkinter_color)  # Apply the color
-                else:  # If there are available colors
-                    min_available_color_index = min(available_colors)  # Choose the smallest color
-                    v.color = min_available_color_index  # Assign the color to the vertex
-                    if v != vertex_cut:
-                        tkinter_color = self.index_to_rgb(min_available_color_index)  # Convert the color to tkinter color
-                        self.graph.color_node(v, tkinter_color)  # Apply the color
-
-            time.sleep(delay)  # Sleep for the defined delay
-
-    def dfs_vertex_cut(self, v: Node, discovery: Dict[Node, int], low: Dict[Node, int], parent: Dict[Node, Node],
-                       articulation_point: Dict[Node, bool], vertex_list: List[Node], time_: int) -> int:
-        """
-        Applies Depth-first Search (DFS) to find cut vertices (also known as articulation points) in the graph.
-        """
-        discovery[v] = low[v] = time_  # Initialize discovery and low time of v
-        time_ += 1
-        children = 0  # Initialize child counter
-
-        for u in v.neighbors:  # For each neighbor u of v
-            if discovery[u] == -1:  # If u is not visited yet, then recur for it
-                children += 1
-                parent[u] = v
-                time_ = self.dfs_vertex_cut(u, discovery, low, parent, articulation_point, vertex_list, time_)
-                low[v] = min(low[v],
-                             low[u])  # Check if the subtree rooted with u has a connection to one of the ancestors of v
-
-                if parent[v] is None and children > 1:  # If v is not root and low value of one of its child is more than discovery value of v
-                    articulation_point[v] = True
-                elif parent[v] is not None and low[u] >= discovery[v]:  # If v is not root and low value of one of its child is more than discovery value of v
-                    articulation_point[v] = True
-
-            elif u != parent[v]:  # Update low value of v for parent function calls.
-                low[v] = min(low[v], discovery[u])
-
-        return time_
-
-    def tarjan_algorithm_cut_vertex(self, vertex_list: List[Node]) -> Any | None:
-        """
-        Implements Tarjan's algorithm to find cut vertices in the graph.
-        """
-        discovery = {vertex: -1 for vertex in vertex_list}  # Initialize lists
-        low = {vertex: -1 for vertex in vertex_list}
-        parent = {vertex: None for vertex in vertex_list}
-        articulation_point = {vertex: False for vertex in vertex_list}
-
-        time_ = 0
-        for vertex in vertex_list:  # Do DFS traversal
-            if discovery[vertex] == -1:
-                time_ = self.dfs_vertex_cut(vertex, discovery, low, parent, articulation_point, vertex_list, time_)
-
-        for node, is_articulation_point in articulation_point.items():  # Check if vertex is an articulation point
-            if is_articulation_point:
-                return node
-        return None
+        It colors the vertices in the order they appear in the vertices list, each with the smallest color
+        not used by its neighbors. Vertices that are already colored keep their color.
+        If a snapshot is given, the vertices are vertex indices and the colors are kept in the colors list
+        (a new one if None) instead of on the nodes.
+
+        :param hidden: A vertex that is colored but not shown, such as the cut vertex in Brooks' algorithm.
+        :return: The colors list if a snapshot is given, None otherwise.
+        """
+        with self.stats.phase('coloring'):
+            if snapshot is not None:
+                if colors is None and len(vertices_list) == snapshot.vertex_count == len(set(vertices_list)):
+                    # Coloring every vertex from scratch gives the same result in NumPy batches, see BatchColoring
+                    from BatchColoring import greedy_color_batched
+                    colors = greedy_color_batched(snapshot.indptr, snapshot.indices, vertices_list).tolist()
+                else:
+                    indptr, indices, _ = snapshot.as_lists()
+                    colors = Coloring.greedy_color(indptr, indices, vertices_list, colors)
+                node_of = lambda v: self.graph.find_node_by_id(snapshot.circle_id(v))
+                color_of = colors.__getitem__
+            else:
+                dense = self.graph.dense
+                if dense is not None:
+                    # Keep each color class as a bitset; a color is free if its class misses the vertex's row
+                    classes: List[int] = []
+                    for node in self.graph.node_list:
+                        if node.color != -1:
+                            classes.extend([0] * (node.color + 1 - len(classes)))
+                            classes[node.color] |= dense.bit(node)
+                    for v in vertices_list:
+                        if v.color == -1:  # If the vertex is not colored yet
+                            row = dense.row(v)
+                            color = 0  # Choose the smallest color that is not used
+                            while color < len(classes) and classes[color] & row:
+                                color += 1
+                            if color == len(classes):
+                                classes.append(0)
+                            classes[color] |= dense.bit(v)
+                            v.color = color
+                else:
+                    # The colors of the neighbors are marked in one array, with the position of the vertex as stamp.
+                    # It holds every color already given, and every new one, which is at most the node count
+                    node_list = self.graph.node_list
+                    used = [-1] * (max(len(node_list), max((node.color for node in node_list), default=-1)) + 1)
+                    for i, v in enumerate(vertices_list):
+                        if v.color == -1:  # If the vertex is not colored yet
+                            for neighbor in v.neighbors:
+                                if neighbor.color != -1:
+                                    used[neighbor.color] = i
+                            color = 0  # Choose the smallest color that is not used
+                            while used[color] == i:
+                                color += 1
+                            v.color = color
+                node_of = lambda v: v
+                color_of = attrgetter('color')
+
+        if self.graph.rendering:
+            for v in vertices_list:
+                if v != hidden:
+                    self.graph.color_node(node_of(v), self.index_to_rgb(color_of(v)))  # Apply the color
+                self._pause(delay)  # Sleep for the defined delay
+        return colors
+
+    def greedy_coloring2(self, vertices_list: List[Node] | List[int], vertex_cut: Node | int, delay: int,
+                         snapshot: 'GraphSnapshot | None' = None, colors: List[int] | None = None) -> List[int] | None:
+        """
+        Applies the greedy coloring algorithm to the graph like greedy_coloring, without showing the color of the cut vertex.
+        """
+        return self.greedy_coloring(vertices_list, delay, snapshot, colors, hidden=vertex_cut)
+
+    def color_graph(self, strategy: str = 'natural', delay: int = 0,
+                    snapshot: 'GraphSnapshot | None' = None) -> List[int]:
+        """
+        Colors the whole graph greedily, in the vertex order given by a strategy from Coloring.STRATEGIES:
+        'natural', 'bfs', 'welsh-powell', 'smallest-last' or 'dsatur'.
+        If a snapshot is given, the graph is read from it and the colors are returned by vertex index.
+
+        :return: The color of each node, in the order of graph.node_list or by snapshot vertex index.
+        """
+        if snapshot is not None:
+            indptr, indices, _ = snapshot.as_lists()
+            node_of = lambda v: self.graph.find_node_by_id(snapshot.circle_id(v))
+        else:
+            node_list = self.graph.node_list
+            indptr, indices, _ = self._adjacency_lists(node_list, self.graph.edge_list)
+            node_of = node_list.__getitem__
+
+        with self.stats.phase('coloring'):
+            colors, order = Coloring.color_graph(indptr, indices, strategy)
+        if snapshot is None:
+            for node, color in zip(node_list, colors):
+                node.color = color
+
+        if self.graph.rendering:
+            for v in order:
+                self.graph.color_node(node_of(v), self.index_to_rgb(colors[v]))
+                self._pause(delay)
+        self.graph.print_in_gui(f"The {strategy} ordering colored the graph with {max(colors, default=-1) + 1} colors.")
+        return colors
+
+    def parallel_coloring(self, workers: int = 2, snapshot: 'GraphSnapshot | None' = None) -> tuple[List[int], Dict[str, Any]]:
+        """
+        Colors the whole graph with speculative greedy coloring on a pool of worker processes, see ParallelColoring.
+        The graph is frozen into a snapshot first, unless one is given.
+
+        :param workers: The number of worker processes.
+        :return: The color of each node, in the order of graph.node_list or by snapshot vertex index, and a report
+                 comparing the number of colors used with sequential greedy coloring.
+        """
+        from ParallelColoring import parallel_color
+
+        frozen = snapshot if snapshot is not None else self.graph.freeze()
+        with self.stats.phase('coloring'):
+            colors, report = parallel_color(frozen.indptr, frozen.indices, workers, compare=True)
+        colors = colors.tolist()
+        if snapshot is None:
+            for node, color in zip(self.graph.node_list, colors):
+                node.color = color
+        if self.graph.rendering:
+            for v, color in enumerate(colors):
+                self.graph.color_node(self.graph.find_node_by_id(frozen.circle_id(v)), self.index_to_rgb(color))
+        self.graph.print_in_gui(f"Colored the graph with {report['colors']} colors in {report['rounds']} rounds on "
+                                f"{workers} workers, sequential greedy coloring uses {report['sequential_colors']}.")
+        return colors, report
+
+    def biconnected_components(self, snapshot: 'GraphSnapshot | None' = None) -> BlockCutTree:
+        """
+        Finds all articulation points, bridges and biconnected components (blocks) of the graph,
+        and its block-cut tree, with one iterative Hopcroft-Tarjan pass in O(V + E).
+        If a snapshot is given, the vertices of the result are vertex indices, otherwise they are nodes.
+        """
+        with self.stats.phase('articulation_search'):
+            if snapshot is not None:
+                indptr, indices, _ = snapshot.as_lists()
+                return block_cut_tree(indptr, indices)
+
+            node_list = self.graph.node_list
+            indptr, indices, _ = self._adjacency_lists(node_list, self.graph.edge_list)
+            return block_cut_tree(indptr, indices).relabel(node_list.__getitem__)
+
+    def tarjan_algorithm_cut_vertex(self, vertex_list: List[Node] | Sequence[int] | None,
+                                    snapshot: 'GraphSnapshot | None' = None) -> Any | None:
+        """
+        Implements Tarjan's algorithm to find cut vertices in the graph, and returns the first one in vertex_list,
+        or None. Use biconnected_components to get all of them.
+        If a snapshot is given, vertex_list holds the vertex indices to start from (all vertices if None),
+        and the index of the first cut vertex is returned.
+        """
+        with self.stats.phase('articulation_search'):
+            if snapshot is not None:
+                indptr, indices, _ = snapshot.as_lists()
+                articulation_point, _ = biconnected_components(indptr, indices, roots=vertex_list)
+                index = articulation_point.find(1)
+                return None if index == -1 else index
+
+            node_list = self.graph.node_list
+            node_index = {node: i for i, node in enumerate(node_list)}
+            indptr, indices, _ = self._adjacency_lists(node_list, self.graph.edge_list)
+            roots = [node_index[vertex] for vertex in vertex_list]
+            articulation_point, _ = biconnected_components(indptr, indices, roots=roots)
+        return next((node_list[v] for v in roots if articulation_point[v]), None)
 
     def connected_components(self, cut_vertex: Node) -> List[List[Node]]:
         """
@@ -441,24 +679,17 @@ class GAlgorithm:
         """
         Creates a spanning tree for each connected component in the graph after removing a cut vertex.
         """
-        queue = [cut_vertex]  # Initialize queue with the cut_vertex
-        spanning_tree = []  # Initialize empty list for the spanning tree
-        visited = set()  # Set to keep track of visited nodes
-        ancestors = {cut_vertex: None}  # Dictionary to store ancestors of each node
-
-        while queue:  # Process until queue is empty
-            vertex = queue.pop(0)  # Get a vertex from the queue
-            if vertex not in visited:  # If the vertex hasn't been visited yet
-                visited.add(vertex)  # Mark it as visited
-                if vertex != cut_vertex:  # If it's not the cut vertex
-                    edge = self.graph.find_edge(vertex.circle_id, ancestors[vertex].circle_id)
+        with self.stats.phase('spanning_tree'):
+            component = set(component_vertex_list)  # For O(1) membership tests
+            parent = {}  # The ancestor of each node in the tree
+            spanning_tree = []
+            for vertex in bfs([cut_vertex], _neighbors, parent, allow=component.__contains__):
+                if vertex is not cut_vertex:
+                    edge = self.graph.find_edge(vertex.circle_id, parent[vertex].circle_id)
                     self.graph.color_edge(edge, "Red")  # Color the edge to the ancestor
-                    time.sleep(delay)  # Wait for a delay to allow visualization
+                    self._pause(delay)  # Wait for a delay to allow visualization
                 spanning_tree.append(vertex)  # Add the vertex to the spanning tree
-                for node in vertex.neighbors:  # For each of its neighbors
-                    if node in component_vertex_list and node not in visited:  # If the neighbor is in the same component and hasn't been visited
-                        ancestors[node] = vertex  # Set the current vertex as the ancestor
-                        queue.append(node)  # Add the neighbor to the queue
+        self.stats.count('bfs_expansions', len(spanning_tree))
         return spanning_tree  # Return the spanning tree
 
     def combine_coloring(self, spanning_tree_1: List[Node], spanning_tree_2: List[Node], cut_vertex: Node):
@@ -466,13 +697,21 @@ class GAlgorithm:
         Combines the colorings of the two connected components at the cut vertex.
         """
 
+        dense = self.graph.dense
+        if dense is not None:  # The neighbors of the cut vertex in a tree are the intersection of two bitsets
+            row = dense.row(cut_vertex)
+            neighbors_1 = dense.nodes(row & dense.mask(spanning_tree_1))
+            neighbors_2 = dense.nodes(row & dense.mask(spanning_tree_2))
+        else:
+            tree_1, tree_2 = set(spanning_tree_1), set(spanning_tree_2)  # For O(1) membership tests
+            neighbors_1 = (neighbor for neighbor in cut_vertex.neighbors if neighbor in tree_1)
+            neighbors_2 = (neighbor for neighbor in cut_vertex.neighbors if neighbor in tree_2)
+
         # Determine the set of colors already used in the neighbors of the cut vertex in the first tree
-        colors_in_spanning_tree_1 = set(
-            neighbor.color for neighbor in cut_vertex.neighbors if neighbor in spanning_tree_1)
+        colors_in_spanning_tree_1 = set(neighbor.color for neighbor in neighbors_1)
 
         # Determine the set of colors already used in the neighbors of the cut vertex in the second tree
-        colors_in_spanning_tree_2 = set(
-            neighbor.color for neighbor in cut_vertex.neighbors if neighbor in spanning_tree_2)
+        colors_in_spanning_tree_2 = set(neighbor.color for neighbor in neighbors_2)
 
         # Determine the set of all colors used in the graph
         all_colors = set(node.color for node in self.graph.node_list)
@@ -490,11 +729,24 @@ class GAlgorithm:
         """
         Finds a triad in the graph - three nodes where two of them are connected to a common node but not to each other.
         """
+        dense = graph.dense
         for x in graph.node_list:  # Iterate over all nodes in the graph
+            if dense is not None:
+                # The neighbors of x that are not y and not adjacent to y, as one bitset operation per y
+                x_row = dense.row(x)
+                for y in x.neighbors:
+                    z = dense.first(x_row & ~dense.row(y) & ~dense.bit(y))
+                    if z is not None:
+                        self.graph.color_node_outline(x, "Green")  # Color the nodes of the triad
+                        self.graph.color_node_outline(y, "Blue")
+                        self.graph.color_node_outline(z, "Yellow")
+                        return x, y, z  # Return the nodes of the triad
+                continue
             for y in x.neighbors:  # Iterate over neighbors of a given node
+                y_neighbors = set(y.neighbors)  # Build the set once, so each test below is O(1)
                 for z in x.neighbors:  # Again, iterate over neighbors of the same node
                     # If y and z are different and z is not a neighbor of y, then we found a triad
-                    if y != z and z not in y.neighbors:
+                    if y is not z and z not in y_neighbors:
                         self.graph.color_node_outline(x, "Green")  # Color the nodes of the triad
                         self.graph.color_node_outline(y, "Blue")
                         self.graph.color_node_outline(z, "Yellow")
@@ -503,91 +755,97 @@ class GAlgorithm:
     def triad_bfs(self, x: Node, y: Node, z: Node, delay: int) -> List[Node]:
         """
         Creates a spanning tree that includes a given triad using a breadth-first search (BFS).
-        """
-        queue = [x]  # Initialize the queue with the first node of the triad
-        spanning_tree = []  # Initialize empty list for the spanning tree
-        visited = set()  # Set to keep track of visited nodes
-        ancestor = x  # Set the ancestor as the first node of the triad
-
-        while queue:  # Process until queue is empty
-            vertex = queue.pop(0)  # Get a vertex from the queue
-            if vertex not in visited:  # If the vertex hasn't been visited yet
-                visited.add(vertex)  # Mark it as visited
-                # If vertex is not the second or third node of the triad
-                if vertex != y and vertex != z:
-                    spanning_tree.append(vertex)  # Add the vertex to the spanning tree
-                    if vertex != x:  # If vertex is not the first node of the triad
-                        edge = self.graph.find_edge(vertex.circle_id, ancestor.circle_id)
-                        self.graph.color_edge(edge, "Red")  # Color the edge to the ancestor
-                        time.sleep(delay)  # Wait for a delay to allow visualization
-                # Add all unvisited neighbors (that are not the second or third node of the triad) to the queue
-                for node in vertex.neighbors:
-                    if node not in visited and node != y and node != z:
-                        queue.append(node)
-            ancestor = vertex  # Update the ancestor
-
-        # Process the second and third nodes of the triad
-        spanning_tree.append(y)
-        edge = self.graph.find_edge(x.circle_id, y.circle_id)
-        self.graph.color_edge(edge, "Red")
-        time.sleep(delay)
-        spanning_tree.append(z)
-        edge = self.graph.find_edge(x.circle_id, z.circle_id)
-        self.graph.color_edge(edge, "Red")
-        time.sleep(delay)
-        return spanning_tree  # Return the spanning tree
+        The tree is grown from x without entering y and z, which are then attached to x.
+        """
+        with self.stats.phase('spanning_tree'):
+            parent = {}  # The ancestor of each node in the tree
+            spanning_tree = []
+            for vertex in bfs([x], _neighbors, parent, allow=lambda node: node is not y and node is not z):
+                if vertex is not x:
+                    edge = self.graph.find_edge(vertex.circle_id, parent[vertex].circle_id)
+                    self.graph.color_edge(edge, "Red")  # Color the edge to the ancestor
+                    self._pause(delay)  # Wait for a delay to allow visualization
+                spanning_tree.append(vertex)  # Add the vertex to the spanning tree
+            self.stats.count('bfs_expansions', len(spanning_tree))
 
-    def brooks_algorithm(self, graph: Graph, delay: int):
+            # Process the second and third nodes of the triad
+            for node in (y, z):
+                spanning_tree.append(node)
+                edge = self.graph.find_edge(x.circle_id, node.circle_id)
+                self.graph.color_edge(edge, "Red")
+                self._pause(delay)
+            return spanning_tree  # Return the spanning tree
+
+    def brooks_algorithm(self, graph: Graph, delay: int, snapshot: 'GraphSnapshot | None' = None) -> List[int]:
         """
         Implements Brooks' theorem to color the graph.
-        The theorem states that every connected graph with maximum degree 'd' can be colored with 'd' colors.
-        Exceptions: complete graphs and odd cycles.
-        """
-        # Check if the graph is an odd cycle or a complete graph
-        if self.is_odd_cycle(graph):
-            self.graph.print_in_gui("The graph is an odd cycle. Cannot apply Brooks' theorem.")
-            return
-        if self.is_complete_graph(graph):
-            self.graph.print_in_gui("The graph is a complete graph. Cannot apply Brooks' theorem.")
-            return
-
-        max_degree, min_degree = self.max_min_degree(graph.node_list)  # Get the node with max and min degrees
-
-        # If the min degree is less than the max degree, color using BFS starting from the node with min degree
-        if len(min_degree.neighbors) < len(max_degree.neighbors):
-            self.graph.print_in_gui("Case 1: the graph is not k-regular. Running the greedy coloring algorithm.")
-            spanning_tree = self.bfs_spanning_tree(min_degree)[::-1]
-            self.greedy_coloring(spanning_tree, delay)
-            return
-
-        # Otherwise, find a cut vertex if it exists
-        cut_vertex = self.tarjan_algorithm_cut_vertex(graph.node_list)
-        if cut_vertex is not None:  # If there is a cut vertex
-            self.graph.print_in_gui("Case 2: The graph is k-regular and has a cut vertex marked in red.")
-            self.graph.color_node(cut_vertex, "Red")  # Color the cut vertex
-            components = self.connected_components(
-                cut_vertex)  # Find the connected components after removing the cut vertex
-            # Create spanning trees for each component and color them using the greedy algorithm
+        The theorem states that every graph with maximum degree 'd' can be colored with 'd' colors.
+        Exceptions: components that are complete graphs on d + 1 nodes, or odd cycles when d = 2.
+        Each connected component is colored on its own by the linear-time engine in BrooksColoring,
+        and an exceptional component is colored with d + 1 colors.
+        If a snapshot is given, the graph is read from it and the colors are returned by vertex index.
+
+        :return: The color of each node, in the order of graph.node_list or by snapshot vertex index.
+        """
+        if snapshot is not None:
+            indptr, indices, _ = snapshot.as_lists()
+            node_of = lambda v: self.graph.find_node_by_id(snapshot.circle_id(v))
+        else:
+            node_list = graph.node_list
+            indptr, indices, _ = self._adjacency_lists(node_list, graph.edge_list)
+            node_of = node_list.__getitem__
+
+        colors, reports = BrooksColoring.brooks_coloring(indptr, indices, self.stats)
+        max_degree = max((indptr[v + 1] - indptr[v] for v in range(len(colors))), default=0)
+        if snapshot is None:
+            for node, color in zip(node_list, colors):
+                node.color = color
+
+        exception = None
+        for case, special, order in reports:
+            degree = indptr[order[0] + 1] - indptr[order[0]]
+            if case in (BrooksColoring.COMPLETE, BrooksColoring.ODD_CYCLE) and degree == max_degree:
+                exception = case
+            if self.graph.rendering:
+                self._show_brooks_case(case, special, order, colors, node_of, delay)
+
+        used = max(colors, default=-1) + 1
+        if exception == BrooksColoring.COMPLETE:
+            self.graph.print_in_gui(f"A component is a complete graph. Cannot apply Brooks' theorem, "
+                                    f"the graph was colored with {used} colors.")
+        elif exception == BrooksColoring.ODD_CYCLE:
+            self.graph.print_in_gui(f"A component is an odd cycle. Cannot apply Brooks' theorem, "
+                                    f"the graph was colored with {used} colors.")
+        else:
+            self.graph.print_in_gui(f"The graph was colored with {used} colors, its maximum degree is {max_degree}.")
+        return colors
+
+    def _show_brooks_case(self, case: str, special: tuple, order: List[int], colors: List[int], node_of, delay: int):
+        """
+        Shows how one connected component was colored by brooks_coloring: its case, its special nodes, and then
+        its nodes in the order they were colored.
+        """
+        if case == BrooksColoring.NOT_REGULAR:
+            self.graph.print_in_gui("Case 1: the component is not k-regular. Running the greedy coloring algorithm "
+                                    "from a node of minimum degree.")
+        elif case == BrooksColoring.CUT_VERTEX:
+            self.graph.print_in_gui("Case 2: The component is k-regular and has a cut vertex marked in red.")
+            self.graph.color_node(node_of(special[0]), "Red")
+            self._pause(delay)
+        elif case == BrooksColoring.TRIAD:
+            self.graph.print_in_gui("Case 3: The component is k-regular and does not have a cut vertex.")
             self.graph.print_in_gui(
-                "Creating a spanning tree rooted in the cut vertex for the two connected components of the graph.")
-
-            spanning_tree_1 = self.component_spanning_tree(components[0], cut_vertex, delay)[::-1]
-            spanning_tree_2 = self.component_spanning_tree(components[1], cut_vertex, delay)[::-1]
-            self.greedy_coloring2(spanning_tree_1,cut_vertex, delay)
-            self.greedy_coloring2(spanning_tree_2, cut_vertex, delay)
-            self.combine_coloring(spanning_tree_1, spanning_tree_2,
-                                  cut_vertex)  # Combine the colorings at the cut vertex
-            return
-
-        # Otherwise, if the graph is 2-colorable, just apply greedy coloring
-        if len(max_degree.neighbors) == 2:
-            self.greedy_coloring(graph.node_list, delay)
-            return
-        # Finally, if there is no cut vertex ,find a triad of vertices such that two are unconnected
-        self.graph.print_in_gui("Case 3: The graph is k-regular and does not have a cut vertex.")
-        self.graph.print_in_gui(
-            "Finding three vertices x,y,z such that two are unconnected. The vertices are marked on the graph by different colored outlines.")
-
-        x, y, z = self.find_triad(graph)
-        spanning_tree = self.triad_bfs(x, y, z, delay)[::-1]
-        self.greedy_coloring(spanning_tree, delay)
+                "Finding three vertices x,y,z such that two are unconnected. The vertices are marked on the graph by different colored outlines.")
+            for v, outline in zip(special, ("Green", "Blue", "Yellow")):
+                self.graph.color_node_outline(node_of(v), outline)
+            self._pause(delay)
+        elif case == BrooksColoring.EVEN_CYCLE:
+            self.graph.print_in_gui("The component is an even cycle, coloring it with 2 colors.")
+        elif case == BrooksColoring.ODD_CYCLE:
+            self.graph.print_in_gui("The component is an odd cycle, coloring it with 3 colors.")
+        elif case == BrooksColoring.COMPLETE:
+            self.graph.print_in_gui(f"The component is a complete graph, coloring it with {len(order)} colors.")
+
+        for v in order:
+            self.graph.color_node(node_of(v), self.index_to_rgb(colors[v]))
+            self._pause(delay)
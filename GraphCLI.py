@@ -0,0 +1,122 @@
+"""
+Runs the matching and coloring algorithms on graph files from the command line, without a GUI:
+
+    python GraphCLI.py hungarian graphs/*.mtx --output matchings.txt
+    python GraphCLI.py brooks a.edgelist b.adjlist
+    python GraphCLI.py coloring --strategy dsatur --output-dir colorings/ graphs/*.edgelist
+
+All files are processed in one process, so the interpreter and the modules are loaded only once.
+The matching or coloring of each file is written in the format of GraphIO.save_matching or
+GraphIO.save_coloring, after a "# file: <path>" line, to stdout, to one output file, or to one file
+per input in an output directory. A summary line per file goes to stderr. A file that cannot be read
+is reported and skipped, and the exit status is then 1.
+
+The hungarian algorithm falls back to the blossom algorithm on a graph that is not bipartite, like
+the Hungarian window does.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import IO, List
+
+import Coloring
+import GraphIO
+from AlgorithmStats import AlgorithmStats
+from GraphAlgorithms import GAlgorithm
+
+ALGORITHMS = ('hungarian', 'blossom', 'brooks', 'coloring')
+
+
+def run_file(path: str, algorithm: str, out: IO, fmt: str | None = None, strategy: str = 'natural',
+             bipartite: bool = False, stats: AlgorithmStats | None = None) -> str:
+    """
+    Loads one graph file, runs an algorithm on it and writes the result.
+
+    :param path: The path of the graph file.
+    :param algorithm: One of ALGORITHMS.
+    :param out: The open file the result is written to.
+    :param fmt: The format of the graph file, guessed from the path if None.
+    :param strategy: The vertex ordering of the coloring algorithm, one of Coloring.STRATEGIES.
+    :param bipartite: Whether a square Matrix Market matrix is a biadjacency matrix.
+    :param stats: If given, the run is instrumented and records to it.
+    :return: A one-line summary of the run.
+    """
+    start = time.perf_counter()
+    graph = GraphIO.load_graph(path, fmt, bipartite=bipartite)
+    algos = GAlgorithm(graph)
+    algos.stats = stats
+
+    out.write(f"# file: {path}\n")
+    if algorithm in ('hungarian', 'blossom'):
+        if algorithm == 'blossom' or not algos.hungarian_algorithm(0):
+            algos.blossom_matching(0)
+        GraphIO.save_matching(algos.matching, out)
+        result = f"matching of {len(algos.matching)} edges"
+    else:
+        if algorithm == 'brooks':
+            colors = algos.brooks_algorithm(graph, 0)
+        else:
+            colors = algos.color_graph(strategy)
+        GraphIO.save_coloring(graph, out)
+        result = f"{max(colors, default=-1) + 1} colors"
+
+    return (f"{path}: {len(graph.node_list)} nodes, {len(graph.edge_list)} edges, {result} "
+            f"in {time.perf_counter() - start:.3f} s")
+
+
+def _output_path(directory: str, path: str, algorithm: str) -> str:
+    """
+    Returns the path of the result of an input file in an output directory.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(directory, f"{stem}.{algorithm}.txt")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Runs matching and coloring algorithms on graph files.")
+    parser.add_argument('algorithm', choices=ALGORITHMS)
+    parser.add_argument('files', nargs='+', help="The graph files, see GraphIO for their formats.")
+    parser.add_argument('--format', choices=GraphIO.FORMATS, help="The format of all files, guessed from "
+                                                                   "each extension by default.")
+    parser.add_argument('--strategy', choices=Coloring.STRATEGIES, default='natural',
+                        help="The vertex ordering of the coloring algorithm.")
+    parser.add_argument('--bipartite', action='store_true',
+                        help="Read square Matrix Market matrices as biadjacency matrices.")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--output', help="Write all results to this file instead of stdout.")
+    output.add_argument('--output-dir', help="Write the result of each file to <name>.<algorithm>.txt here.")
+    parser.add_argument('--stats', action='store_true', help="Print the phase timings and counters of each run "
+                                                             "to stderr as JSON.")
+    args = parser.parse_args(argv)
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    single = open(args.output, 'w') if args.output else None
+    status = 0
+    try:
+        for path in args.files:
+            stats = AlgorithmStats() if args.stats else None
+            try:
+                if args.output_dir:
+                    with open(_output_path(args.output_dir, path, args.algorithm), 'w') as out:
+                        summary = run_file(path, args.algorithm, out, args.format, args.strategy, args.bipartite, stats)
+                else:
+                    summary = run_file(path, args.algorithm, single or sys.stdout, args.format, args.strategy,
+                                       args.bipartite, stats)
+            except (OSError, ValueError) as error:
+                print(f"{path}: {error}", file=sys.stderr)
+                status = 1
+                continue
+            print(summary, file=sys.stderr)
+            if stats is not None:
+                print(json.dumps({'file': path, **stats.as_dict()}), file=sys.stderr)
+    finally:
+        if single is not None:
+            single.close()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Streaming readers and writers for graphs, colorings and matchings, independent of the GUI.
+
+Three graph formats are supported:
+
+* edgelist: one edge "u v" or "u v weight" per line. A line with a single id adds an isolated node.
+* adjlist: one line "u v1 v2 ..." per node, listing some or all of its neighbors. It has no weights.
+* mtx: a Matrix Market coordinate file. A square n x n matrix is the adjacency matrix of a graph
+  on nodes 1..n. A rectangular r x c matrix, or any matrix read with bipartite=True, is the
+  biadjacency matrix of a bipartite graph whose rows are nodes 1..r and whose columns are nodes
+  r+1..r+c. The values are the edge weights.
+
+Lines starting with '#' (or '%' in Matrix Market files) are comments. Edges without a weight
+get a weight of 1.
+"""
+from contextlib import nullcontext
+from math import ceil, sqrt
+from typing import IO, Iterable, Iterator, Tuple
+
+from Graph import Graph
+from GraphEdge import Edge
+from RenderSink import RenderSink
+
+FORMATS = ('edgelist', 'adjlist', 'mtx')
+_SPACING = 50  # Distance between the grid positions given to loaded nodes
+_COLUMNS = 20  # Width of that grid when the number of nodes is not known in advance
+
+
+def _open(target: str | IO, mode: str):
+    """
+    Opens a path, or wraps an already open file so that it is not closed after use.
+    """
+    if hasattr(target, 'read') or hasattr(target, 'write'):
+        return nullcontext(target)
+    return open(target, mode)
+
+
+def guess_format(path: str) -> str:
+    """
+    Returns the format of a graph file according to its extension, edgelist by default.
+
+    :param path: The path of the file.
+    """
+    if path.endswith('.mtx'):
+        return 'mtx'
+    if path.endswith(('.adj', '.adjlist')):
+        return 'adjlist'
+    return 'edgelist'
+
+
+def read_edges(file: IO, fmt: str, bipartite: bool = False) -> Iterator[Tuple[int, int | None, float]]:
+    """
+    Parses a graph file one line at a time.
+
+    :param file: The open file to read.
+    :param fmt: The format of the file, one of FORMATS.
+    :param bipartite: Whether a square Matrix Market matrix is a biadjacency matrix.
+    :return: An iterator over (u, v, weight) triples, where v is None for a node without an edge on that line.
+             For a Matrix Market file, the first triple is (n, None, 1.0) with the number of nodes.
+    """
+    if fmt == 'mtx':
+        yield from _read_matrix_market(file, bipartite)
+        return
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown graph format: {fmt}")
+
+    for line in file:
+        fields = line.split()
+        if not fields or fields[0].startswith('#'):
+            continue
+        u = int(fields[0])
+        if len(fields) == 1:
+            yield u, None, 1.0
+        elif fmt == 'edgelist':
+            yield u, int(fields[1]), float(fields[2]) if len(fields) > 2 else 1.0
+        else:
+            for v in fields[1:]:
+                yield u, int(v), 1.0
+
+
+def _read_matrix_market(file: IO, bipartite: bool) -> Iterator[Tuple[int, int | None, float]]:
+    """
+    Parses a Matrix Market coordinate file, see read_edges.
+    """
+    header = file.readline().split()
+    if len(header) < 3 or header[0] != '%%MatrixMarket' or header[2] != 'coordinate':
+        raise ValueError("Only Matrix Market files in coordinate format are supported")
+
+    size = None
+    for line in file:
+        fields = line.split()
+        if not fields or fields[0].startswith('%'):
+            continue
+        if size is None:
+            rows, cols = int(fields[0]), int(fields[1])
+            bipartite = bipartite or rows != cols
+            size = rows, cols
+            yield (rows + cols if bipartite else rows), None, 1.0
+            continue
+        i, j = int(fields[0]), int(fields[1])
+        weight = float(fields[2]) if len(fields) > 2 else 1.0  # Pattern files have no values
+        # Columns of a rectangular matrix are nodes of their own, after the rows
+        yield i, (size[0] + j if bipartite else j), weight
+
+
+def load_graph(source: str | IO, fmt: str | None = None, gui=None, sink: RenderSink | None = None,
+               bipartite: bool = False) -> Graph:
+    """
+    Builds a graph from a file in a single pass. Nodes are created the first time their id is seen
+    and placed on a grid, and repeated edges and loops are dropped by the graph's edge index.
+    Edges are numbered in the order they are read.
+
+    :param source: The path of the file, or an open file.
+    :param fmt: The format of the file, guessed from the path if None.
+    :param gui: The GUI of the new graph, None for a graph without a GUI.
+    :param sink: The render sink of the new graph, see Graph.
+    :param bipartite: Whether a square Matrix Market matrix is a biadjacency matrix, as for an assignment problem.
+    :return: The new graph.
+    """
+    if fmt is None:
+        fmt = guess_format(source) if isinstance(source, str) else 'edgelist'
+
+    graph = Graph(gui, sink)
+    node_count = 0
+    columns = _COLUMNS
+
+    def add_node(node_id: int):
+        nonlocal node_count
+        graph.add_node(node_id, (node_count % columns + 1) * _SPACING, (node_count // columns + 1) * _SPACING)
+        node_count += 1
+
+    edge_id = 0
+    with _open(source, 'r') as file:
+        for u, v, weight in read_edges(file, fmt, bipartite):
+            if fmt == 'mtx' and v is None:
+                # The Matrix Market size line gives the node count, so all nodes are created up front
+                columns = max(1, ceil(sqrt(u)))
+                for node_id in range(1, u + 1):
+                    add_node(node_id)
+                continue
+            if graph.find_node_by_id(u) is None:
+                add_node(u)
+            if v is None:
+                continue
+            if graph.find_node_by_id(v) is None:
+                add_node(v)
+            if graph.add_edge(u, v, edge_id, weight) is not None:
+                edge_id += 1
+    return graph
+
+
+def save_graph(graph: Graph, target: str | IO, fmt: str | None = None):
+    """
+    Writes a graph in one of the formats read by load_graph.
+    In a Matrix Market file the nodes are renumbered 1..n in the order of the node list.
+
+    :param graph: The graph to write.
+    :param target: The path of the file, or an open file.
+    :param fmt: The format of the file, guessed from the path if None.
+    """
+    if fmt is None:
+        fmt = guess_format(target) if isinstance(target, str) else 'edgelist'
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown graph format: {fmt}")
+
+    nodes = graph.node_list
+    edges = graph.edge_list
+    weighted = any(edge.weight != 1 for edge in edges)
+    with _open(target, 'w') as file:
+        if fmt == 'mtx':
+            index_of = {node.circle_id: i for i, node in enumerate(nodes, start=1)}
+            file.write(f"%%MatrixMarket matrix coordinate {'real' if weighted else 'pattern'} symmetric\n")
+            file.write(f"{len(nodes)} {len(nodes)} {len(edges)}\n")
+            for edge in edges:
+                i, j = index_of[edge.source.circle_id], index_of[edge.dest.circle_id]
+                # Symmetric files hold the lower triangle
+                file.write(f"{max(i, j)} {min(i, j)}" + (f" {edge.weight!r}\n" if weighted else "\n"))
+        elif fmt == 'adjlist':
+            file.write(f"# nodes {len(nodes)} edges {len(edges)}\n")
+            for node in nodes:
+                # Each edge is written once, on the line of its source
+                file.write(" ".join(map(str, [node.circle_id, *_out_neighbors(graph, node)])) + "\n")
+        else:
+            file.write(f"# nodes {len(nodes)} edges {len(edges)}\n")
+            for node in nodes:
+                if not node.neighbors:
+                    file.write(f"{node.circle_id}\n")
+            for edge in edges:
+                file.write(f"{edge.source.circle_id} {edge.dest.circle_id}"
+                           + (f" {edge.weight!r}\n" if weighted else "\n"))
+
+
+def _out_neighbors(graph: Graph, node) -> Iterator[int]:
+    """
+    Returns the ids of the neighbors of a node that are the destination of the edge between them.
+    """
+    for neighbor in node.neighbors:
+        if graph.find_edge(node.circle_id, neighbor.circle_id).source is node:
+            yield neighbor.circle_id
+
+
+def save_coloring(graph: Graph, target: str | IO):
+    """
+    Writes the color of every colored node, one "node color" pair per line.
+
+    :param graph: The colored graph.
+    :param target: The path of the file, or an open file.
+    """
+    with _open(target, 'w') as file:
+        file.write("# node color\n")
+        for node in graph.node_list:
+            if node.color != -1:
+                file.write(f"{node.circle_id} {node.color}\n")
+
+
+def save_matching(matching: Iterable[Edge], target: str | IO):
+    """
+    Writes the edges of a matching, one "u v" pair per line, in the edgelist format.
+
+    :param matching: The edges of the matching.
+    :param target: The path of the file, or an open file.
+    """
+    with _open(target, 'w') as file:
+        file.write("# matching\n")
+        for edge in sorted(matching, key=lambda edge: (edge.source.circle_id, edge.dest.circle_id)):
+            file.write(f"{edge.source.circle_id} {edge.dest.circle_id}\n")
@@ -0,0 +1,135 @@
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+class GraphSnapshot:
+    """
+    The GraphSnapshot class is an immutable compressed-sparse-row (CSR) copy of a Graph.
+    Vertices are renumbered densely from 0 to n - 1 in the order of the graph's node list,
+    and edges from 0 to m - 1 in the order of its edge list.
+
+    The neighbors of vertex v are indices[indptr[v]:indptr[v + 1]], in the same order as the
+    node's neighbors list, and adj_edges holds the edge index of each of those entries.
+    """
+
+    def __init__(self, node_ids: np.ndarray, edge_ids: np.ndarray, edge_source: np.ndarray,
+                 edge_dest: np.ndarray, indptr: np.ndarray, indices: np.ndarray, adj_edges: np.ndarray):
+        """
+        Initializes a snapshot from its arrays. The arrays are made read-only.
+
+        :param node_ids: The circle_id of each vertex.
+        :param edge_ids: The id of each edge.
+        :param edge_source: The source vertex of each edge.
+        :param edge_dest: The destination vertex of each edge.
+        :param indptr: The offset of each vertex's neighbors in indices, followed by the total length.
+        :param indices: The neighbors of all vertices, one run per vertex.
+        :param adj_edges: The edge index of each entry in indices.
+        """
+        for array in (node_ids, edge_ids, edge_source, edge_dest, indptr, indices, adj_edges):
+            array.flags.writeable = False
+        self.node_ids = node_ids
+        self.edge_ids = edge_ids
+        self.edge_source = edge_source
+        self.edge_dest = edge_dest
+        self.indptr = indptr
+        self.indices = indices
+        self.adj_edges = adj_edges
+        self._index_of: Dict[int, int] = {circle_id: v for v, circle_id in enumerate(node_ids.tolist())}
+        self._lists: Tuple[List[int], List[int], List[int]] | None = None
+
+    @classmethod
+    def from_graph(cls, graph) -> 'GraphSnapshot':
+        """
+        Builds a snapshot of the current state of a graph.
+
+        :param graph: The graph to copy.
+        :return: The snapshot.
+        """
+        nodes = graph.node_list
+        edges = graph.edge_list
+        n, m = len(nodes), len(edges)
+        index_of = {node.circle_id: v for v, node in enumerate(nodes)}
+
+        node_ids = np.fromiter((node.circle_id for node in nodes), dtype=np.int64, count=n)
+        edge_ids = np.fromiter((edge.id for edge in edges), dtype=np.int64, count=m)
+        edge_source = np.fromiter((index_of[edge.source.circle_id] for edge in edges), dtype=np.int64, count=m)
+        edge_dest = np.fromiter((index_of[edge.dest.circle_id] for edge in edges), dtype=np.int64, count=m)
+
+        # Every edge appears once in each direction. Listing the two directions of an edge next to each
+        # other and sorting stably by the first endpoint keeps each vertex's neighbors in edge order,
+        # which is the order the nodes' neighbor lists were built in.
+        first = np.column_stack((edge_source, edge_dest)).ravel()
+        second = np.column_stack((edge_dest, edge_source)).ravel()
+        order = np.argsort(first, kind='stable')
+        indices = second[order]
+        adj_edges = np.repeat(np.arange(m, dtype=np.int64), 2)[order]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(first, minlength=n), out=indptr[1:])
+
+        return cls(node_ids, edge_ids, edge_source, edge_dest, indptr, indices, adj_edges)
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        The number of vertices in the snapshot.
+        """
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """
+        The number of edges in the snapshot.
+        """
+        return len(self.edge_ids)
+
+    def index_of(self, circle_id: int) -> int:
+        """
+        Returns the vertex index of a node.
+
+        :param circle_id: The id of the node.
+        :return: The index of the node's vertex.
+        """
+        return self._index_of[circle_id]
+
+    def circle_id(self, v: int) -> int:
+        """
+        Returns the node id of a vertex.
+
+        :param v: The vertex index.
+        :return: The circle_id of the node.
+        """
+        return int(self.node_ids[v])
+
+    def neighbors(self, v: int) -> np.ndarray:
+        """
+        Returns the neighbors of a vertex.
+
+        :param v: The vertex index.
+        :return: A read-only view of the neighbors' vertex indices.
+        """
+        return self.indices[self.indptr[v]:self.indptr[v + 1]]
+
+    def degree(self, v: int) -> int:
+        """
+        Returns the degree of a vertex.
+
+        :param v: The vertex index.
+        """
+        return int(self.indptr[v + 1] - self.indptr[v])
+
+    def degrees(self) -> np.ndarray:
+        """
+        Returns the degrees of all vertices.
+        """
+        return np.diff(self.indptr)
+
+    def as_lists(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Returns indptr, indices and adj_edges as Python lists, which pure Python loops index much
+        faster than NumPy arrays. The lists are built once and shared, so they must not be modified.
+
+        :return: The tuple (indptr, indices, adj_edges).
+        """
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.adj_edges.tolist())
+        return self._lists
@@ -0,0 +1,156 @@
+from collections import deque
+from GraphEdge import Edge
+from GraphNode import Node
+from typing import Dict, Iterable, List, Set
+
+
+class IncrementalMatching:
+    """
+    The IncrementalMatching class keeps a maximum matching of a graph up to date while the graph is edited.
+    It listens to the graph and repairs the matching locally after each change:
+
+    * an added edge costs at most one augmenting-path search, and none if both endpoints are free;
+    * a deleted node frees its mate, and only a search from that mate is needed.
+
+    The searches grow alternating trees without shrinking odd cycles, so the matching is kept maximum on
+    bipartite graphs. On other graphs every repair is still a valid matching, but it may not be maximum.
+    """
+
+    def __init__(self, graph, matching: Iterable[Edge] = ()):
+        """
+        Attaches a matching to a graph. If the given matching is not maximum, it is first completed
+        by searching for an augmenting path from every free node.
+
+        :param graph: The graph to follow.
+        :param matching: A matching of the graph to start from, such as GAlgorithm.matching.
+        """
+        self.graph = graph
+        self.matching: Set[Edge] = set()
+        self.mate: Dict[Node, Edge] = {}  # The matching edge of each matched node
+        for edge in matching:
+            self._match(edge)
+        for node in graph.node_list:
+            if node not in self.mate:
+                self._augment_from([node])
+        graph.add_listener(self)
+
+    def detach(self):
+        """
+        Stops following the graph.
+        """
+        self.graph.remove_listener(self)
+
+    def partner(self, node: Node) -> Node | None:
+        """
+        Returns the node matched to a node.
+
+        :param node: The node.
+        :return: Its mate, or None if it is free.
+        """
+        edge = self.mate.get(node)
+        if edge is None:
+            return None
+        return edge.dest if edge.source is node else edge.source
+
+    def edge_added(self, edge: Edge):
+        """
+        Repairs the matching after an edge was added. If both endpoints are free, the edge is matched.
+        If only one is free, any augmenting path starts there. If neither is free, any augmenting path
+        goes through the new edge, and one search from all free nodes finds it.
+
+        :param edge: The new edge.
+        """
+        source_free = edge.source not in self.mate
+        dest_free = edge.dest not in self.mate
+        if source_free and dest_free:
+            self._apply([edge])
+        elif source_free:
+            self._augment_from([edge.source])
+        elif dest_free:
+            self._augment_from([edge.dest])
+        else:
+            self._augment_from([node for node in self.graph.node_list if node not in self.mate])
+
+    def node_deleted(self, node: Node):
+        """
+        Repairs the matching after a node was deleted. Any augmenting path now starts at the node's former mate.
+
+        :param node: The deleted node.
+        """
+        edge = self.mate.pop(node, None)
+        if edge is None:
+            return
+        mate = edge.dest if edge.source is node else edge.source
+        del self.mate[mate]
+        self.matching.discard(edge)
+        self._augment_from([mate])
+
+    def _match(self, edge: Edge):
+        """
+        Adds an edge to the matching.
+        """
+        self.matching.add(edge)
+        self.mate[edge.source] = edge
+        self.mate[edge.dest] = edge
+
+    def _apply(self, path: List[Edge]):
+        """
+        Flips an augmenting path: its matched edges leave the matching and the others enter it.
+        """
+        leaving = {edge for edge in path if edge in self.matching}
+        for edge in leaving:
+            self.matching.remove(edge)
+            del self.mate[edge.source], self.mate[edge.dest]
+            self.graph.color_edge(edge, 'black')
+        for edge in path:
+            if edge not in leaving:
+                self._match(edge)
+                self.graph.color_edge(edge, 'red')
+
+    def _augment_from(self, roots: List[Node]) -> bool:
+        """
+        Grows alternating trees from free roots until an augmenting path is found, and applies it.
+        Roots are outer nodes, the nodes reached by an unmatched edge are inner, and their mates are outer.
+
+        :param roots: Free nodes to search from.
+        :return: True if the matching grew.
+        """
+        root_of: Dict[Node, Node] = {root: root for root in roots}  # The root of every outer node
+        parent_edge: Dict[Node, Edge] = {}  # The unmatched edge through which each inner node was reached
+        queue = deque(roots)
+
+        while queue:
+            u = queue.popleft()
+            for neighbor in u.neighbors:
+                if neighbor in parent_edge:  # Already inner
+                    continue
+                edge = self.graph.find_edge(u.circle_id, neighbor.circle_id)
+                if neighbor in root_of:
+                    if root_of[neighbor] is not root_of[u]:  # Two trees meet, joining two free roots
+                        self._apply(self._tree_path(u, parent_edge) + [edge] + self._tree_path(neighbor, parent_edge))
+                        return True
+                    continue
+                parent_edge[neighbor] = edge
+                mate_edge = self.mate.get(neighbor)
+                if mate_edge is None:  # A free node outside the trees ends the path
+                    self._apply(self._tree_path(u, parent_edge) + [edge])
+                    return True
+                mate = mate_edge.dest if mate_edge.source is neighbor else mate_edge.source
+                if mate not in root_of and mate not in parent_edge:
+                    root_of[mate] = root_of[u]
+                    queue.append(mate)
+        return False
+
+    def _tree_path(self, node: Node, parent_edge: Dict[Node, Edge]) -> List[Edge]:
+        """
+        Returns the edges on the tree path from an outer node up to its root.
+        """
+        path = []
+        while node in self.mate:
+            matched = self.mate[node]
+            inner = matched.dest if matched.source is node else matched.source
+            unmatched = parent_edge[inner]
+            path.append(matched)
+            path.append(unmatched)
+            node = unmatched.dest if unmatched.source is inner else unmatched.source
+        return path
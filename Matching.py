@@ -0,0 +1,266 @@
+"""
+Matching engines that work on a graph in compressed-sparse-row (CSR) form: the neighbors of
+vertex v are indices[indptr[v]:indptr[v + 1]] and adj_edges holds the edge index of each entry.
+These are the lists returned by GraphSnapshot.as_lists.
+"""
+from AlgorithmStats import NULL_STATS, AlgorithmStats
+from typing import Callable, List, Sequence, Tuple
+import time
+
+
+def hopcroft_karp(indptr: Sequence[int], indices: Sequence[int], adj_edges: Sequence[int], left: Sequence[bool],
+                  on_augment: Callable[[List[int]], None] | None = None,
+                  stats: AlgorithmStats = NULL_STATS) -> Tuple[List[int], List[int]]:
+    """
+    Finds a maximum matching in a bipartite graph with the Hopcroft-Karp algorithm, in O(E * sqrt(V)).
+    Each phase runs a BFS from all free left vertices to layer the graph up to the nearest free right
+    vertex, then augments along vertex-disjoint shortest paths found by DFS in that layered graph.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param adj_edges: The edge index of each entry in indices.
+    :param left: Whether each vertex is on the left side. Every edge must join the two sides.
+    :param on_augment: Called after each augmentation with the edge indices of the augmenting path,
+                       starting at its free left vertex. The edges of the path at even positions
+                       entered the matching and those at odd positions left it.
+    :return: The lists (mate, mate_edge) giving, for each vertex, the vertex and edge it is matched by, or -1.
+    """
+    n = len(indptr) - 1
+    infinity = n + 1
+    mate = [-1] * n
+    mate_edge = [-1] * n
+    dist = [infinity] * n
+    left_vertices = [v for v in range(n) if left[v]]
+
+    while True:
+        round_start = time.perf_counter()
+        # Layer the left vertices by their distance from a free left vertex, along alternating paths
+        queue = []
+        for u in left_vertices:
+            if mate[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+            else:
+                dist[u] = infinity
+        limit = infinity  # One more than the layer of the nearest free right vertex
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            if dist[u] + 1 >= limit:
+                continue
+            for w in indices[indptr[u]:indptr[u + 1]]:
+                x = mate[w]
+                if x == -1:
+                    limit = dist[u] + 1
+                elif dist[x] == infinity:
+                    dist[x] = dist[u] + 1
+                    queue.append(x)
+        stats.count('bfs_expansions', head)
+        if limit == infinity:
+            break
+
+        # Augment along vertex-disjoint shortest paths, following the layers
+        augmented = 0
+        next_slot = list(indptr)
+        for root in left_vertices:
+            if mate[root] != -1:
+                continue
+            stack = [root]  # The left vertices of the current path
+            slots = []  # The slot taken out of each of them
+            while stack:
+                u = stack[-1]
+                advanced = False
+                while next_slot[u] < indptr[u + 1]:
+                    slot = next_slot[u]
+                    next_slot[u] += 1
+                    x = mate[indices[slot]]
+                    if x == -1:
+                        if dist[u] + 1 == limit:
+                            slots.append(slot)
+                            advanced = True
+                            break
+                    elif dist[x] == dist[u] + 1 and dist[x] < limit:
+                        slots.append(slot)
+                        stack.append(x)
+                        advanced = True
+                        break
+                if not advanced:  # Dead end, no shortest path goes through u
+                    dist[u] = infinity
+                    stack.pop()
+                    if slots:
+                        slots.pop()
+                elif len(slots) == len(stack):  # The last slot reached a free right vertex
+                    path = []
+                    for u, slot in zip(stack, slots):
+                        if mate_edge[u] != -1:
+                            path.append(mate_edge[u])
+                        w = indices[slot]
+                        mate[u], mate[w] = w, u
+                        mate_edge[u] = mate_edge[w] = adj_edges[slot]
+                        path.append(adj_edges[slot])
+                    augmented += 1
+                    if on_augment is not None:
+                        on_augment(path)
+                    break
+        stats.count('augmenting_paths', augmented)
+        stats.record('augmentation_round', time.perf_counter() - round_start)
+
+    return mate, mate_edge
+
+
+def edmonds_matching(indptr: Sequence[int], indices: Sequence[int], adj_edges: Sequence[int],
+                     on_augment: Callable[[List[int]], None] | None = None,
+                     stats: AlgorithmStats = NULL_STATS) -> Tuple[List[int], List[int]]:
+    """
+    Finds a maximum matching in a general graph with Edmonds' blossom algorithm, in O(V^3).
+    A greedy matching is grown first, from the vertices of lowest degree. Then a BFS tree of alternating
+    paths is grown from each free vertex in turn; when an edge joins two even vertices of the tree, the odd
+    cycle it closes (a blossom) is shrunk into its base, by giving all its vertices that base, and its odd
+    vertices become even.
+    Reaching a free vertex gives an augmenting path, which is followed back through the parent links.
+    A tree from which no free vertex can be reached can never be part of an augmenting path, so its
+    vertices are skipped by later searches.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param adj_edges: The edge index of each entry in indices.
+    :param on_augment: Called after each augmentation with the edge indices of the augmenting path,
+                       starting at its first free vertex. The edges of the path at even positions
+                       entered the matching and those at odd positions left it.
+    :param stats: Times the 'greedy_matching' and the 'augmentation' phases, and counts the 'bfs_expansions',
+                  'blossoms' and 'augmenting_paths', the edges of the greedy matching included.
+    :return: The lists (mate, mate_edge) giving, for each vertex, the vertex and edge it is matched by, or -1.
+    """
+    n = len(indptr) - 1
+    mate = [-1] * n
+    mate_edge = [-1] * n
+    augmented = 0
+    with stats.phase('greedy_matching'):
+        # A greedy matching, so fewer searches are needed: vertices of low degree are matched first, each to
+        # its free neighbor of lowest degree, as they have the fewest chances of being matched later
+        degree = [indptr[v + 1] - indptr[v] for v in range(n)]
+        buckets = [[] for _ in range(max(degree, default=0) + 1)]
+        for v in range(n):
+            buckets[degree[v]].append(v)
+        for bucket in buckets:
+            for v in bucket:
+                if mate[v] != -1:
+                    continue
+                best, best_slot = -1, -1
+                for slot in range(indptr[v], indptr[v + 1]):
+                    w = indices[slot]
+                    if w != v and mate[w] == -1 and (best == -1 or degree[w] < degree[best]):
+                        best, best_slot = w, slot
+                if best != -1:
+                    mate[v], mate[best] = best, v
+                    mate_edge[v] = mate_edge[best] = adj_edges[best_slot]
+                    augmented += 1
+                    if on_augment is not None:  # An augmenting path of one edge
+                        on_augment([adj_edges[best_slot]])
+
+    parent = [-1] * n  # The vertex an odd vertex was reached from, or the next vertex of a blossom path
+    parent_edge = [-1] * n  # The edge joining each vertex to its parent
+    base = list(range(n))  # The base of the blossom each vertex is shrunk into
+    even = bytearray(n)
+    in_blossom = bytearray(n)
+    dead = bytearray(n)  # Vertices of trees that could not be augmented
+    ancestor = [-1] * n  # ancestor[b] == stamp if b is a base on the path from the first end to the root
+    stamp = 0
+
+    def lowest_common_base(a: int, b: int) -> int:
+        nonlocal stamp
+        stamp += 1
+        while True:
+            a = base[a]
+            ancestor[a] = stamp
+            if mate[a] == -1:  # The root
+                break
+            a = parent[mate[a]]
+        while True:
+            b = base[b]
+            if ancestor[b] == stamp:
+                return b
+            b = parent[mate[b]]
+
+    def mark_path(v: int, blossom_base: int, child: int, edge: int):
+        # Walk from v down to the base, marking the blossoms on the way and linking the even vertices
+        # to the vertex after them on the cycle, so augmenting paths can go around the blossom
+        while base[v] != blossom_base:
+            in_blossom[base[v]] = in_blossom[base[mate[v]]] = 1
+            parent[v], parent_edge[v] = child, edge
+            child = mate[v]
+            edge = parent_edge[child]
+            v = parent[child]
+
+    expansions = blossoms = 0
+    with stats.phase('augmentation'):
+        for root in range(n):
+            if mate[root] != -1 or dead[root]:
+                continue
+            even[root] = 1
+            queue = [root]  # The even vertices, in the order they are scanned
+            tree = [root]  # All vertices of the tree, to reset them afterward
+            end = -1
+            head = 0
+            while head < len(queue) and end == -1:
+                v = queue[head]
+                head += 1
+                for slot in range(indptr[v], indptr[v + 1]):
+                    w = indices[slot]
+                    if base[v] == base[w] or mate[v] == w or dead[w]:
+                        continue
+                    if w == root or (mate[w] != -1 and parent[mate[w]] != -1):  # w is even: a blossom
+                        blossoms += 1
+                        blossom_base = lowest_common_base(v, w)
+                        mark_path(v, blossom_base, w, adj_edges[slot])
+                        mark_path(w, blossom_base, v, adj_edges[slot])
+                        for u in tree:
+                            if in_blossom[base[u]]:
+                                base[u] = blossom_base
+                                if not even[u]:
+                                    even[u] = 1
+                                    queue.append(u)
+                        for u in tree:
+                            in_blossom[u] = 0
+                    elif parent[w] == -1:  # w is a new odd vertex
+                        parent[w], parent_edge[w] = v, adj_edges[slot]
+                        tree.append(w)
+                        if mate[w] == -1:
+                            end = w
+                            break
+                        x = mate[w]
+                        even[x] = 1
+                        queue.append(x)
+                        tree.append(x)
+
+            expansions += head
+            if end == -1:
+                for u in tree:
+                    dead[u] = 1
+            else:
+                # Flip the edges of the path, following the parent links back to the root
+                path = []
+                v = end
+                while v != -1:
+                    u = parent[v]
+                    w = mate[u]
+                    path.append(parent_edge[v])
+                    if w != -1:
+                        path.append(mate_edge[u])
+                    mate[v], mate[u] = u, v
+                    mate_edge[v] = mate_edge[u] = parent_edge[v]
+                    v = w
+                augmented += 1
+                if on_augment is not None:
+                    on_augment(path[::-1])
+
+            for u in tree:
+                parent[u] = parent_edge[u] = -1
+                base[u] = u
+                even[u] = 0
+    stats.count('bfs_expansions', expansions)
+    stats.count('blossoms', blossoms)
+    stats.count('augmenting_paths', augmented)
+
+    return mate, mate_edge
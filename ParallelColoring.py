@@ -0,0 +1,171 @@
+"""
+Parallel speculative graph coloring over a compressed-sparse-row (CSR) graph, after Gebremedhin and Manne.
+
+The vertices are split into contiguous parts with about the same number of edges, one per worker process.
+The CSR arrays and the colors live in shared memory, so every worker reads the colors the others write.
+Each round has two steps, separated by waiting for all workers:
+
+* color: every worker greedily colors its uncolored vertices, reading the current colors of their neighbors.
+  Two adjacent vertices in different parts may be colored at the same time and get the same color;
+* detect: every worker finds its vertices that share their color with a neighbor of lower index.
+  Those vertices are colored again in the next round.
+
+The vertex of lowest index among those colored again always keeps its new color, so each round makes
+progress, and in practice only a few rounds are needed. When few vertices are left, or after max_rounds
+rounds, they are colored by the calling process.
+"""
+import numpy as np
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Sequence, Tuple
+
+from Coloring import greedy_color
+
+_shared: Dict[str, Any] = {}  # The shared arrays, attached in each worker process
+
+
+def parallel_color(indptr: Sequence[int] | np.ndarray, indices: Sequence[int] | np.ndarray, workers: int = 2,
+                   max_rounds: int = 16, sequential_below: int = 1000,
+                   compare: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Colors a graph with speculative greedy coloring on a pool of worker processes.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param workers: The number of worker processes. With 1, the rounds run in the calling process.
+    :param max_rounds: The number of parallel rounds after which the remaining vertices are colored sequentially.
+    :param sequential_below: Vertices left to color are colored sequentially when there are fewer than this.
+    :param compare: If True, the report also gives the colors used by sequential greedy coloring in the natural order.
+    :return: The color of each vertex, and a report with the number of colors used, the conflicts repaired
+             in each round and the time taken.
+    """
+    start_time = time.perf_counter()
+    indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+    indices = np.ascontiguousarray(indices, dtype=np.int64)
+    n = len(indptr) - 1
+
+    # Split the vertices into parts with about the same number of neighbor entries
+    bounds = np.searchsorted(indptr, np.linspace(0, indptr[-1], workers + 1)[1:-1])
+    bounds = [0] + sorted(set(int(b) for b in bounds) - {0, n}) + [n]
+    parts = [range(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+    blocks = []
+    try:
+        names = {}
+        for name, array in (('indptr', indptr), ('indices', indices), ('colors', np.full(n, -1, dtype=np.int64))):
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 8))
+            blocks.append(block)
+            np.ndarray(array.shape, dtype=np.int64, buffer=block.buf)[:] = array
+            names[name] = block.name
+
+        conflicts = []
+        if workers > 1 and n:
+            with ProcessPoolExecutor(workers, initializer=_attach, initargs=(names, n)) as pool:
+                parts = _run_rounds(pool.map, parts, max_rounds, sequential_below, conflicts)
+        else:
+            _attach(names, n)
+            parts = _run_rounds(map, parts, max_rounds, sequential_below, conflicts)
+            _detach()
+
+        colors = np.ndarray(n, dtype=np.int64, buffer=blocks[2].buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    left = [v for part in parts for v in part]
+    if left:  # Finish the last vertices sequentially
+        colors_list = colors.tolist()
+        for v in left:  # They still hold the colors that conflicted
+            colors_list[v] = -1
+        greedy_color(indptr.tolist(), indices.tolist(), left, colors_list)
+        colors = np.array(colors_list, dtype=np.int64)
+
+    report = {
+        'vertices': n,
+        'workers': workers,
+        'rounds': len(conflicts),
+        'conflicts': conflicts,
+        'sequential_vertices': len(left),
+        'colors': int(colors.max()) + 1 if n else 0,
+        'seconds': time.perf_counter() - start_time,
+    }
+    if compare:
+        report['sequential_colors'] = max(greedy_color(indptr.tolist(), indices.tolist(), range(n)), default=-1) + 1
+    return colors, report
+
+
+def _run_rounds(map_, parts: List[Sequence[int]], max_rounds: int, sequential_below: int,
+                conflicts: List[int]) -> List[Sequence[int]]:
+    """
+    Runs color and detect rounds until no vertex is left, few vertices are left, or max_rounds is reached.
+
+    :param map_: The map function that runs a step on all parts, on the workers or in this process.
+    :param parts: The vertices to color in each part.
+    :param conflicts: Filled with the number of vertices to color again after each round.
+    :return: The vertices still uncolored in each part.
+    """
+    while any(parts) and len(conflicts) < max_rounds:
+        if conflicts and sum(map(len, parts)) < sequential_below:
+            break
+        list(map_(_color_part, parts))
+        parts = list(map_(_detect_part, parts))
+        conflicts.append(sum(map(len, parts)))
+    return parts
+
+
+def _attach(names: Dict[str, str], n: int):
+    """
+    Attaches the shared arrays in a worker process.
+    """
+    for name, block_name in names.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _shared[name + '_block'] = block
+        _shared[name] = block.buf.cast('q')  # A memoryview reads single ints much faster than a NumPy array
+    _shared['used'] = [0] * (n + 1)  # used[c] == stamp if a neighbor of the vertex being colored has color c
+    _shared['stamp'] = 0
+
+
+def _detach():
+    """
+    Releases the shared arrays attached by _attach.
+    """
+    for name in ('indptr', 'indices', 'colors'):
+        _shared.pop(name).release()
+        _shared.pop(name + '_block').close()
+
+
+def _color_part(vertices: Sequence[int]):
+    """
+    Colors the given vertices in order, each with the smallest color not used by its neighbors.
+    """
+    indptr, indices, colors, used = _shared['indptr'], _shared['indices'], _shared['colors'], _shared['used']
+    stamp = _shared['stamp']  # A vertex may be colored in several rounds, so the stamps only grow
+    for v in vertices:
+        stamp += 1
+        for neighbor in indices[indptr[v]:indptr[v + 1]]:
+            color = colors[neighbor]
+            if color != -1:
+                used[color] = stamp
+        color = 0
+        while used[color] == stamp:
+            color += 1
+        colors[v] = color
+    _shared['stamp'] = stamp
+
+
+def _detect_part(vertices: Sequence[int]) -> List[int]:
+    """
+    Returns the given vertices that share their color with a neighbor of lower index. Colors are only
+    read in this step, so every worker sees the colors of the whole round.
+    """
+    indptr, indices, colors = _shared['indptr'], _shared['indices'], _shared['colors']
+    conflicted = []
+    for v in vertices:
+        color = colors[v]
+        for neighbor in indices[indptr[v]:indptr[v + 1]]:
+            if neighbor < v and colors[neighbor] == color:
+                conflicted.append(v)
+                break
+    return conflicted
@@ -0,0 +1,106 @@
+import time
+from typing import Any, Dict
+
+
+class RenderQueue:
+    """
+    The RenderQueue class coalesces option changes on canvas items into frames.
+    It remembers the options last applied to each item, so a change to the value an item already
+    has is dropped, and only the items that really changed are configured when a frame is flushed.
+    At most frame_rate frames are flushed per second.
+    """
+
+    def __init__(self, canvas, frame_rate: float = 60.0):
+        """
+        :param canvas: The tkinter canvas whose items are configured.
+        :param frame_rate: The maximum number of frames flushed per second.
+        """
+        self.canvas = canvas
+        self.frame_interval = 1.0 / frame_rate
+        self.applied: Dict[int, Dict[str, Any]] = {}  # The options last applied to each item
+        self.pending: Dict[int, Dict[str, Any]] = {}  # The changes waiting for the next frame
+        self.last_flush = 0.0
+        self.scheduled = False  # Whether a flush is scheduled on the event loop
+
+    def created(self, item: int, **options):
+        """
+        Records the options an item was created with.
+
+        :param item: The canvas id of the item.
+        """
+        self.applied[item] = dict(options)
+
+    def forget(self, item: int):
+        """
+        Drops everything known about an item, after it was deleted from the canvas.
+
+        :param item: The canvas id of the item.
+        """
+        self.applied.pop(item, None)
+        self.pending.pop(item, None)
+
+    def get(self, item: int, option: str) -> Any:
+        """
+        Returns the value an option of an item has, or will have after the next frame.
+
+        :param item: The canvas id of the item.
+        :param option: The name of the option.
+        """
+        pending = self.pending.get(item)
+        if pending is not None and option in pending:
+            return pending[option]
+        applied = self.applied.get(item)
+        if applied is not None and option in applied:
+            return applied[option]
+        return self.canvas.itemcget(item, option)
+
+    def configure(self, item: int, **options):
+        """
+        Queues option changes for an item and schedules a frame on the event loop.
+        Options that already have the requested value are ignored.
+
+        :param item: The canvas id of the item.
+        """
+        applied = self.applied.get(item, {})
+        for option, value in options.items():
+            pending = self.pending.get(item)
+            if applied.get(option) == value:
+                if pending is not None:  # A queued change was undone before it was drawn
+                    pending.pop(option, None)
+                    if not pending:
+                        del self.pending[item]
+            else:
+                self.pending.setdefault(item, {})[option] = value
+
+        if self.pending and not self.scheduled:
+            self.scheduled = True
+            delay = max(0.0, self.last_flush + self.frame_interval - time.perf_counter())
+            self.canvas.after(int(delay * 1000), self._scheduled_flush)
+
+    def tick(self):
+        """
+        Flushes a frame if one is due. Used by code that runs without returning to the event loop,
+        such as an algorithm running on the main thread.
+        """
+        if self.pending and time.perf_counter() - self.last_flush >= self.frame_interval:
+            self.flush()
+            self.canvas.update()
+
+    def flush(self):
+        """
+        Applies all queued changes and draws them.
+        """
+        pending, self.pending = self.pending, {}
+        for item, options in pending.items():
+            self.canvas.itemconfigure(item, **options)
+            self.applied.setdefault(item, {}).update(options)
+        self.canvas.update_idletasks()
+        self.last_flush = time.perf_counter()
+
+    def _scheduled_flush(self):
+        """
+        Flushes the frame scheduled by configure.
+        """
+        self.scheduled = False
+        if self.pending:
+            self.flush()
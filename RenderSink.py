@@ -0,0 +1,177 @@
+from abc import ABC, abstractmethod
+from GraphEdge import Edge
+import time
+from typing import Any, Iterable, List, Tuple
+
+
+class RenderSink(ABC):
+    """
+    The RenderSink class is the interface through which a graph shows what the algorithms do.
+    Items are identified by the canvas ids that the graph uses as node and edge ids.
+    Sinks implement the drawing methods; flush and pause have defaults for sinks that draw immediately.
+
+    A sink whose active attribute is False draws nothing, and the algorithms skip building
+    their visualization and waiting between steps when rendering to it.
+    """
+
+    active = True
+
+    @abstractmethod
+    def color_edge(self, edge_id: int, color: str):
+        """
+        Colors an edge.
+
+        :param edge_id: The id of the edge.
+        :param color: The color to use.
+        """
+
+    @abstractmethod
+    def color_node(self, node_id: int, color: str):
+        """
+        Colors a node.
+
+        :param node_id: The id of the node.
+        :param color: The color to use.
+        """
+
+    @abstractmethod
+    def color_node_outline(self, node_id: int, color: str):
+        """
+        Colors the outline of a node.
+
+        :param node_id: The id of the node.
+        :param color: The color to use.
+        """
+
+    @abstractmethod
+    def direct_edges(self, edges: Iterable[Edge]):
+        """
+        Draws each edge as an arrow from its source to its destination.
+
+        :param edges: The edges to direct.
+        """
+
+    @abstractmethod
+    def delete_item(self, item_id: int):
+        """
+        Removes a node or an edge from the drawing.
+
+        :param item_id: The id of the node or edge.
+        """
+
+    @abstractmethod
+    def print_message(self, message: str):
+        """
+        Shows a message to the user.
+
+        :param message: The message.
+        """
+
+    def flush(self):
+        """
+        Draws everything queued so far, before the algorithm pauses. Sinks that draw immediately do nothing.
+        """
+        pass
+
+    def pause(self, delay: float):
+        """
+        Ends a step of the visualization: draws it and waits before the next one.
+        Sinks that record the steps to show them later do not wait, nor does TkRenderSink.
+
+        :param delay: Time (in seconds) to wait.
+        """
+        if delay:
+            self.flush()
+            time.sleep(delay)
+
+
+class NullRenderSink(RenderSink):
+    """
+    A sink that draws nothing, for running the algorithms headless at full speed.
+    """
+
+    active = False
+
+    def color_edge(self, edge_id: int, color: str):
+        pass
+
+    def color_node(self, node_id: int, color: str):
+        pass
+
+    def color_node_outline(self, node_id: int, color: str):
+        pass
+
+    def direct_edges(self, edges: Iterable[Edge]):
+        pass
+
+    def delete_item(self, item_id: int):
+        pass
+
+    def print_message(self, message: str):
+        pass
+
+
+class RecordingRenderSink(RenderSink):
+    """
+    A sink that records every call as a tuple, for tests and for replaying a run later.
+    Directing an edge is recorded as ('direct_edge', edge_id, source_id, dest_id).
+    """
+
+    def __init__(self):
+        self.events: List[Tuple[Any, ...]] = []
+
+    def color_edge(self, edge_id: int, color: str):
+        self.events.append(('color_edge', edge_id, color))
+
+    def color_node(self, node_id: int, color: str):
+        self.events.append(('color_node', node_id, color))
+
+    def color_node_outline(self, node_id: int, color: str):
+        self.events.append(('color_node_outline', node_id, color))
+
+    def direct_edges(self, edges: Iterable[Edge]):
+        for edge in edges:
+            self.events.append(('direct_edge', edge.id, edge.source.circle_id, edge.dest.circle_id))
+
+    def delete_item(self, item_id: int):
+        self.events.append(('delete_item', item_id))
+
+    def print_message(self, message: str):
+        self.events.append(('print_message', message))
+
+
+class TkRenderSink(RenderSink):
+    """
+    A sink that draws on the canvas of a GUIWindow.Window.
+    """
+
+    def __init__(self, window):
+        """
+        :param window: The window to draw on.
+        """
+        self.window = window
+
+    def color_edge(self, edge_id: int, color: str):
+        self.window.color_edge(edge_id, color)
+
+    def color_node(self, node_id: int, color: str):
+        self.window.color_node(node_id, color)
+
+    def color_node_outline(self, node_id: int, color: str):
+        self.window.color_node_outline(node_id, color)
+
+    def direct_edges(self, edges: Iterable[Edge]):
+        self.window.direct_graph(edges)
+
+    def delete_item(self, item_id: int):
+        self.window.delete_item(item_id)
+
+    def print_message(self, message: str):
+        self.window.print_to_gui(message)
+
+    def flush(self):
+        self.window.render_queue.flush()
+
+    def pause(self, delay: float):
+        # Sleeping would freeze the window's event loop; a run is animated by replaying its trace instead
+        self.flush()
@@ -0,0 +1,85 @@
+from GraphNode import Node
+from math import floor
+from typing import Dict, Iterable, List, Tuple
+
+
+class SpatialGrid:
+    """
+    The SpatialGrid class is a uniform grid over node centres, used for hit-testing.
+    Each node is stored in the cell containing its centre, so a point only has to be
+    tested against the nodes in the few cells within the largest radius of it.
+    """
+
+    def __init__(self, cell_size: float = 40.0):
+        """
+        Initializes an empty grid.
+
+        :param cell_size: The side length of a cell.
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Node]] = {}
+        self.max_radius = 0.0  # An upper bound on the radius of every node in the grid
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Returns the cell containing a point.
+        """
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def insert(self, node: Node):
+        """
+        Adds a node to the cell containing its centre.
+
+        :param node: The node to add.
+        """
+        self.cells.setdefault(self._cell(node.x, node.y), []).append(node)
+        self.max_radius = max(self.max_radius, node.radius)
+
+    def remove(self, node: Node):
+        """
+        Removes a node from the grid. The node must not have moved since it was inserted.
+
+        :param node: The node to remove.
+        """
+        key = self._cell(node.x, node.y)
+        cell = self.cells[key]
+        cell.remove(node)
+        if not cell:
+            del self.cells[key]
+
+    def rebuild(self, nodes: Iterable[Node]):
+        """
+        Rebuilds the grid from scratch, after nodes have moved or been resized.
+        The cell size is set to twice the largest radius, so a query looks at no more than four cells.
+
+        :param nodes: All nodes that should be in the grid.
+        """
+        nodes = list(nodes)
+        self.max_radius = max((node.radius for node in nodes), default=0.0)
+        if self.max_radius > 0:
+            self.cell_size = 2 * self.max_radius
+        self.cells = {}
+        for node in nodes:
+            self.cells.setdefault(self._cell(node.x, node.y), []).append(node)
+
+    def find(self, x: float, y: float) -> Node | None:
+        """
+        Finds the node whose circle contains a point. If several do, the one with the nearest centre is returned.
+
+        :param x: The x-coordinate of the point.
+        :param y: The y-coordinate of the point.
+        :return: The node, or None if the point is not inside any node.
+        """
+        reach = self.max_radius
+        min_i, min_j = self._cell(x - reach, y - reach)
+        max_i, max_j = self._cell(x + reach, y + reach)
+
+        found = None
+        best = None
+        for i in range(min_i, max_i + 1):
+            for j in range(min_j, max_j + 1):
+                for node in self.cells.get((i, j), ()):
+                    distance = (x - node.x) ** 2 + (y - node.y) ** 2
+                    if distance <= node.radius ** 2 and (best is None or distance < best):
+                        found, best = node, distance
+        return found
@@ -0,0 +1,146 @@
+import time
+from typing import Any, Callable, Dict, List
+
+from AlgorithmTrace import Trace
+
+
+class TracePlayer:
+    """
+    The TracePlayer class replays a Trace on a GUIWindow.Window without blocking its event loop:
+    each step is scheduled with after(), waiting the delay recorded after the previous step divided
+    by the speed. Steps recorded without a delay are shown together, up to one frame of work at a time.
+
+    The options the items of the trace had before the run are remembered, so the replay can seek
+    to any step, backward as well as forward, by folding the events up to that step into the final
+    options of each item and applying those once.
+    """
+
+    def __init__(self, window, trace: Trace, speed: float = 1.0,
+                 on_position: Callable[[int], None] | None = None):
+        """
+        :param window: The window to replay on. Its items must still look as they did before the run.
+        :param trace: The trace to replay.
+        :param speed: How many times faster than recorded the steps follow each other.
+        :param on_position: Called with the number of steps shown whenever it changes.
+        """
+        self.window = window
+        self.trace = trace
+        self.speed = speed
+        self.on_position = on_position
+        self.position = 0  # The number of steps shown
+        self.playing = False
+        self._job = None  # The id of the scheduled after() call
+
+        # The options of every item changed by the trace, as they were before the run
+        self.initial: Dict[int, Dict[str, Any]] = {}
+        for event in trace.events:
+            change = window.trace_options(event)
+            if change is not None:
+                item, options = change
+                before = self.initial.setdefault(item, {})
+                for option in options:
+                    if option not in before:
+                        before[option] = window.render_queue.get(item, option)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= self.trace.step_count
+
+    def play(self):
+        """
+        Starts or resumes the replay, from the start if it is finished.
+        """
+        if self.finished:
+            self.seek(0)
+        self.playing = True
+        self._schedule(0.0)
+
+    def pause(self):
+        """
+        Stops the replay after the current step.
+        """
+        self.playing = False
+        if self._job is not None:
+            self.window.after_cancel(self._job)
+            self._job = None
+
+    def step(self):
+        """
+        Pauses and shows the next step.
+        """
+        self.pause()
+        if not self.finished:
+            self._show_step()
+            self._moved()
+
+    def seek(self, position: int):
+        """
+        Shows the state after the given number of steps, without showing the steps in between.
+        """
+        position = max(0, min(position, self.trace.step_count))
+        state = {item: dict(options) for item, options in self.initial.items()}
+        messages: List[str] = []
+        for event in self.trace.events[:self.trace.starts[position]]:
+            if event[0] == 'print_message':
+                messages.append(event[1])
+                continue
+            change = self.window.trace_options(event)
+            if change is not None:
+                state[change[0]].update(change[1])
+        for item, options in state.items():
+            self.window.render_queue.configure(item, **options)
+        self.window.clear_message_box()
+        for message in messages:
+            self.window.print_to_gui(message)
+        self.position = position
+        self._moved()
+
+    def set_speed(self, speed: float):
+        """
+        Changes the speed, from the next step on.
+        """
+        self.speed = speed
+
+    def finish(self):
+        """
+        Stops the replay and shows the end of the run.
+        """
+        self.pause()
+        if not self.finished:
+            self.seek(self.trace.step_count)
+
+    def _schedule(self, delay: float):
+        self._job = self.window.after(int(delay * 1000 / max(self.speed, 1e-3)), self._tick)
+
+    def _tick(self):
+        """
+        Shows the next steps: the next one, and the ones after it as long as no delay separates them
+        and a frame's worth of time has not passed.
+        """
+        self._job = None
+        if not self.playing:
+            return
+        frame_end = time.perf_counter() + self.window.render_queue.frame_interval
+        while not self.finished:
+            self._show_step()
+            if self.trace.delay(self.position - 1) > 0 or time.perf_counter() >= frame_end:
+                break
+        self._moved()
+        if self.finished:
+            self.playing = False
+        else:
+            self._schedule(self.trace.delay(self.position - 1))
+
+    def _show_step(self):
+        for event in self.trace.step(self.position):
+            if event[0] == 'print_message':
+                self.window.print_to_gui(event[1])
+                continue
+            change = self.window.trace_options(event)
+            if change is not None:
+                self.window.render_queue.configure(change[0], **change[1])
+        self.position += 1
+
+    def _moved(self):
+        if self.on_position is not None:
+            self.on_position(self.position)
@@ -0,0 +1,149 @@
+"""
+Breadth-first and depth-first traversals shared by the graph algorithms, in O(V + E) time and memory.
+
+Each traversal is a generator that yields the vertices in the order they are visited, so a caller
+can stop early by leaving the loop. While it runs it fills a parent map (which doubles as the visited
+set) and optionally a level map, so the tree and the distances can be read during or after the traversal.
+
+bfs and dfs work on any vertices, such as nodes, given a function returning the neighbors of a vertex,
+and keep their maps in dicts. bfs_csr and dfs_csr work on vertex indices of a graph in
+compressed-sparse-row (CSR) form, and keep their maps in lists.
+"""
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Sequence
+
+
+def bfs(sources: Iterable[Hashable], neighbors: Callable[[Any], Iterable[Hashable]],
+        parent: Dict[Any, Any] | None = None, level: Dict[Any, int] | None = None,
+        allow: Callable[[Any], bool] | None = None) -> Iterator[Any]:
+    """
+    Yields the vertices reachable from the sources in breadth-first order.
+
+    :param sources: The vertices to start from, at level 0.
+    :param neighbors: Returns the neighbors of a vertex.
+    :param parent: If given, filled with the BFS parent of each visited vertex, None for the sources.
+                   Vertices already in it are treated as visited.
+    :param level: If given, filled with the distance of each visited vertex from the sources.
+    :param allow: If given, vertices for which it returns False are never entered.
+    """
+    if parent is None:
+        parent = {}
+    queue = deque()
+    for source in sources:
+        if source not in parent:
+            parent[source] = None
+            if level is not None:
+                level[source] = 0
+            queue.append(source)
+
+    while queue:
+        vertex = queue.popleft()
+        yield vertex
+        for neighbor in neighbors(vertex):
+            if neighbor not in parent and (allow is None or allow(neighbor)):
+                parent[neighbor] = vertex
+                if level is not None:
+                    level[neighbor] = level[vertex] + 1
+                queue.append(neighbor)
+
+
+def dfs(sources: Iterable[Hashable], neighbors: Callable[[Any], Iterable[Hashable]],
+        parent: Dict[Any, Any] | None = None, level: Dict[Any, int] | None = None,
+        allow: Callable[[Any], bool] | None = None) -> Iterator[Any]:
+    """
+    Yields the vertices reachable from the sources in depth-first preorder, with an explicit stack.
+    The parameters are those of bfs, and level holds the depth in the DFS tree.
+    """
+    if parent is None:
+        parent = {}
+    for source in sources:
+        if source in parent:
+            continue
+        parent[source] = None
+        if level is not None:
+            level[source] = 0
+        yield source
+        stack = [(source, iter(neighbors(source)))]  # The DFS path, with the neighbors left to visit
+        while stack:
+            vertex, remaining = stack[-1]
+            for neighbor in remaining:
+                if neighbor not in parent and (allow is None or allow(neighbor)):
+                    parent[neighbor] = vertex
+                    if level is not None:
+                        level[neighbor] = level[vertex] + 1
+                    yield neighbor
+                    stack.append((neighbor, iter(neighbors(neighbor))))
+                    break
+            else:  # All neighbors are done, go back up
+                stack.pop()
+
+
+def bfs_csr(indptr: Sequence[int], indices: Sequence[int], sources: Iterable[int], parent: List[int],
+            level: List[int] | None = None, blocked: Sequence[int] | None = None) -> Iterator[int]:
+    """
+    Yields the vertex indices reachable from the sources in breadth-first order.
+
+    :param indptr: The CSR offsets of the graph.
+    :param indices: The CSR neighbors of the graph.
+    :param sources: The vertices to start from, at level 0.
+    :param parent: One entry per vertex, -1 for the vertices not visited yet. Filled with the BFS parent
+                   of each visited vertex; a source is its own parent.
+    :param level: If given, one entry per vertex, filled with the distance of each visited vertex from the sources.
+    :param blocked: If given, the vertices v with blocked[v] true are never entered.
+    """
+    queue = []  # Vertices are never removed, the head index moves forward instead
+    for source in sources:
+        if parent[source] == -1:
+            parent[source] = source
+            if level is not None:
+                level[source] = 0
+            queue.append(source)
+
+    head = 0
+    while head < len(queue):
+        vertex = queue[head]
+        head += 1
+        yield vertex
+        for neighbor in indices[indptr[vertex]:indptr[vertex + 1]]:
+            if parent[neighbor] == -1 and (blocked is None or not blocked[neighbor]):
+                parent[neighbor] = vertex
+                if level is not None:
+                    level[neighbor] = level[vertex] + 1
+                queue.append(neighbor)
+
+
+def dfs_csr(indptr: Sequence[int], indices: Sequence[int], sources: Iterable[int], parent: List[int],
+            level: List[int] | None = None, blocked: Sequence[int] | None = None) -> Iterator[int]:
+    """
+    Yields the vertex indices reachable from the sources in depth-first preorder, with an explicit stack.
+    The parameters are those of bfs_csr, and level holds the depth in the DFS tree.
+    """
+    next_slot: Dict[int, int] = {}  # The next neighbor to visit, for the vertices on the stack
+    for source in sources:
+        if parent[source] != -1:
+            continue
+        parent[source] = source
+        if level is not None:
+            level[source] = 0
+        yield source
+        stack = [source]
+        next_slot[source] = indptr[source]
+        while stack:
+            vertex = stack[-1]
+            slot, end = next_slot[vertex], indptr[vertex + 1]
+            while slot < end:
+                neighbor = indices[slot]
+                slot += 1
+                if parent[neighbor] == -1 and (blocked is None or not blocked[neighbor]):
+                    break
+            else:  # All neighbors are done, go back up
+                stack.pop()
+                del next_slot[vertex]
+                continue
+            next_slot[vertex] = slot
+            parent[neighbor] = vertex
+            if level is not None:
+                level[neighbor] = level[vertex] + 1
+            yield neighbor
+            stack.append(neighbor)
+            next_slot[neighbor] = indptr[neighbor]
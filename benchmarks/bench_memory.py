@@ -0,0 +1,71 @@
+"""
+Measures the memory used per node and per edge.
+
+The "before" figures use copies of the dict-based Node and Edge classes that the graph used before
+they were slotted, so both layouts can be compared in one run:
+
+    python benchmarks/bench_memory.py [count]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GraphEdge import Edge  # noqa: E402
+from GraphNode import Node  # noqa: E402
+
+
+class DictNode:
+    """The node layout before slotting: an instance __dict__ with underscored fields behind properties."""
+
+    def __init__(self, x, y, circle_id):
+        self._circle_id = circle_id
+        self._x = x
+        self._y = y
+        self._radius = 20
+        self._color = -1
+        self._group = 'None'
+        self.neighbors = []
+
+
+class DictEdge:
+    """The edge layout before slotting."""
+
+    def __init__(self, source_node, dest_node, edge_id):
+        self._source = source_node
+        self._dest = dest_node
+        self._id = edge_id
+
+
+def bytes_per_object(factory, count: int) -> float:
+    """
+    Returns the average number of bytes allocated by a factory call, over count calls.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects is not part of their cost
+    return (after - before - sys.getsizeof(objects)) / len(objects)
+
+
+def main(count: int):
+    # Coordinates and ids above the small int cache, as in a real graph
+    old_node, new_node = DictNode(0.5, 0.5, 1000), Node(0.5, 0.5, 1000)
+    rows = [
+        ("node", bytes_per_object(lambda i: DictNode(i + 0.5, i + 0.5, i + 1000), count),
+         bytes_per_object(lambda i: Node(i + 0.5, i + 0.5, i + 1000), count)),
+        ("edge", bytes_per_object(lambda i: DictEdge(old_node, old_node, i + 1000), count),
+         bytes_per_object(lambda i: Edge(new_node, new_node, i + 1000), count)),
+    ]
+
+    print(f"{count} objects of each kind")
+    print(f"{'':6}{'before':>12}{'after':>12}{'saved':>10}")
+    for name, before, after in rows:
+        print(f"{name:6}{before:>10.1f} B{after:>10.1f} B{1 - after / before:>10.0%}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,275 @@
+"""
+Times the GAlgorithm entry points headlessly on families of generated graphs of growing size, and fits
+how the time grows with the size of the graph.
+
+Every graph is generated from a seed made of its family and size, so runs are comparable. A size is
+about the number of edges of the graph. For each family, algorithm and size the wall time (the best of
+the repeats) and the peak memory allocated by the run (in a separate run under tracemalloc) are recorded.
+The growth exponent of each family and algorithm is the slope of log(time) over log(nodes + edges).
+An algorithm that takes longer than the budget on a family is not run on its larger graphs.
+
+    python benchmarks/bench_scaling.py [--max-size 1000000] [--output run.json] [--baseline base.json]
+
+With --baseline, times that grew by more than the tolerance, and exponents that grew by more than
+0.15, are reported as regressions, and the exit status is 1.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Coloring  # noqa: E402
+from Graph import Graph  # noqa: E402
+from GraphAlgorithms import GAlgorithm  # noqa: E402
+
+
+def _graph(n: int, edges) -> Graph:
+    """
+    Builds a graph without a GUI from a number of nodes and an iterable of node pairs.
+    """
+    graph = Graph(None)
+    for i in range(n):
+        graph.add_node(i, i % 1000 * 50.0, i // 1000 * 50.0)
+    for k, (u, v) in enumerate(edges):
+        graph.add_edge(u, v, k)
+    return graph
+
+
+def random_bipartite(size: int, rng: random.Random) -> Graph:
+    """Two sides of size / 4 nodes, each left node joined to about four random right nodes."""
+    half = max(size // 4, 2)
+    return _graph(2 * half, ((u, half + rng.randrange(half)) for u in range(half) for _ in range(4)))
+
+
+def regular(size: int, rng: random.Random, k: int = 4) -> Graph:
+    """A k-regular circulant graph, each node joined to the k / 2 next ones on a cycle, with the nodes shuffled."""
+    n = max(2 * size // k, k + 1)
+    label = list(range(n))
+    rng.shuffle(label)
+    return _graph(n, ((label[i], label[(i + d) % n]) for i in range(n) for d in range(1, k // 2 + 1)))
+
+
+def odd_cycle(size: int, rng: random.Random) -> Graph:
+    """A cycle on an odd number of nodes."""
+    n = size | 1
+    return _graph(n, ((i, (i + 1) % n) for i in range(n)))
+
+
+def path(size: int, rng: random.Random) -> Graph:
+    """A path on size + 1 nodes, so a BFS has one node per level."""
+    return _graph(size + 1, ((i, i + 1) for i in range(size)))
+
+
+def perfect_matching(size: int, rng: random.Random) -> Graph:
+    """Size disjoint edges, so every component is two nodes."""
+    return _graph(2 * size, ((2 * i, 2 * i + 1) for i in range(size)))
+
+
+def complete(size: int, rng: random.Random) -> Graph:
+    """A complete graph with about size edges."""
+    n = max(int(math.sqrt(2 * size)), 2)
+    return _graph(n, ((u, v) for u in range(n) for v in range(u + 1, n)))
+
+
+def grid(size: int, rng: random.Random) -> Graph:
+    """A square grid with about size edges."""
+    side = max(int(math.sqrt(size / 2)), 2)
+    edges = [(r * side + c, r * side + c + 1) for r in range(side) for c in range(side - 1)]
+    edges += [(r * side + c, (r + 1) * side + c) for r in range(side - 1) for c in range(side)]
+    return _graph(side * side, edges)
+
+
+def cut_vertices(size: int, rng: random.Random) -> Graph:
+    """A chain of 5-cliques, each sharing one node with the next, so every shared node is a cut vertex."""
+    blocks = max(size // 10, 2)
+    edges = []
+    for b in range(blocks):
+        clique = range(4 * b, 4 * b + 5)
+        edges += [(u, v) for u in clique for v in clique if u < v]
+    return _graph(4 * blocks + 1, edges)
+
+
+FAMILIES = {
+    'random-bipartite': random_bipartite,
+    'regular': regular,
+    'odd-cycle': odd_cycle,
+    'path': path,
+    'perfect-matching': perfect_matching,
+    'complete': complete,
+    'grid': grid,
+    'cut-vertices': cut_vertices,
+}
+
+BIPARTITE = {'random-bipartite', 'grid', 'path', 'perfect-matching'}  # The families hungarian_algorithm can run on
+
+
+def _uncolor(graph: Graph):
+    for node in graph.node_list:
+        node.color = -1
+
+
+def _algorithms():
+    """
+    Returns the benchmarked entry points by name, each as a function of the algorithms object and its graph.
+    """
+    algorithms = {
+        'is_bipartite': lambda algos, graph: algos.is_bipartite(),
+        'hungarian_algorithm': lambda algos, graph: algos.hungarian_algorithm(0),
+        'blossom_matching': lambda algos, graph: algos.blossom_matching(0),
+        'brooks_algorithm': lambda algos, graph: algos.brooks_algorithm(graph, 0),
+        'tarjan_algorithm_cut_vertex': lambda algos, graph: algos.tarjan_algorithm_cut_vertex(graph.node_list),
+        'greedy_coloring': lambda algos, graph: (_uncolor(graph), algos.greedy_coloring(graph.node_list, 0)),
+    }
+    for strategy in Coloring.STRATEGIES:
+        algorithms['color_graph:' + strategy] = (lambda strategy: lambda algos, graph: algos.color_graph(strategy))(strategy)
+    return algorithms
+
+
+def measure(run, algos: GAlgorithm, graph: Graph, repeat: int, memory: bool) -> tuple[float, int | None]:
+    """
+    Returns the best wall time of repeat runs, and the peak memory allocated by one more run if memory is True.
+    """
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(algos, graph)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        run(algos, graph)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def growth_exponent(points: list[tuple[int, float]]) -> float | None:
+    """
+    Returns the least-squares slope of log(seconds) over log(size), ignoring times under a millisecond,
+    which are mostly overhead. None if fewer than two points are left.
+    """
+    points = [(math.log(size), math.log(seconds)) for size, seconds in points if seconds >= 1e-3]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_suite(sizes: list[int], families: list[str], algorithms: list[str], repeat: int, memory: bool,
+              budget: float, log=sys.stderr) -> dict:
+    """
+    Runs every algorithm on every family at every size, and returns the results and fitted exponents.
+    """
+    entries = _algorithms()
+    results = []
+    over_budget = set()  # (family, algorithm) pairs that are no longer run
+    for family in families:
+        for size in sizes:
+            runnable = [name for name in algorithms if (family, name) not in over_budget
+                        and (name != 'hungarian_algorithm' or family in BIPARTITE)]
+            if not runnable:
+                continue
+            start = time.perf_counter()
+            graph = FAMILIES[family](size, random.Random(f"{family}-{size}"))
+            build = time.perf_counter() - start
+            nodes, edges = len(graph.node_list), len(graph.edge_list)
+            print(f"{family} size {size}: {nodes} nodes, {edges} edges, built in {build:.2f} s", file=log)
+            algos = GAlgorithm(graph)
+            for name in runnable:
+                seconds, peak = measure(entries[name], algos, graph, repeat, memory)
+                results.append({'family': family, 'algorithm': name, 'size': size, 'nodes': nodes, 'edges': edges,
+                                'seconds': seconds, 'peak_bytes': peak})
+                print(f"  {name:32}{seconds:>10.4f} s" + (f"{peak / 2 ** 20:>10.1f} MiB" if memory else ''), file=log)
+                if seconds > budget:
+                    over_budget.add((family, name))
+
+    exponents = {}
+    for family in families:
+        for name in algorithms:
+            points = [(r['nodes'] + r['edges'], r['seconds']) for r in results
+                      if r['family'] == family and r['algorithm'] == name]
+            exponent = growth_exponent(points)
+            if exponent is not None:
+                exponents[f"{family}/{name}"] = exponent
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'results': results,
+        'exponents': exponents,
+    }
+
+
+def compare(run: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Returns a description of every time or growth exponent of the run that regressed against the baseline.
+    Times under 10 ms are too noisy to compare.
+    """
+    regressions = []
+    base_times = {(r['family'], r['algorithm'], r['size']): r['seconds'] for r in baseline['results']}
+    for r in run['results']:
+        before = base_times.get((r['family'], r['algorithm'], r['size']))
+        if before is not None and r['seconds'] >= 0.01 and r['seconds'] > before * (1 + tolerance):
+            regressions.append(f"{r['family']}/{r['algorithm']} at size {r['size']}: "
+                               f"{before:.4f} s -> {r['seconds']:.4f} s ({r['seconds'] / before - 1:+.0%})")
+    for key, exponent in run['exponents'].items():
+        before = baseline['exponents'].get(key)
+        if before is not None and exponent > before + 0.15:
+            regressions.append(f"{key} growth exponent: {before:.2f} -> {exponent:.2f}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--min-size', type=int, default=100, help="The smallest size, about a number of edges.")
+    parser.add_argument('--max-size', type=int, default=1_000_000, help="The largest size; sizes grow tenfold.")
+    parser.add_argument('--family', action='append', choices=list(FAMILIES), help="Only run these families.")
+    parser.add_argument('--algorithm', action='append', choices=list(_algorithms()), help="Only run these algorithms.")
+    parser.add_argument('--repeat', type=int, default=3, help="The number of timed runs, the best one is kept.")
+    parser.add_argument('--no-memory', action='store_true', help="Do not measure peak memory.")
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help="Seconds after which an algorithm is not run on the larger graphs of a family.")
+    parser.add_argument('--output', help="Write the JSON results to this file instead of stdout.")
+    parser.add_argument('--baseline', help="Compare the run against the JSON results of an earlier run.")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="The relative slowdown reported as a regression.")
+    args = parser.parse_args(argv)
+
+    sizes = []
+    size = args.min_size
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 10
+    run = run_suite(sizes, args.family or list(FAMILIES), args.algorithm or list(_algorithms()), args.repeat,
+                    not args.no_memory, args.budget)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(run, json.load(file), args.tolerance)
+        run['regressions'] = regressions
+        for regression in regressions:
+            print("REGRESSION " + regression, file=sys.stderr)
+        status = 1 if regressions else 0
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(run, file, indent=2)
+    else:
+        json.dump(run, sys.stdout, indent=2)
+        print()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
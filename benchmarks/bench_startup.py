@@ -0,0 +1,78 @@
+"""
+Measures how long the core modules take to import, each in a fresh interpreter, and checks that
+importing them loads neither tkinter nor NumPy, which are only needed by the GUI and the array paths:
+
+    python benchmarks/bench_startup.py [--repeat 5] [--target-ms 30]
+
+For each module the cumulative import time reported by python -X importtime is given, the best of
+the repeats, together with the part spent in the project's own modules. Bytecode is written by a first
+run, so the timed runs do not compile. The exit status is 1 if a module is over the target or loads
+a module it should not.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CORE = ('Graph', 'GraphAlgorithms', 'GraphIO', 'GraphCLI', 'Matching', 'Coloring', 'BrooksColoring')
+FORBIDDEN = ('tkinter', 'numpy')  # Modules that must not be loaded by importing the core
+
+
+def _project_modules() -> set:
+    return {name[:-3] for name in os.listdir(ROOT) if name.endswith('.py')}
+
+
+def import_times(module: str) -> tuple[float, float, list[str]]:
+    """
+    Imports a module in a fresh interpreter.
+
+    :return: The cumulative import time of the module and the time spent in project modules, in milliseconds,
+             and the forbidden modules that were loaded.
+    """
+    code = f"import sys; import {module}; print(' '.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+    project = _project_modules()
+    total = own = 0.0
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name in project:
+            own += int(self_us) / 1000
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, own, process.stdout.split()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=5, help="The number of timed imports, the best one is kept.")
+    parser.add_argument('--target-ms', type=float, default=30.0, help="The longest acceptable import time.")
+    parser.add_argument('modules', nargs='*', default=list(CORE), help="The modules to import.")
+    args = parser.parse_args(argv)
+
+    status = 0
+    print(f"{'module':20}{'import':>12}{'own':>12}")
+    for module in args.modules:
+        import_times(module)  # Writes the bytecode
+        runs = [import_times(module) for _ in range(args.repeat)]
+        total, own, loaded = min(runs)
+        problems = []
+        if loaded:
+            problems.append("loads " + ", ".join(loaded))
+        if total > args.target_ms:
+            problems.append(f"over {args.target_ms:g} ms")
+        if problems:
+            status = 1
+        print(f"{module:20}{total:>9.1f} ms{own:>9.1f} ms  " + "; ".join(problems))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
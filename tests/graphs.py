@@ -0,0 +1,220 @@
+"""
+Small random graphs in compressed-sparse-row (CSR) form or as Graph objects, and brute-force checks for the tests.
+"""
+import itertools
+import random
+from typing import List, Sequence, Tuple
+
+from Graph import Graph
+
+
+def to_csr(n: int, edges: Sequence[Tuple[int, int]]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Returns the CSR lists (indptr, indices, adj_edges) of an undirected graph, like GraphSnapshot.as_lists.
+    """
+    adjacency = [[] for _ in range(n)]
+    for k, (u, v) in enumerate(edges):
+        adjacency[u].append((v, k))
+        adjacency[v].append((u, k))
+    indptr, indices, adj_edges = [0], [], []
+    for neighbors in adjacency:
+        for v, k in neighbors:
+            indices.append(v)
+            adj_edges.append(k)
+        indptr.append(len(indices))
+    return indptr, indices, adj_edges
+
+
+def to_graph(n: int, edges: Sequence[Tuple[int, int]], weights: Sequence[float] | None = None) -> Graph:
+    """
+    Returns a Graph without a GUI whose node ids are 0 .. n - 1, laid out on a grid, and whose edge ids are
+    1000 + the position of the edge.
+    """
+    graph = Graph()
+    for v in range(n):
+        graph.add_node(v, v % 20 * 50.0, v // 20 * 50.0)
+    for k, (u, v) in enumerate(edges):
+        graph.add_edge(u, v, 1000 + k, 1.0 if weights is None else weights[k])
+    return graph
+
+
+def random_graph(rng: random.Random, n: int, p: float) -> List[Tuple[int, int]]:
+    return [(u, v) for u, v in itertools.combinations(range(n), 2) if rng.random() < p]
+
+
+def random_bipartite(rng: random.Random, left: int, right: int, p: float) -> List[Tuple[int, int]]:
+    """
+    Returns a random bipartite graph whose left side is 0 .. left - 1.
+    """
+    return [(u, left + v) for u in range(left) for v in range(right) if rng.random() < p]
+
+
+def random_near_regular(rng: random.Random, degrees: List[int]) -> List[Tuple[int, int]] | None:
+    """
+    Returns a random simple graph with the given degrees, by pairing random free edge ends, or None if
+    no attempt could pair them all.
+    """
+    for _ in range(100):
+        stubs = [v for v, degree in enumerate(degrees) for _ in range(degree)]
+        edges = set()
+        while stubs:
+            u = stubs.pop(rng.randrange(len(stubs)))
+            free = [i for i, v in enumerate(stubs) if v != u and (min(u, v), max(u, v)) not in edges]
+            if not free:
+                break
+            v = stubs.pop(rng.choice(free))
+            edges.add((min(u, v), max(u, v)))
+        else:
+            return sorted(edges)
+    return None
+
+
+def regular_with_cut_vertex(rng: random.Random, d: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Returns a random d-regular graph in which vertex 0 is a cut vertex: its d edges go to two or more
+    parts where every other vertex has degree d.
+    """
+    unit = 2 if d % 2 == 0 else 1  # A part has an even degree sum, so for even d it takes an even number of ports
+    while True:
+        cuts = sorted(rng.sample(range(1, d // unit), rng.randint(1, d // unit - 1)))
+        # The number of edges from vertex 0 into each part
+        ports = [unit * (b - a) for a, b in zip([0] + cuts, cuts + [d // unit])]
+        n, edges = 1, []
+        for count in ports:
+            size = rng.randint(d + 1, d + 6)
+            if (size * d - count) % 2:
+                size += 1
+            part = random_near_regular(rng, [d - 1] * count + [d] * (size - count))
+            if part is None:
+                break
+            edges += [(n + u, n + v) for u, v in part] + [(0, n + i) for i in range(count)]
+            n += size
+        else:
+            return n, edges
+
+
+def components(indptr: Sequence[int], indices: Sequence[int]) -> List[List[int]]:
+    n = len(indptr) - 1
+    seen = [False] * n
+    result = []
+    for start in range(n):
+        if not seen[start]:
+            seen[start] = True
+            component, stack = [], [start]
+            while stack:
+                v = stack.pop()
+                component.append(v)
+                for u in indices[indptr[v]:indptr[v + 1]]:
+                    if not seen[u]:
+                        seen[u] = True
+                        stack.append(u)
+            result.append(component)
+    return result
+
+
+def is_proper(indptr: Sequence[int], indices: Sequence[int], colors: Sequence[int]) -> bool:
+    return all(colors[v] >= 0 and colors[v] != colors[u]
+               for v in range(len(indptr) - 1) for u in indices[indptr[v]:indptr[v + 1]])
+
+
+def brooks_bound(indptr: Sequence[int], indices: Sequence[int], component: List[int]) -> int:
+    """
+    Returns the number of colors Brooks' theorem allows for a connected component: its maximum degree,
+    one more for a complete graph or an odd cycle, and 1 for an isolated vertex.
+    """
+    degrees = [indptr[v + 1] - indptr[v] for v in component]
+    d = max(degrees)
+    if d == 0:
+        return 1
+    if len(component) == d + 1 and min(degrees) == d:
+        return d + 1
+    if d == 2 and min(degrees) == 2 and len(component) % 2:
+        return 3
+    return d
+
+
+def maximum_matching_size(n: int, edges: Sequence[Tuple[int, int]]) -> int:
+    """
+    Returns the size of a maximum matching by trying, for the lowest unmatched vertex, every way to match it
+    or to leave it out, memoized over the set of vertices still free.
+    """
+    adjacency = [0] * n
+    for u, v in edges:
+        adjacency[u] |= 1 << v
+        adjacency[v] |= 1 << u
+    memo = {}
+
+    def best(free: int) -> int:
+        if free == 0:
+            return 0
+        if free not in memo:
+            v = (free & -free).bit_length() - 1
+            rest = free & ~(1 << v)
+            result = best(rest)
+            candidates = adjacency[v] & rest
+            while candidates:
+                low = candidates & -candidates
+                result = max(result, 1 + best(rest & ~low))
+                candidates ^= low
+            memo[free] = result
+        return memo[free]
+
+    return best((1 << n) - 1)
+
+
+def count_components(n: int, edges: Sequence[Tuple[int, int]], removed: int = -1) -> int:
+    """
+    Returns the number of connected components of the graph without the vertex removed.
+    """
+    parent = list(range(n))
+
+    def find(v: int) -> int:
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    for u, v in edges:
+        if removed not in (u, v):
+            parent[find(u)] = find(v)
+    return sum(1 for v in range(n) if v != removed and find(v) == v)
+
+
+def brute_force_blocks(n: int, edges: Sequence[Tuple[int, int]]) -> List[frozenset]:
+    """
+    Returns the vertex sets of the blocks: two edges are in the same block if no vertex separates them, that is,
+    for every vertex x their ends other than x stay connected in G - x. Isolated vertices are blocks of one.
+    """
+    def connected_without(x: int, a: int, b: int) -> bool:
+        reach, stack = {a}, [a]
+        while stack:
+            v = stack.pop()
+            for u, w in edges:
+                for p, q in ((u, w), (w, u)):
+                    if p == v and q != x and q not in reach:
+                        reach.add(q)
+                        stack.append(q)
+        return b in reach
+
+    def same_block(e: Tuple[int, int], f: Tuple[int, int]) -> bool:
+        for x in range(n):
+            a = e[0] if e[0] != x else e[1]
+            b = f[0] if f[0] != x else f[1]
+            if not connected_without(x, a, b):
+                return False
+        return True
+
+    classes: List[List[Tuple[int, int]]] = []
+    for edge in edges:
+        for edge_class in classes:
+            if same_block(edge_class[0], edge):
+                edge_class.append(edge)
+                break
+        else:
+            classes.append([edge])
+    degree = [0] * n
+    for u, v in edges:
+        degree[u] += 1
+        degree[v] += 1
+    return ([frozenset(v for edge in edge_class for v in edge) for edge_class in classes]
+            + [frozenset([v]) for v in range(n) if degree[v] == 0])
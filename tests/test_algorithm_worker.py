@@ -0,0 +1,143 @@
+import queue
+import random
+import threading
+import time
+
+import pytest
+
+import AlgorithmWorker
+from AlgorithmWorker import AlgorithmRun, QueueRecorder, RunCancelled, apply_result, graph_data, graph_from_data
+from GraphAlgorithms import GAlgorithm
+from graphs import maximum_matching_size, random_bipartite, random_graph, to_graph
+
+
+def wait(run, timeout=30.0):
+    end = time.perf_counter() + timeout
+    while not run.ended:
+        assert time.perf_counter() < end, 'the run did not end'
+        run.poll()
+        time.sleep(0.005)
+    assert not run.process.is_alive()
+    return run
+
+
+def messages(out):
+    result = []
+    while True:
+        try:
+            result.append(out.get_nowait())
+        except queue.Empty:
+            return result
+
+
+def test_graph_data_round_trip():
+    rng = random.Random('worker-copy')
+    graph = to_graph(12, random_graph(rng, 12, 0.4), [rng.uniform(0, 5) for _ in range(66)])
+    graph.delete_node(3)
+    graph.find_node_by_id(5).color, graph.find_node_by_id(5).group = 4, 'B'
+    copy = graph_from_data(graph_data(graph))
+    assert graph_data(copy) == graph_data(graph)
+
+
+def test_completed_run_finds_a_maximum_matching():
+    rng = random.Random('worker-done')
+    edges = random_bipartite(rng, 6, 6, 0.4)
+    graph = to_graph(12, edges)
+    run = wait(AlgorithmRun('hungarian', graph, delay=0.25))
+    assert run.outcome == 'done'
+    assert run.steps == sum(1 for event in run.events if event[0] == 'pause') > 0
+    assert all(event[1] == 0.25 for event in run.events if event[0] == 'pause')
+
+    algos = GAlgorithm(graph)
+    apply_result(graph, algos, run.result)
+    assert len(algos.matching) == maximum_matching_size(12, edges)
+    assert {node.group for node in graph.node_list} <= {'A', 'B'}
+    for edge in algos.matching:
+        assert edge.source.group == 'B' and edge.dest.group == 'A'
+
+
+def test_completed_brooks_run_colors_the_graph():
+    rng = random.Random('worker-brooks')
+    edges = random_graph(rng, 15, 0.3)
+    graph = to_graph(15, edges)
+    run = wait(AlgorithmRun('brooks', graph))
+    assert run.outcome == 'done'
+    apply_result(graph, GAlgorithm(graph), run.result)
+    assert all(graph.find_node_by_id(u).color != graph.find_node_by_id(v).color for u, v in edges)
+
+
+def test_apply_result_skips_what_was_deleted():
+    edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)]
+    graph = to_graph(6, edges)
+    run = wait(AlgorithmRun('hungarian', graph))
+    assert run.outcome == 'done' and len(run.result['matching']) == 3
+
+    graph.delete_node(0)  # Deletes the edge 0 - 1 too
+    graph.delete_node(5)
+    graph.add_node(5, 0.0, 500.0)
+    graph.add_edge(4, 5, 999)  # Between the same nodes as a deleted edge, but not the same edge
+    algos = GAlgorithm(graph)
+    apply_result(graph, algos, run.result)
+    assert {edge.id for edge in algos.matching} == set(run.result['matching']) - {1000, 1004}
+    assert graph.find_edge(4, 5).id == 999
+    assert all(graph.find_node_by_id(v).group in ('A', 'B') for v in range(1, 5))
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        AlgorithmRun('dijkstra', to_graph(2, [(0, 1)]))
+
+
+def test_worker_stops_at_the_end_of_a_step_once_cancelled():
+    out, cancel = queue.Queue(), threading.Event()
+    recorder = QueueRecorder(out, cancel)
+    recorder.color_node(1, 'red')
+    recorder.pause(0.0)
+    cancel.set()
+    with pytest.raises(RunCancelled):
+        recorder.pause(0.0)
+
+    cancel = threading.Event()
+    cancel.set()
+    data = graph_data(to_graph(6, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)]))
+    AlgorithmWorker._work('hungarian', data, 0.0, out, cancel)
+    assert messages(out)[-1] == ('cancelled', None)
+
+
+def test_failed_run_reports_the_error(monkeypatch):
+    def brooks_algorithm(self, graph, delay):
+        raise RuntimeError('broken')
+
+    monkeypatch.setattr(GAlgorithm, 'brooks_algorithm', brooks_algorithm)
+    out = queue.Queue()
+    AlgorithmWorker._work('brooks', graph_data(to_graph(3, [(0, 1)])), 0.0, out, threading.Event())
+    assert messages(out)[-1] == ('failed', 'RuntimeError: broken')
+
+
+def test_cancelled_run_ends():
+    rng = random.Random('worker-cancel')
+    graph = to_graph(300, random_graph(rng, 300, 0.05))
+    run = AlgorithmRun('brooks', graph, delay=0.1)
+    run.cancel()
+    wait(run)
+    assert run.outcome == 'cancelled' and run.result is None
+
+
+def test_worker_that_does_not_stop_is_terminated(monkeypatch):
+    monkeypatch.setattr(AlgorithmWorker, 'CANCEL_TIMEOUT', 0.0)
+    rng = random.Random('worker-terminate')
+    graph = to_graph(2000, random_graph(rng, 2000, 0.01))
+    run = AlgorithmRun('brooks', graph)
+    run.cancel()
+    wait(run)
+    assert run.outcome == 'cancelled'
+    assert run.process.exitcode != 0
+
+
+def test_worker_that_dies_is_reported():
+    rng = random.Random('worker-killed')
+    graph = to_graph(2000, random_graph(rng, 2000, 0.01))
+    run = AlgorithmRun('brooks', graph)
+    run.process.kill()
+    wait(run)
+    assert run.outcome == 'failed' and 'exit code' in run.result
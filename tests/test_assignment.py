@@ -0,0 +1,95 @@
+import math
+import random
+
+import pytest
+
+from Assignment import kuhn_munkres
+from GraphAlgorithms import GAlgorithm
+from graphs import random_bipartite, to_graph
+
+
+def best_assignment(cost):
+    """
+    Tries every assignment of distinct columns (or none) to the rows, and returns the largest number of
+    assigned rows and the smallest total cost among the assignments of that size.
+    """
+    rows = len(cost)
+    columns = len(cost[0]) if rows else 0
+    best = (0, 0.0)
+
+    def search(row, taken, count, total):
+        nonlocal best
+        if row == rows:
+            if count > best[0] or (count == best[0] and total < best[1]):
+                best = (count, total)
+            return
+        search(row + 1, taken, count, total)
+        for column in range(columns):
+            if column not in taken and math.isfinite(cost[row][column]):
+                taken.add(column)
+                search(row + 1, taken, count + 1, total + cost[row][column])
+                taken.remove(column)
+
+    search(0, set(), 0, 0.0)
+    return best
+
+
+def random_cost(rng):
+    rows, columns = rng.randint(0, 5), rng.randint(1, 5)
+    forbidden = rng.choice([0.0, 0.3, 0.7])
+    cost = []
+    for _ in range(rows):
+        row = []
+        for _ in range(columns):
+            if rng.random() < forbidden:
+                row.append(math.inf)
+            elif rng.random() < 0.5:
+                row.append(float(rng.randint(-5, 5)))  # Ties and negative costs
+            else:
+                row.append(rng.uniform(-100, 100))
+        cost.append(row)
+    return cost
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_kuhn_munkres_matches_brute_force(seed):
+    rng = random.Random(f"assignment-{seed}")
+    for _ in range(300):
+        cost = random_cost(rng)
+        assignment, total = kuhn_munkres(cost)
+        assert len(assignment) == len(cost)
+        columns = [column for column in assignment if column != -1]
+        assert len(columns) == len(set(columns))
+        assert all(math.isfinite(cost[row][column]) for row, column in enumerate(assignment) if column != -1)
+        assert total == pytest.approx(sum(cost[row][column] for row, column in enumerate(assignment) if column != -1))
+
+        count, best = best_assignment(cost)
+        assert len(columns) == count
+        assert total == pytest.approx(best, abs=1e-9)
+
+
+def test_weighted_assignment_matches_brute_force():
+    rng = random.Random('weighted-assignment')
+    for _ in range(100):
+        left, right = rng.randint(1, 5), rng.randint(1, 5)
+        edges = random_bipartite(rng, left, right, rng.uniform(0.3, 0.9))
+        if not edges:
+            continue
+        weights = [float(rng.randint(-10, 10)) for _ in edges]
+        graph = to_graph(left + right, edges, weights)
+        matching, total = GAlgorithm(graph).weighted_assignment()
+
+        cost = [[math.inf] * right for _ in range(left)]
+        for (u, v), weight in zip(edges, weights):
+            cost[u][v - left] = weight
+        count, best = best_assignment(cost)
+        assert len(matching) == count and total == pytest.approx(best)
+        assert sum(edge.weight for edge in matching) == pytest.approx(total)
+        ends = [node for edge in matching for node in (edge.source, edge.dest)]
+        assert len(ends) == len(set(ends))
+
+
+def test_weighted_assignment_needs_a_bipartite_graph():
+    graph = to_graph(3, [(0, 1), (1, 2), (2, 0)])
+    algos = GAlgorithm(graph)
+    assert algos.weighted_assignment() is None and algos.matching == set()
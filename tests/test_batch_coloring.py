@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from BatchColoring import greedy_color_batched
+from Coloring import greedy_color
+from graphs import random_graph, to_csr
+
+
+@pytest.mark.parametrize('min_batch', [1, 2, 4, 16, 1000])
+def test_equals_sequential_coloring(min_batch):
+    rng = random.Random(f"batch-{min_batch}")
+    for _ in range(100):
+        n = rng.randint(1, 40)
+        indptr, indices, _ = to_csr(n, random_graph(rng, n, rng.random() * 0.5))
+        order = list(range(n))
+        if rng.random() < 0.5:
+            rng.shuffle(order)
+        batched = greedy_color_batched(indptr, indices, order, min_batch=min_batch)
+        assert batched.tolist() == greedy_color(indptr, indices, order)
+
+
+def test_leftover_vertices_next_to_high_colors():
+    # The disjoint K6s are colored in six batches, the last one with color 5. The path hanging off one of
+    # them is left for the sequential pass, where its vertices have degrees of at most 2
+    edges = []
+    for k in range(20):
+        edges += [(6 * k + i, 6 * k + j) for i in range(6) for j in range(i + 1, 6)]
+    edges += [(5, 120)] + [(120 + i, 121 + i) for i in range(5)]
+    indptr, indices, _ = to_csr(126, edges)
+    order = list(range(126))
+    assert greedy_color_batched(indptr, indices, order, min_batch=4).tolist() == greedy_color(indptr, indices, order)
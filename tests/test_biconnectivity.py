@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+from Biconnectivity import block_cut_tree
+from graphs import brute_force_blocks, count_components, random_graph, to_csr
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_block_cut_tree_matches_brute_force(seed):
+    rng = random.Random(f"blocks-{seed}")
+    for _ in range(50):
+        n = rng.randint(1, 11)
+        edges = random_graph(rng, n, rng.random() * 0.5)
+        indptr, indices, _ = to_csr(n, edges)
+        tree = block_cut_tree(indptr, indices)
+
+        cut_vertices = [v for v in range(n) if count_components(n, edges, v) > count_components(n, edges)]
+        assert tree.articulation_points == cut_vertices
+        assert [v for v in range(n) if tree.is_articulation_point(v)] == cut_vertices
+
+        bridges = {frozenset(edge) for edge in edges
+                   if count_components(n, [other for other in edges if other != edge]) > count_components(n, edges)}
+        assert {frozenset(bridge) for bridge in tree.bridges} == bridges
+
+        blocks = [frozenset(block) for block in tree.blocks]
+        assert len(blocks) == len(set(blocks))
+        assert set(blocks) == set(brute_force_blocks(n, edges))
+        assert sorted((i, v) for i, v in tree.tree_edges) == sorted(
+            (i, v) for i, block in enumerate(tree.blocks) for v in block if v in cut_vertices)
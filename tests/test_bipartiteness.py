@@ -0,0 +1,70 @@
+import itertools
+import random
+
+import pytest
+
+import Bipartiteness
+from Bipartiteness import bfs_levels, two_coloring
+from graphs import random_bipartite, random_graph, to_csr
+
+
+def is_bipartite(n, edges):
+    """
+    Tries every split of the vertices into two sides.
+    """
+    return any(all(side[u] != side[v] for u, v in edges) for side in itertools.product((0, 1), repeat=n))
+
+
+@pytest.mark.parametrize('vector_edges', [1, 4, 10 ** 9])
+@pytest.mark.parametrize('seed', range(4))
+def test_two_coloring_or_odd_cycle(seed, vector_edges, monkeypatch):
+    # The array and loop expansions of the BFS levels, alone and mixed
+    monkeypatch.setattr(Bipartiteness, 'VECTOR_EDGES', vector_edges)
+    rng = random.Random(f"bipartite-{seed}")
+    for _ in range(60):
+        if rng.random() < 0.5:
+            left, right = rng.randint(0, 6), rng.randint(0, 6)
+            n, edges = left + right, random_bipartite(rng, left, right, rng.random())
+        else:
+            n = rng.randint(0, 12)
+            edges = random_graph(rng, n, rng.random() * 0.4)
+        indptr, indices, _ = to_csr(n, edges)
+        sides, cycle = two_coloring(indptr, indices)
+        if sides is not None:
+            assert cycle is None and is_bipartite(n, edges)
+            assert set(sides.tolist()) <= {1, 2}
+            assert all(sides[u] != sides[v] for u, v in edges)
+        else:
+            assert not is_bipartite(n, edges)
+            edge_set = {frozenset(edge) for edge in edges}
+            assert len(cycle) % 2 == 1 and len(set(cycle)) == len(cycle)
+            assert all(frozenset((cycle[i - 1], cycle[i])) in edge_set for i in range(len(cycle)))
+
+
+@pytest.mark.parametrize('vector_edges', [1, 128, 10 ** 9])
+def test_bfs_levels_are_distances(vector_edges, monkeypatch):
+    monkeypatch.setattr(Bipartiteness, 'VECTOR_EDGES', vector_edges)
+    rng = random.Random('bfs-levels')
+    for _ in range(20):
+        n = rng.randint(1, 400)
+        edges = random_graph(rng, n, rng.choice([0.002, 0.01, 0.05]))
+        indptr, indices, _ = to_csr(n, edges)
+        level, parent = bfs_levels(indptr, indices)
+
+        # The distance from the smallest vertex of each component, by a plain BFS
+        expected = [-1] * n
+        for root in range(n):
+            if expected[root] == -1:
+                expected[root] = 0
+                queue = [root]
+                for v in queue:
+                    for u in indices[indptr[v]:indptr[v + 1]]:
+                        if expected[u] == -1:
+                            expected[u] = expected[v] + 1
+                            queue.append(u)
+        assert level.tolist() == expected
+        for v in range(n):
+            if parent[v] == -1:
+                assert level[v] == 0
+            else:
+                assert level[parent[v]] == level[v] - 1 and parent[v] in indices[indptr[v]:indptr[v + 1]]
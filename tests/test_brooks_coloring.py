@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+from BrooksColoring import CUT_VERTEX, brooks_coloring
+from graphs import brooks_bound, components, is_proper, random_graph, regular_with_cut_vertex, to_csr
+
+
+def check(n, edges):
+    indptr, indices, _ = to_csr(n, edges)
+    colors, reports = brooks_coloring(indptr, indices)
+    assert is_proper(indptr, indices, colors)
+    for component in components(indptr, indices):
+        assert max(colors[v] for v in component) < brooks_bound(indptr, indices, component)
+    return reports
+
+
+@pytest.mark.parametrize('d', [3, 4, 5, 6])
+def test_regular_with_cut_vertex(d):
+    rng = random.Random(f"cut-{d}")
+    for _ in range(150):
+        reports = check(*regular_with_cut_vertex(rng, d))
+        assert any(case == CUT_VERTEX for case, _, _ in reports)
+
+
+def test_random_graphs():
+    rng = random.Random('brooks')
+    for _ in range(300):
+        n = rng.randint(1, 14)
+        check(n, random_graph(rng, n, rng.random()))
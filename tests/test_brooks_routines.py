@@ -0,0 +1,70 @@
+import random
+
+from GraphAlgorithms import GAlgorithm
+from graphs import count_components, random_graph, to_graph
+
+
+def test_max_min_degree():
+    rng = random.Random('brooks-degrees')
+    for _ in range(50):
+        n = rng.randint(1, 20)
+        graph = to_graph(n, random_graph(rng, n, rng.random()))
+        nodes = graph.node_list
+        max_node, min_node = GAlgorithm(graph).max_min_degree(nodes)
+        degrees = [len(node.neighbors) for node in nodes]
+        assert len(max_node.neighbors) == max(degrees) and len(min_node.neighbors) == min(degrees)
+
+
+def test_is_odd_cycle():
+    for n in range(3, 12):
+        cycle = [(v, (v + 1) % n) for v in range(n)]
+        graph = to_graph(n, cycle)
+        assert GAlgorithm(graph).is_odd_cycle(graph) == (n % 2 == 1)
+        # Two cycles are not one cycle, a path is not a cycle
+        graph = to_graph(2 * n, cycle + [(n + u, n + v) for u, v in cycle])
+        assert not GAlgorithm(graph).is_odd_cycle(graph)
+        graph = to_graph(n, cycle[:-1])
+        assert not GAlgorithm(graph).is_odd_cycle(graph)
+
+
+def test_connected_components_and_spanning_trees():
+    rng = random.Random('brooks-components')
+    for _ in range(60):
+        n = rng.randint(2, 20)
+        edges = random_graph(rng, n, rng.uniform(0.1, 0.5))
+        graph = to_graph(n, edges)
+        cut_vertex = max(graph.node_list, key=lambda node: len(node.neighbors))
+        if not cut_vertex.neighbors:
+            continue
+        algos = GAlgorithm(graph)
+        parts = algos.connected_components(cut_vertex)
+        removed = cut_vertex.circle_id
+        reached = {v for v in range(n) if v != removed and any(
+            graph.find_node_by_id(v) in part for part in parts)}
+        # Each part is a component of G - cut_vertex touching it, with the cut vertex at the end
+        assert all(part[-1] is cut_vertex and part.count(cut_vertex) == 1 for part in parts)
+        assert sum(len(part) - 1 for part in parts) == len(reached)
+        kept = [(u, v) for u, v in edges if u in reached and v in reached]
+        assert count_components(n, kept, removed) - (n - 1 - len(reached)) == len(parts)
+        for part in parts:
+            tree = algos.component_spanning_tree(part, cut_vertex, 0)
+            assert tree[0] is cut_vertex and sorted(node.circle_id for node in tree) == sorted(
+                node.circle_id for node in part)
+
+
+def test_triad_bfs_spans_the_graph():
+    rng = random.Random('brooks-triad')
+    for _ in range(60):
+        n = rng.randint(4, 20)
+        edges = random_graph(rng, n, rng.uniform(0.3, 0.8))
+        graph = to_graph(n, edges)
+        if count_components(n, edges) != 1:
+            continue
+        algos = GAlgorithm(graph)
+        triad = algos.find_triad(graph)
+        if triad is None:
+            continue
+        x, y, z = triad
+        tree = algos.triad_bfs(x, y, z, 0)
+        assert tree[0] is x and tree[-2:] == [y, z]
+        assert len(set(tree[:-2])) == len(tree) - 2 and y not in tree[:-2] and z not in tree[:-2]
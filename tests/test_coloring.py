@@ -0,0 +1,77 @@
+import random
+import tracemalloc
+
+import pytest
+
+import Coloring
+from graphs import is_proper, random_bipartite, random_graph, to_csr
+
+
+def degeneracy(n, edges):
+    """
+    Returns the largest minimum degree over all subgraphs, by removing a vertex of minimum degree each time.
+    """
+    neighbors = [set() for _ in range(n)]
+    for u, v in edges:
+        neighbors[u].add(v)
+        neighbors[v].add(u)
+    left, result = set(range(n)), 0
+    while left:
+        v = min(left, key=lambda u: len(neighbors[u] & left))
+        result = max(result, len(neighbors[v] & left))
+        left.remove(v)
+    return result
+
+
+@pytest.mark.parametrize('strategy', Coloring.STRATEGIES)
+def test_strategies_give_proper_colorings(strategy):
+    rng = random.Random(f"coloring-{strategy}")
+    for _ in range(150):
+        n = rng.randint(0, 30)
+        edges = random_graph(rng, n, rng.random())
+        indptr, indices, _ = to_csr(n, edges)
+        colors, order = Coloring.color_graph(indptr, indices, strategy)
+        assert sorted(order) == list(range(n))
+        assert is_proper(indptr, indices, colors)
+        max_degree = max((indptr[v + 1] - indptr[v] for v in range(n)), default=0)
+        assert max(colors, default=-1) <= max_degree
+        # Greedy coloring in the order reported gives the same colors
+        assert Coloring.greedy_color(indptr, indices, order) == colors
+
+
+def test_smallest_last_is_within_the_degeneracy():
+    rng = random.Random('smallest-last')
+    for _ in range(150):
+        n = rng.randint(1, 25)
+        edges = random_graph(rng, n, rng.random())
+        indptr, indices, _ = to_csr(n, edges)
+        colors, _ = Coloring.color_graph(indptr, indices, 'smallest-last')
+        assert max(colors) <= degeneracy(n, edges)
+
+
+def test_dsatur_colors_bipartite_graphs_with_two_colors():
+    rng = random.Random('dsatur-bipartite')
+    for _ in range(150):
+        left, right = rng.randint(1, 12), rng.randint(1, 12)
+        indptr, indices, _ = to_csr(left + right, random_bipartite(rng, left, right, rng.random()))
+        colors, _ = Coloring.dsatur(indptr, indices)
+        assert max(colors) <= 1
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        Coloring.color_graph([0], [], 'random')
+
+
+def test_dsatur_space_is_linear_in_the_edges():
+    # A star has maximum degree V - 1, so a marker per vertex and color would take V^2 bytes
+    n = 20001
+    indptr, indices, _ = to_csr(n, [(0, v) for v in range(1, n)])
+    tracemalloc.start()
+    try:
+        colors, _ = Coloring.dsatur(indptr, indices)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert max(colors) == 1 and colors[0] == 0
+    assert peak < 20 * 10 ** 6
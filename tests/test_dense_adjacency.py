@@ -0,0 +1,120 @@
+import itertools
+import random
+
+from Graph import Graph
+from GraphAlgorithms import GAlgorithm
+from graphs import random_graph, to_graph
+
+
+def sparse_graph(n, edges):
+    """
+    Returns the graph of to_graph without the bitset adjacency, whatever its density.
+    """
+    graph = Graph()
+    graph.DENSE_MIN_NODES = n + 1
+    for v in range(n):
+        graph.add_node(v, v % 20 * 50.0, v // 20 * 50.0)
+    for k, (u, v) in enumerate(edges):
+        graph.add_edge(u, v, 1000 + k)
+    return graph
+
+
+def check_rows(graph):
+    dense = graph.dense
+    for node in graph.node_list:
+        assert dense.row(node) == dense.mask(node.neighbors)
+        assert dense.degree(node) == len(node.neighbors)
+        assert set(dense.nodes(dense.row(node))) == set(node.neighbors)
+        for other in graph.node_list:
+            assert dense.adjacent(node, other) == (other in node.neighbors)
+
+
+def test_rows_follow_edits():
+    rng = random.Random('dense-edits')
+    for _ in range(20):
+        n = rng.randint(Graph.DENSE_MIN_NODES, 45)
+        graph = to_graph(n, random_graph(rng, n, rng.uniform(0.3, 0.9)))
+        assert graph.dense is not None
+        check_rows(graph)
+        edge_id = 5000
+        for _ in range(30):
+            nodes = graph.node_list
+            if rng.random() < 0.3 and len(nodes) > 2:
+                graph.delete_node(rng.choice(nodes).circle_id)
+            else:
+                u, v = rng.sample(nodes, 2)
+                graph.add_edge(u.circle_id, v.circle_id, edge_id)
+                edge_id += 1
+            if graph.dense is not None:
+                check_rows(graph)
+
+
+def test_switches_with_density():
+    n = Graph.DENSE_MIN_NODES
+    pairs = list(itertools.combinations(range(n), 2))
+    graph = to_graph(n, [])
+    for k, (u, v) in enumerate(pairs):
+        graph.add_edge(u, v, k)
+        assert (graph.dense is not None) == (graph.density >= Graph.DENSE_THRESHOLD)
+    # Dropped only below half the threshold, and once there are too few nodes
+    graph.delete_node(0)
+    assert graph.dense is None
+    assert to_graph(n - 1, pairs[:len(pairs) // 2]).dense is None
+
+
+def test_routines_agree_with_the_neighbor_lists():
+    rng = random.Random('dense-routines')
+    for _ in range(40):
+        n = rng.randint(Graph.DENSE_MIN_NODES, 40)
+        edges = random_graph(rng, n, rng.uniform(0.4, 1.0))
+        dense, sparse = to_graph(n, edges), sparse_graph(n, edges)
+        assert dense.dense is not None and sparse.dense is None
+
+        complete = len(edges) == n * (n - 1) // 2
+        assert GAlgorithm(dense).is_complete_graph(dense) == GAlgorithm(sparse).is_complete_graph(sparse) == complete
+
+        for graph in (dense, sparse):
+            triad = GAlgorithm(graph).find_triad(graph)
+            if complete:
+                assert triad is None
+            else:
+                x, y, z = triad
+                assert y in x.neighbors and z in x.neighbors and y is not z and z not in y.neighbors
+
+        # Some nodes colored beforehand, with colors above the node count too
+        precolored = {v: rng.randint(0, 2 * n) for v in rng.sample(range(n), 3)}
+        order = list(range(n))
+        rng.shuffle(order)
+        results = []
+        for graph in (dense, sparse):
+            for v, color in precolored.items():
+                graph.find_node_by_id(v).color = color
+            GAlgorithm(graph).greedy_coloring([graph.find_node_by_id(v) for v in order], 0)
+            results.append([node.color for node in graph.node_list])
+        assert results[0] == results[1]
+
+
+def test_combine_coloring_avoids_both_trees():
+    rng = random.Random('dense-combine')
+    for _ in range(30):
+        n = rng.randint(Graph.DENSE_MIN_NODES, 40)
+        edges = random_graph(rng, n, rng.uniform(0.5, 0.9))
+        for graph in (to_graph(n, edges), sparse_graph(n, edges)):
+            algos = GAlgorithm(graph)
+            nodes = graph.node_list
+            cut_vertex = nodes[0]
+            for node in nodes:
+                node.color = rng.randint(0, n)
+            used = {neighbor.color for neighbor in cut_vertex.neighbors}
+            if not set(node.color for node in nodes) - used:
+                continue
+            half = len(nodes) // 2
+            algos.combine_coloring(nodes[1:half], nodes[half:], cut_vertex)
+            assert cut_vertex.color not in used
+
+
+def test_greedy_coloring_keeps_colors_above_the_node_count():
+    graph = to_graph(4, [(0, 1)])
+    graph.find_node_by_id(1).color = 7
+    GAlgorithm(graph).greedy_coloring(graph.node_list, 0)
+    assert [node.color for node in graph.node_list] == [0, 7, 0, 0]
@@ -0,0 +1,51 @@
+import random
+
+from Graph import Graph
+
+
+def test_duplicate_node_is_rejected():
+    graph = Graph()
+    node = graph.add_node(1, 100.0, 100.0)
+    graph.add_node(2, 200.0, 100.0)
+    graph.add_edge(1, 2, 10)
+    assert graph.add_node(1, 400.0, 400.0) is None
+    # The first node keeps its place, its edge and its entry in the spatial index
+    assert graph.find_node_by_id(1) is node
+    assert graph.find_node_in_radius(100.0, 100.0) == 1
+    assert graph.find_node_in_radius(400.0, 400.0) == -1
+    assert graph.find_edge(1, 2).source is node
+    assert graph.delete_node(1) == [10]
+    assert graph.find_node_in_radius(100.0, 100.0) == -1
+
+
+def test_hit_testing_follows_additions_and_deletions():
+    rng = random.Random('graph-hits')
+    graph = Graph()
+    centres = {}
+    for node_id in range(300):
+        x, y = rng.uniform(0, 2000), rng.uniform(0, 2000)
+        if graph.find_node_in_radius(x, y) < 0 and graph.add_node(node_id, x, y, rng.uniform(0.5, 2)) is not None:
+            centres[node_id] = (x, y)
+    for node_id in rng.sample(sorted(centres), len(centres) // 2):
+        graph.delete_node(node_id)
+        del centres[node_id]
+    assert [node.circle_id for node in graph.node_list] == list(centres)
+    for node_id, (x, y) in centres.items():
+        assert graph.find_node_in_radius(x, y) == node_id
+    for _ in range(500):
+        x, y = rng.uniform(0, 2000), rng.uniform(0, 2000)
+        expected = [node.circle_id for node in graph.node_list
+                    if (node.x - x) ** 2 + (node.y - y) ** 2 <= node.radius ** 2]
+        found = graph.find_node_in_radius(x, y)
+        assert found in expected if expected else found == -1
+
+
+def test_delete_graph_removes_everything():
+    graph = Graph()
+    for node_id in range(20):
+        graph.add_node(node_id, node_id * 50.0, 0.0)
+    for node_id in range(19):
+        graph.add_edge(node_id, node_id + 1, 100 + node_id)
+    graph.delete_graph()
+    assert graph.node_list == [] and graph.edge_list == []
+    assert graph.find_node_in_radius(0.0, 0.0) == -1
@@ -0,0 +1,164 @@
+import io
+import random
+
+import pytest
+
+from Graph import Graph
+from GraphIO import guess_format, load_graph, read_edges, save_graph
+from graphs import random_bipartite, random_graph, to_graph
+
+
+def directed_edges(graph):
+    """
+    Returns the edges of a graph as a set of (source id, dest id, weight) triples.
+    """
+    return {(edge.source.circle_id, edge.dest.circle_id, edge.weight) for edge in graph.edge_list}
+
+
+def undirected_edges(graph):
+    return {(frozenset((edge.source.circle_id, edge.dest.circle_id)), edge.weight) for edge in graph.edge_list}
+
+
+def round_trip(graph, fmt, **options):
+    file = io.StringIO()
+    save_graph(graph, file, fmt)
+    file.seek(0)
+    return load_graph(file, fmt, **options)
+
+
+def random_weighted_graph(rng, weighted):
+    n = rng.randint(0, 25)
+    edges = random_graph(rng, n, rng.random() * 0.3)
+    rng.shuffle(edges)
+    # Some edges point from the higher id to the lower one
+    edges = [(v, u) if rng.random() < 0.5 else (u, v) for u, v in edges]
+    weights = [rng.choice([0.5, 1.0, 2.25, -3.0, 1e-7]) if weighted else 1.0 for _ in edges]
+    return to_graph(n, edges, weights)
+
+
+def check_loaded_edge_ids(graph):
+    # Edges are numbered in the order they were read, without gaps
+    assert sorted(edge.id for edge in graph.edge_list) == list(range(len(graph.edge_list)))
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_edgelist_round_trip(weighted):
+    rng = random.Random(f"edgelist-{weighted}")
+    for _ in range(30):
+        graph = random_weighted_graph(rng, weighted)
+        loaded = round_trip(graph, 'edgelist')
+        # Isolated nodes are written on lines of their own, so every node comes back
+        assert sorted(node.circle_id for node in loaded.node_list) == sorted(node.circle_id for node in graph.node_list)
+        assert directed_edges(loaded) == directed_edges(graph)
+        check_loaded_edge_ids(loaded)
+
+
+def test_adjlist_round_trip():
+    rng = random.Random('adjlist')
+    for _ in range(30):
+        graph = random_weighted_graph(rng, False)
+        loaded = round_trip(graph, 'adjlist')
+        assert sorted(node.circle_id for node in loaded.node_list) == sorted(node.circle_id for node in graph.node_list)
+        assert directed_edges(loaded) == directed_edges(graph)
+        check_loaded_edge_ids(loaded)
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_mtx_round_trip(weighted):
+    rng = random.Random(f"mtx-{weighted}")
+    for _ in range(30):
+        graph = round_trip(random_weighted_graph(rng, weighted), 'mtx')
+        # The nodes of a loaded Matrix Market file are already numbered 1..n, so a second trip keeps them
+        assert [node.circle_id for node in graph.node_list] == list(range(1, len(graph.node_list) + 1))
+        loaded = round_trip(graph, 'mtx')
+        assert [node.circle_id for node in loaded.node_list] == [node.circle_id for node in graph.node_list]
+        assert undirected_edges(loaded) == undirected_edges(graph)
+        check_loaded_edge_ids(loaded)
+
+
+def test_mtx_renumbers_the_nodes_in_order():
+    graph = Graph()
+    for node_id in (40, 7, 12):
+        graph.add_node(node_id, node_id * 10.0, 0.0)
+    graph.add_edge(40, 12, 1, 2.5)
+    graph.add_edge(7, 40, 2, 1.0)
+    loaded = round_trip(graph, 'mtx')
+    assert undirected_edges(loaded) == {(frozenset((1, 3)), 2.5), (frozenset((1, 2)), 1.0)}
+
+
+def test_rectangular_mtx_is_bipartite():
+    text = ("%%MatrixMarket matrix coordinate real general\n"
+            "% 2 rows and 3 columns\n"
+            "2 3 4\n"
+            "1 1 4.0\n"
+            "1 3 1.5\n"
+            "2 2 2.0\n"
+            "2 3 3.0\n")
+    graph = load_graph(io.StringIO(text), 'mtx')
+    # The columns are nodes 3..5, after the rows
+    assert [node.circle_id for node in graph.node_list] == [1, 2, 3, 4, 5]
+    assert directed_edges(graph) == {(1, 3, 4.0), (1, 5, 1.5), (2, 4, 2.0), (2, 5, 3.0)}
+    # Saved as a symmetric square matrix, it comes back as the same graph
+    assert undirected_edges(round_trip(graph, 'mtx')) == undirected_edges(graph)
+
+
+def test_square_mtx_read_as_bipartite():
+    text = ("%%MatrixMarket matrix coordinate pattern general\n"
+            "2 2 3\n"
+            "1 1\n"
+            "1 2\n"
+            "2 1\n")
+    # As an adjacency matrix the diagonal entry is a loop, and (2, 1) repeats (1, 2)
+    assert directed_edges(load_graph(io.StringIO(text), 'mtx')) == {(1, 2, 1.0)}
+    # As a biadjacency matrix, rows 1..2 and columns 3..4 make three distinct edges
+    graph = load_graph(io.StringIO(text), 'mtx', bipartite=True)
+    assert len(graph.node_list) == 4
+    assert directed_edges(graph) == {(1, 3, 1.0), (1, 4, 1.0), (2, 3, 1.0)}
+
+
+def test_bipartite_graph_round_trip_through_mtx():
+    rng = random.Random('mtx-bipartite')
+    for _ in range(20):
+        left, right = rng.randint(1, 8), rng.randint(1, 8)
+        edges = random_bipartite(rng, left, right, rng.random())
+        graph = round_trip(to_graph(left + right, edges, [rng.randint(1, 9) for _ in edges]), 'mtx')
+        assert undirected_edges(round_trip(graph, 'mtx')) == undirected_edges(graph)
+
+
+def test_duplicates_and_loops_are_dropped():
+    text = ("# a comment\n"
+            "1 2\n"
+            "2 1 5.0\n"
+            "1 2 7.0\n"
+            "3 3\n"
+            "\n"
+            "4\n"
+            "2 4 0.5\n")
+    graph = load_graph(io.StringIO(text), 'edgelist')
+    # The first copy of an edge is kept; the node of a loop is still created
+    assert [node.circle_id for node in graph.node_list] == [1, 2, 3, 4]
+    assert directed_edges(graph) == {(1, 2, 1.0), (2, 4, 0.5)}
+    check_loaded_edge_ids(graph)
+
+    graph = load_graph(io.StringIO("1 2 2 3 1\n2 1 3\n3\n"), 'adjlist')
+    assert directed_edges(graph) == {(1, 2, 1.0), (1, 3, 1.0), (2, 3, 1.0)}
+    check_loaded_edge_ids(graph)
+
+
+def test_formats_are_guessed_from_the_path(tmp_path):
+    assert [guess_format(path) for path in ('g.mtx', 'g.adj', 'g.adjlist', 'g.txt')] == \
+           ['mtx', 'adjlist', 'adjlist', 'edgelist']
+    graph = to_graph(3, [(0, 1), (1, 2)])
+    for name in ('g.mtx', 'g.adj', 'g.txt'):
+        save_graph(graph, str(tmp_path / name))
+        loaded = load_graph(str(tmp_path / name))
+        assert len(loaded.node_list) == 3 and len(loaded.edge_list) == 2
+
+
+def test_bad_input_is_rejected():
+    with pytest.raises(ValueError):
+        list(read_edges(io.StringIO("1 2\n"), 'csv'))
+    with pytest.raises(ValueError):
+        save_graph(to_graph(1, []), io.StringIO(), 'csv')
+    with pytest.raises(ValueError):
+        load_graph(io.StringIO("%%MatrixMarket matrix array real general\n2 2\n1\n0\n0\n1\n"), 'mtx')
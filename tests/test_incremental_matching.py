@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from GraphAlgorithms import GAlgorithm
+from IncrementalMatching import IncrementalMatching
+from graphs import maximum_matching_size, random_bipartite, random_graph, to_graph
+
+
+def check_matching(graph, tracker):
+    """
+    Checks that the tracked edges form a matching of the current graph, that mate and partner agree with it,
+    and returns its size.
+    """
+    edges = set(graph.edge_list)
+    matched = set()
+    for edge in tracker.matching:
+        assert edge in edges
+        assert edge.source not in matched and edge.dest not in matched
+        matched.update((edge.source, edge.dest))
+        assert tracker.mate[edge.source] is edge and tracker.mate[edge.dest] is edge
+        assert tracker.partner(edge.source) is edge.dest and tracker.partner(edge.dest) is edge.source
+    assert set(tracker.mate) == matched
+    return len(tracker.matching)
+
+
+def maximum_size(graph):
+    """
+    Returns the size of a maximum matching of the current graph, by brute force.
+    """
+    index = {node: v for v, node in enumerate(graph.node_list)}
+    return maximum_matching_size(len(index), [(index[edge.source], index[edge.dest]) for edge in graph.edge_list])
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_edits_keep_a_bipartite_matching_maximum(seed):
+    rng = random.Random(f"incremental-{seed}")
+    left, right = rng.randint(1, 7), rng.randint(1, 7)
+    graph = to_graph(left + right, random_bipartite(rng, left, right, rng.random() * 0.5))
+    side = {v: v < left for v in range(left + right)}  # The side of every node id ever used
+    algorithm = GAlgorithm(graph)
+    # Start from a matching that is valid but usually not maximum
+    algorithm.matching = set(rng.sample(graph.edge_list, min(1, len(graph.edge_list))))
+    tracker = algorithm.maintain_matching()
+    assert check_matching(graph, tracker) == maximum_size(graph)
+
+    next_node, next_edge = left + right, 2000
+    for _ in range(150):
+        nodes = [node.circle_id for node in graph.node_list]
+        step = rng.random()
+        if step < 0.15 and nodes:
+            graph.delete_node(rng.choice(nodes))
+        elif step < 0.3 and len(nodes) < 16:
+            # A new isolated node changes nothing until an edge reaches it
+            side[next_node] = rng.random() < 0.5
+            graph.add_node(next_node, next_node % 20 * 50.0, next_node // 20 * 50.0)
+            next_node += 1
+        else:
+            sources = [v for v in nodes if side[v]]
+            dests = [v for v in nodes if not side[v]]
+            if not sources or not dests:
+                continue
+            if graph.add_edge(rng.choice(sources), rng.choice(dests), next_edge) is not None:
+                next_edge += 1
+        assert check_matching(graph, tracker) == maximum_size(graph)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_edits_on_a_general_graph_keep_a_matching(seed):
+    # Odd cycles are not shrunk, so only the validity of the matching is guaranteed
+    rng = random.Random(f"incremental-general-{seed}")
+    n = 12
+    graph = to_graph(n, random_graph(rng, n, 0.2))
+    tracker = IncrementalMatching(graph)
+    for k in range(60):
+        nodes = [node.circle_id for node in graph.node_list]
+        if rng.random() < 0.1 and len(nodes) > 2:
+            graph.delete_node(rng.choice(nodes))
+        elif len(nodes) > 1:
+            graph.add_edge(*rng.sample(nodes, 2), 2000 + k)
+        assert check_matching(graph, tracker) <= maximum_size(graph)
+
+
+def test_detach_stops_following_the_graph():
+    graph = to_graph(4, [(0, 1)])
+    tracker = IncrementalMatching(graph)
+    tracker.detach()
+    graph.add_edge(2, 3, 2000)
+    assert {edge.id for edge in tracker.matching} == {1000}
+    assert tracker.partner(graph.find_node_by_id(2)) is None
@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from AlgorithmStats import AlgorithmStats
+from Graph import Graph
+from GraphAlgorithms import GAlgorithm
+from Matching import edmonds_matching, hopcroft_karp
+from RenderSink import RecordingRenderSink
+from graphs import maximum_matching_size, random_bipartite, random_graph, to_csr, to_graph
+
+
+def check_matching(n, edges, mate, mate_edge, paths):
+    """
+    Checks that mate and mate_edge describe one matching, and that applying the reported augmenting paths
+    in turn builds the same matching. Returns its size.
+    """
+    matched = set()
+    for v in range(n):
+        if mate[v] == -1:
+            assert mate_edge[v] == -1
+            continue
+        assert mate[mate[v]] == v and mate_edge[mate[v]] == mate_edge[v]
+        assert set(edges[mate_edge[v]]) == {v, mate[v]}
+        matched.add(mate_edge[v])
+
+    built = set()
+    for path in paths:
+        for position, edge in enumerate(path):
+            if position % 2 == 0:
+                assert edge not in built
+                built.add(edge)
+            else:
+                built.remove(edge)
+    assert built == matched
+    return len(matched)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_hopcroft_karp_is_maximum(seed):
+    rng = random.Random(f"hopcroft-karp-{seed}")
+    for _ in range(60):
+        left, right = rng.randint(0, 7), rng.randint(0, 7)
+        edges = random_bipartite(rng, left, right, rng.random())
+        n = left + right
+        indptr, indices, adj_edges = to_csr(n, edges)
+        paths = []
+        mate, mate_edge = hopcroft_karp(indptr, indices, adj_edges, [v < left for v in range(n)], paths.append)
+        assert check_matching(n, edges, mate, mate_edge, paths) == maximum_matching_size(n, edges)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_edmonds_is_maximum(seed):
+    rng = random.Random(f"edmonds-{seed}")
+    stats = AlgorithmStats()
+    for _ in range(60):
+        n = rng.randint(0, 14)
+        edges = random_graph(rng, n, rng.random() * 0.6)
+        indptr, indices, adj_edges = to_csr(n, edges)
+        paths = []
+        mate, mate_edge = edmonds_matching(indptr, indices, adj_edges, paths.append, stats)
+        assert check_matching(n, edges, mate, mate_edge, paths) == maximum_matching_size(n, edges)
+    assert stats.counters['blossoms'] > 0  # The graphs are not all matched by the greedy start alone
+
+
+
+def random_directed_matching(rng, graph):
+    """
+    Tags the nodes of a bipartite graph with their groups, picks a random matching, and directs the edges
+    like hungarian_algorithm: matched edges from group B to group A, the others from A to B.
+    """
+    algos = GAlgorithm(graph)
+    assert algos.is_bipartite()
+    matching, matched = set(), set()
+    for edge in rng.sample(graph.edge_list, len(graph.edge_list)):
+        if edge.source not in matched and edge.dest not in matched and rng.random() < 0.5:
+            matching.add(edge)
+            matched.update((edge.source, edge.dest))
+    algos._direct_graph(matching)
+    return algos, matching, matched
+
+
+def test_find_augmenting_path_bfs_follows_the_directions():
+    rng = random.Random('augmenting-bfs')
+    for _ in range(100):
+        left, right = rng.randint(1, 6), rng.randint(1, 6)
+        graph = to_graph(left + right, random_bipartite(rng, left, right, rng.uniform(0.2, 0.7)))
+        if not graph.edge_list:
+            continue
+        algos, matching, matched = random_directed_matching(rng, graph)
+        end_group = {node for node in graph.node_list if node.group == 'B' and node not in matched}
+        for start in graph.node_list:
+            if start.group != 'A' or start in matched:
+                continue
+            # The distance of each node from the start along the edge directions
+            distance = {start: 0}
+            queue = [start]
+            for node in queue:
+                for neighbor in node.neighbors:
+                    if neighbor not in distance and graph.find_edge(node.circle_id, neighbor.circle_id).dest is neighbor:
+                        distance[neighbor] = distance[node] + 1
+                        queue.append(neighbor)
+            longest = max((distance[node] for node in end_group if node in distance), default=0)
+
+            path = algos.find_augmenting_path_bfs(start, end_group)
+            if longest == 0:
+                assert path is None
+                continue
+            assert len(path) == longest
+            node = start
+            for edge in path:
+                assert edge.source is node
+                node = edge.dest
+            assert node in end_group
+            # Alternating, so applying it grows the matching by one edge
+            assert [edge in matching for edge in path] == [k % 2 == 1 for k in range(len(path))]
+
+
+def test_color_path_colors_by_status():
+    rng = random.Random('color-path')
+    sink = RecordingRenderSink()
+    graph = Graph(sink=sink)
+    for v in range(12):
+        graph.add_node(v, v * 50.0, 0.0)
+    for k, (u, v) in enumerate(random_graph(rng, 12, 0.4)):
+        graph.add_edge(u, v, 1000 + k)
+    edges = graph.edge_list
+    path, matching = set(rng.sample(edges, len(edges) // 2)), set(rng.sample(edges, len(edges) // 2))
+    GAlgorithm(graph).color_path(path, matching)
+    expected = {edge.id: ('yellow' if edge in matching else 'blue') if edge in path
+                else ('red' if edge in matching else 'black') for edge in edges}
+    assert {event[1]: event[2] for event in sink.events} == expected
+    assert len(sink.events) == len(edges)
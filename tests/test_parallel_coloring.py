@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from ParallelColoring import parallel_color
+from graphs import is_proper, random_graph, to_csr
+
+
+@pytest.mark.parametrize('workers', [1, 2, 3])
+def test_speculative_coloring_is_proper(workers):
+    rng = random.Random(f"parallel-{workers}")
+    for _ in range(3):
+        n = rng.randint(50, 200)
+        indptr, indices, _ = to_csr(n, random_graph(rng, n, rng.random() * 0.2))
+        # No sequential cut-off, so the conflicts of the parallel rounds are repaired by the rounds themselves
+        colors, report = parallel_color(indptr, indices, workers, sequential_below=0, compare=True)
+        assert is_proper(indptr, indices, colors.tolist())
+        max_degree = max(indptr[v + 1] - indptr[v] for v in range(n))
+        assert report['colors'] == colors.max() + 1 <= max_degree + 1
+        assert report['sequential_colors'] <= max_degree + 1
@@ -0,0 +1,137 @@
+import pytest
+
+import RenderQueue as render_queue_module
+from RenderQueue import RenderQueue
+
+
+class StubCanvas:
+    """
+    Keeps the options of the canvas items in dicts, and logs the calls a RenderQueue makes.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.configured = []  # The itemconfigure calls, as (item, options)
+        self.scheduled = []  # The after calls, as (ms, callback)
+        self.updates = 0
+        self.idle_updates = 0
+
+    def itemcget(self, item, option):
+        return self.items[item].get(option, '')
+
+    def itemconfigure(self, item, **options):
+        self.configured.append((item, options))
+        self.items[item].update(options)
+
+    def after(self, ms, callback):
+        self.scheduled.append((ms, callback))
+
+    def update(self):
+        self.updates += 1
+
+    def update_idletasks(self):
+        self.idle_updates += 1
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces the time seen by the RenderQueue module with a value the test sets.
+    """
+    now = [100.0]  # Times and frame intervals are multiples of powers of two, so the sums are exact
+    monkeypatch.setattr(render_queue_module.time, 'perf_counter', lambda: now[0])
+    return now
+
+
+def make_queue(frame_rate=8.0):
+    canvas = StubCanvas()
+    queue = RenderQueue(canvas, frame_rate)
+    for item in (1, 2):
+        canvas.items[item] = {'fill': 'white', 'outline': 'black'}
+        queue.created(item, **canvas.items[item])
+    return canvas, queue
+
+
+def test_repeated_changes_are_coalesced(clock):
+    canvas, queue = make_queue()
+    queue.configure(1, fill='red')
+    queue.configure(1, fill='blue', outline='green')
+    queue.configure(2, fill='yellow')
+    queue.configure(1, fill='orange')
+    # Nothing is drawn until the frame, and one frame is scheduled for all the changes
+    assert canvas.configured == [] and len(canvas.scheduled) == 1
+    queue.flush()
+    assert canvas.configured == [(1, {'fill': 'orange', 'outline': 'green'}), (2, {'fill': 'yellow'})]
+    assert canvas.idle_updates == 1
+    assert canvas.items[1] == {'fill': 'orange', 'outline': 'green'}
+    assert queue.pending == {} and queue.applied[1] == canvas.items[1]
+
+
+def test_get_returns_the_pending_value(clock):
+    canvas, queue = make_queue()
+    queue.configure(1, fill='red')
+    assert queue.get(1, 'fill') == 'red' and canvas.items[1]['fill'] == 'white'
+    assert queue.get(1, 'outline') == 'black'
+    # An option the queue never saw is read from the canvas
+    canvas.items[3] = {'fill': 'grey'}
+    assert queue.get(3, 'fill') == 'grey'
+    queue.flush()
+    assert queue.get(1, 'fill') == 'red'
+
+
+def test_changes_to_the_current_value_are_dropped(clock):
+    canvas, queue = make_queue()
+    queue.configure(1, fill='white')
+    assert queue.pending == {} and canvas.scheduled == []
+    # A change undone before the frame is not drawn at all
+    queue.configure(1, fill='red', outline='blue')
+    queue.configure(1, fill='white')
+    assert queue.pending == {1: {'outline': 'blue'}}
+    queue.configure(1, outline='black')
+    assert queue.pending == {}
+    queue.flush()
+    assert canvas.configured == []
+
+
+def test_scheduled_frames_respect_the_frame_rate(clock):
+    canvas, queue = make_queue(frame_rate=8.0)
+    queue.flush()
+    clock[0] += 0.03125
+    queue.configure(1, fill='red')
+    queue.configure(2, fill='red')
+    # The next frame is due 125 ms after the last one
+    [(ms, callback)] = canvas.scheduled
+    assert ms == 93
+    callback()
+    assert canvas.configured == [(1, {'fill': 'red'}), (2, {'fill': 'red'})]
+    # Changes made after the frame schedule a new one; a frame with nothing left to draw does nothing
+    queue.configure(1, fill='blue')
+    assert len(canvas.scheduled) == 2
+    queue.configure(1, fill='red')
+    canvas.scheduled[-1][1]()
+    assert len(canvas.configured) == 2
+
+
+def test_tick_flushes_only_when_a_frame_is_due(clock):
+    canvas, queue = make_queue(frame_rate=8.0)
+    queue.flush()
+    queue.configure(1, fill='red')
+    clock[0] += 0.0625
+    queue.tick()
+    assert canvas.configured == [] and canvas.updates == 0
+    clock[0] += 0.0625
+    queue.tick()
+    assert canvas.configured == [(1, {'fill': 'red'})] and canvas.updates == 1
+    queue.tick()  # Nothing is pending
+    assert canvas.updates == 1
+
+
+def test_forget_drops_the_pending_changes(clock):
+    canvas, queue = make_queue()
+    queue.configure(1, fill='red')
+    queue.configure(2, fill='red')
+    queue.forget(1)
+    del canvas.items[1]
+    queue.flush()
+    assert canvas.configured == [(2, {'fill': 'red'})]
+    assert 1 not in queue.applied
@@ -0,0 +1,240 @@
+import io
+import random
+import time
+
+import pytest
+
+from AlgorithmTrace import Trace, TraceRecorder
+from RenderQueue import RenderQueue
+from RenderSink import TkRenderSink
+from TracePlayer import TracePlayer
+
+
+class StubCanvas:
+    """
+    Keeps the options of the canvas items in dicts, and runs after() callbacks only when asked to.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.jobs = {}
+        self.next_job = 0
+
+    def itemcget(self, item, option):
+        return self.items[item].get(option, '')
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+
+    def after(self, ms, callback):
+        self.next_job += 1
+        self.jobs[self.next_job] = (ms, callback)
+        return self.next_job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_jobs(self):
+        """
+        Runs the scheduled callbacks, and the ones they schedule, until none are left.
+        Returns each callback with the delay (in ms) it was scheduled with.
+        """
+        runs = []
+        while self.jobs:
+            job = min(self.jobs)
+            ms, callback = self.jobs.pop(job)
+            runs.append((ms, callback))
+            callback()
+        return runs
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+
+class StubWindow:
+    """
+    The parts of GUIWindow.Window a TracePlayer uses.
+    """
+
+    def __init__(self, nodes, edges):
+        self.canvas = StubCanvas()
+        self.render_queue = RenderQueue(self.canvas)
+        self.messages = []
+        for item in nodes:
+            self.canvas.items[item] = {'fill': 'white', 'outline': 'black', 'width': 2}
+            self.render_queue.created(item, **self.canvas.items[item])
+        for item in edges:
+            self.canvas.items[item] = {'fill': 'black', 'arrow': 'none'}
+            self.render_queue.created(item, **self.canvas.items[item])
+
+    def after(self, ms, callback):
+        return self.canvas.after(ms, callback)
+
+    def after_cancel(self, job):
+        self.canvas.after_cancel(job)
+
+    def print_to_gui(self, message):
+        self.messages.append(message)
+
+    def clear_message_box(self):
+        self.messages = []
+
+    def trace_options(self, event):
+        kind = event[0]
+        if kind in ('color_edge', 'color_node'):
+            return event[1], {'fill': event[2]}
+        if kind == 'color_node_outline':
+            return event[1], {'outline': event[2], 'width': 2}
+        if kind == 'direct_edge':
+            return event[1], {'arrow': f"{event[2]}>{event[3]}"}
+        return None
+
+    def state(self):
+        self.render_queue.flush()
+        return {item: dict(options) for item, options in self.canvas.items.items()}, list(self.messages)
+
+
+NODES = [1, 2, 3, 4]
+EDGES = [10, 11, 12]
+
+
+def random_events(rng, count):
+    events = []
+    for _ in range(count):
+        kind = rng.choice(['color_edge', 'color_node', 'color_node_outline', 'direct_edge', 'print_message',
+                           'pause', 'pause'])
+        if kind == 'color_edge':
+            events.append((kind, rng.choice(EDGES), rng.choice(['red', 'blue', 'black'])))
+        elif kind in ('color_node', 'color_node_outline'):
+            events.append((kind, rng.choice(NODES), rng.choice(['red', 'green', 'white'])))
+        elif kind == 'direct_edge':
+            events.append((kind, rng.choice(EDGES)) + tuple(rng.sample(NODES, 2)))
+        elif kind == 'print_message':
+            events.append((kind, f"message {rng.randrange(100)}"))
+        else:
+            events.append((kind, rng.choice([0.0, 0.0, 0.5, 1.0])))
+    return events
+
+
+def test_steps_end_at_the_pauses():
+    events = [('color_node', 1, 'red'), ('pause', 0.5), ('pause', 0.0), ('color_edge', 10, 'blue'),
+              ('print_message', 'done')]
+    trace = Trace(events)
+    assert trace.step_count == 3
+    assert [trace.step(k) for k in range(3)] == [events[:2], events[2:3], events[3:]]
+    assert [trace.delay(k) for k in range(3)] == [0.5, 0.0, 0.0]
+    # A pause at the very end does not start an empty step
+    trace = Trace(events[:2])
+    assert trace.step_count == 1 and trace.delay(0) == 0.5
+    assert Trace([]).step_count == 1 and Trace([]).step(0) == [] and Trace([]).delay(0) == 0.0
+
+
+def test_recorder_records_pauses_without_waiting():
+    recorder = TraceRecorder()
+    recorder.color_node(1, 'red')
+    recorder.pause(1000.0)
+    recorder.print_message('hi')
+    assert recorder.events == [('color_node', 1, 'red'), ('pause', 1000.0), ('print_message', 'hi')]
+
+
+def test_save_and_load_round_trip():
+    rng = random.Random('trace-save')
+    graph = {'nodes': [[1, 10.0, 20.0], [2, 30.0, 40.5]], 'edges': [[10, 1, 2]]}
+    trace = Trace(random_events(rng, 50), graph, 'brooks "quoted"')
+    file = io.StringIO()
+    trace.save(file)
+    loaded = Trace.load(io.StringIO(file.getvalue()))
+    assert loaded.events == trace.events and loaded.starts == trace.starts
+    assert loaded.graph == graph and loaded.title == trace.title
+
+    file = io.StringIO(file.getvalue().replace('"version": 1', '"version": 99'))
+    with pytest.raises(ValueError):
+        Trace.load(file)
+
+
+def test_remap_renames_every_item():
+    rng = random.Random('trace-remap')
+    graph = {'nodes': [[v, 0.0, 0.0] for v in NODES], 'edges': [[10, 1, 2], [11, 2, 3], [12, 3, 4]]}
+    trace = Trace(random_events(rng, 80) + [('delete_item', 11)], graph, 'hungarian')
+    node_ids = {v: 100 + v for v in NODES}
+    edge_ids = {e: 200 + e for e in EDGES}
+    remapped = trace.remap(node_ids, edge_ids)
+    renamed = {**node_ids, **edge_ids}
+    for before, after in zip(trace.events, remapped.events):
+        if before[0] == 'direct_edge':
+            assert after == ('direct_edge', edge_ids[before[1]], node_ids[before[2]], node_ids[before[3]])
+        elif before[0] in ('pause', 'print_message'):
+            assert after == before
+        else:
+            assert after == (before[0], renamed[before[1]]) + before[2:]
+    assert remapped.starts == trace.starts and remapped.title == 'hungarian'
+    assert remapped.graph == {'nodes': [[100 + v, 0.0, 0.0] for v in NODES],
+                              'edges': [[210, 101, 102], [211, 102, 103], [212, 103, 104]]}
+
+
+def play_through(events, position):
+    """
+    The state of a fresh window after applying the events of the first position steps one by one.
+    """
+    window = StubWindow(NODES, EDGES)
+    trace = Trace(events)
+    for event in trace.events[:trace.starts[position]]:
+        if event[0] == 'print_message':
+            window.print_to_gui(event[1])
+        elif window.trace_options(event) is not None:
+            item, options = window.trace_options(event)
+            window.render_queue.configure(item, **options)
+    return window.state()
+
+
+def test_seek_matches_playing_the_steps():
+    rng = random.Random('trace-seek')
+    for _ in range(20):
+        events = random_events(rng, 60)
+        window = StubWindow(NODES, EDGES)
+        positions = []
+        player = TracePlayer(window, Trace(events), on_position=positions.append)
+        count = player.trace.step_count
+        # Forward, backward and out of range
+        for position in [count, 0, rng.randint(0, count), rng.randint(0, count), count + 5, -3]:
+            player.seek(position)
+            expected = max(0, min(position, count))
+            assert player.position == expected and positions[-1] == expected
+            assert window.state() == play_through(events, expected)
+
+
+def test_play_schedules_the_recorded_delays():
+    events = [('color_node', 1, 'red'), ('pause', 0.5), ('color_node', 2, 'red'), ('pause', 0.0),
+              ('color_node', 3, 'red'), ('pause', 1.0), ('color_node', 4, 'red')]
+    window = StubWindow(NODES, EDGES)
+    player = TracePlayer(window, Trace(events), speed=2.0)
+    player.play()
+    ticks = [ms for ms, callback in window.canvas.run_jobs() if callback == player._tick]
+    assert player.finished and not player.playing
+    # The steps without a delay after them are shown with the next one, in the same tick
+    assert ticks == [0, 250, 500]
+    assert window.state() == play_through(events, 4)
+
+    player.seek(1)
+    player.step()
+    assert player.position == 2 and window.state() == play_through(events, 2)
+    player.play()
+    player.pause()
+    assert all(callback != player._tick for _, callback in window.canvas.jobs.values())
+    player.finish()
+    assert player.finished and window.state() == play_through(events, 4)
+
+
+def test_tk_sink_draws_the_step_without_waiting(monkeypatch):
+    def sleep(seconds):
+        raise AssertionError('TkRenderSink waited on the event loop thread')
+
+    monkeypatch.setattr(time, 'sleep', sleep)
+    window = StubWindow(NODES, EDGES)
+    sink = TkRenderSink(window)
+    window.render_queue.configure(1, fill='red')
+    sink.pause(5.0)
+    assert window.render_queue.pending == {} and window.canvas.items[1]['fill'] == 'red'
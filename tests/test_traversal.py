@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from Traversal import bfs, bfs_csr, dfs, dfs_csr
+from graphs import random_graph, to_csr
+
+
+def distances(n, indptr, indices, sources, blocked):
+    """
+    The distance of every vertex from the sources without entering the blocked ones, by relaxing
+    every edge until nothing changes.
+    """
+    distance = [None] * n
+    for source in sources:
+        distance[source] = 0
+    changed = True
+    while changed:
+        changed = False
+        for v in range(n):
+            if distance[v] is None:
+                continue
+            for u in indices[indptr[v]:indptr[v + 1]]:
+                if not blocked[u] and (distance[u] is None or distance[u] > distance[v] + 1):
+                    distance[u] = distance[v] + 1
+                    changed = True
+    return distance
+
+
+def random_case(rng):
+    n = rng.randint(1, 30)
+    indptr, indices, _ = to_csr(n, random_graph(rng, n, rng.uniform(0.02, 0.3)))
+    sources = rng.sample(range(n), rng.randint(1, min(3, n)))
+    blocked = [int(v not in sources and rng.random() < 0.15) for v in range(n)]
+    return n, indptr, indices, sources, blocked
+
+
+def as_objects(indptr, indices, blocked):
+    """
+    The arguments of bfs and dfs for the same graph, with the vertex indices as vertices.
+    """
+    return (lambda v: indices[indptr[v]:indptr[v + 1]]), (lambda v: not blocked[v])
+
+
+def check_tree(indptr, indices, visited, parent_of, level_of, root_parent):
+    """
+    Checks that every visited vertex is a root at level 0, or one level below its parent, which is a neighbor.
+    The parent of a root is itself with bfs_csr and dfs_csr, and None with bfs and dfs.
+    """
+    for v in visited:
+        p = parent_of(v)
+        if p == root_parent(v):
+            assert level_of(v) == 0
+        else:
+            assert p in indices[indptr[v]:indptr[v + 1]] and level_of(v) == level_of(p) + 1
+
+
+def test_bfs_levels_are_distances():
+    rng = random.Random('traversal-bfs')
+    for _ in range(200):
+        n, indptr, indices, sources, blocked = random_case(rng)
+        expected = distances(n, indptr, indices, sources, blocked)
+        reached = {v for v in range(n) if expected[v] is not None}
+
+        parent, level = [-1] * n, [-1] * n
+        order = list(bfs_csr(indptr, indices, sources, parent, level, blocked))
+        assert set(order) == reached and len(order) == len(reached)
+        assert [level[v] for v in order] == sorted(level[v] for v in order)
+        assert all(level[v] == expected[v] for v in order)
+        assert all(parent[v] == v for v in sources)
+        check_tree(indptr, indices, order, parent.__getitem__, level.__getitem__, lambda v: v)
+
+        neighbors, allow = as_objects(indptr, indices, blocked)
+        parent, level = {}, {}
+        assert list(bfs(sources, neighbors, parent, level, allow)) == order
+        assert all(parent[v] is None for v in sources)
+        check_tree(indptr, indices, order, parent.__getitem__, level.__getitem__, lambda v: None)
+
+
+def test_dfs_preorder():
+    rng = random.Random('traversal-dfs')
+    for _ in range(200):
+        n, indptr, indices, sources, blocked = random_case(rng)
+        expected = distances(n, indptr, indices, sources, blocked)
+        reached = {v for v in range(n) if expected[v] is not None}
+
+        parent, level = [-1] * n, [-1] * n
+        order = list(dfs_csr(indptr, indices, sources, parent, level, blocked))
+        assert set(order) == reached and len(order) == len(reached)
+        check_tree(indptr, indices, order, parent.__getitem__, level.__getitem__, lambda v: v)
+        # In preorder the parent of each vertex is on the path from the root to the vertex just before it
+        path = []
+        for v in order:
+            if parent[v] == v:
+                path = [v]
+                continue
+            while path[-1] != parent[v]:
+                path.pop()
+            path.append(v)
+            assert level[v] == len(path) - 1
+
+        neighbors, allow = as_objects(indptr, indices, blocked)
+        parent, level = {}, {}
+        assert list(dfs(sources, neighbors, parent, level, allow)) == order
+        check_tree(indptr, indices, order, parent.__getitem__, level.__getitem__, lambda v: None)
+
+
+@pytest.mark.parametrize('traversal', [bfs_csr, dfs_csr])
+def test_early_exit_and_resume(traversal):
+    # Leaving the loop keeps the maps of the vertices visited so far, and they count as visited afterwards
+    n = 50
+    indptr, indices, _ = to_csr(n, [(v, v + 1) for v in range(n - 1)])
+    parent = [-1] * n
+    for v in traversal(indptr, indices, [0], parent):
+        if v == 10:
+            break
+    assert parent[:11] == [0] + list(range(10)) and parent[12:] == [-1] * (n - 12)
+    assert sorted(traversal(indptr, indices, [0, 20], parent)) == list(range(11, n))